@@ -1,5 +1,14 @@
 """Top-level package for the AuthService application."""
 
-from .main import create_app
+from typing import Any
 
-__all__ = ["create_app"]
\ No newline at end of file
+__all__ = ["create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so that importing any ``app.*`` module does not build the whole application.
+    if name == "create_app":
+        from .main import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter
 
-from .routes import v1_router
+from .routes import metrics_router, v1_router, well_known_router
 
 api_router = APIRouter()
 api_router.include_router(v1_router)
+api_router.include_router(well_known_router)
 
-__all__ = ["api_router"]
\ No newline at end of file
+__all__ = ["api_router", "metrics_router"]
@@ -3,7 +3,10 @@
 from .permission import (
     get_auth_service,
     get_current_user,
+    get_login_throttle,
     get_permission_service,
+    get_session_store,
+    get_user_import_service,
     get_user_service,
     require_role_level,
 )
@@ -11,7 +14,10 @@ from .permission import (
 __all__ = [
     "get_auth_service",
     "get_current_user",
+    "get_login_throttle",
     "get_permission_service",
+    "get_session_store",
+    "get_user_import_service",
     "get_user_service",
     "require_role_level",
 ]
\ No newline at end of file
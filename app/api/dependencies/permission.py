@@ -1,44 +1,91 @@
 """Reusable FastAPI dependencies for permission checks."""
 
-from collections.abc import Callable
-from typing import Annotated
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import contextmanager_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 
-from app.db.repositories import RoleRepository, UserRepository
-from app.db.session import get_session
-from app.domain import AuthService, PermissionService, UserEntity, UserService
+from app.core.config import get_settings
+from app.core.rate_limit import LoginThrottle
+from app.db.repositories import (
+    AsyncRefreshTokenRepository,
+    AsyncRoleRepository,
+    AsyncTokenRevocationRepository,
+    AsyncUserRepository,
+    RefreshTokenRepository,
+    RoleRepository,
+    ThreadedRepository,
+    TokenRevocationRepository,
+    UserRepository,
+)
+from app.db.session import async_session_scope, session_scope
+from app.domain import AuthService, PermissionService, UserEntity, UserImportService, UserService
+
+if TYPE_CHECKING:
+    from app.web.sessions import SessionStore
 
 OAuth2Token = Annotated[str, Depends(OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login"))]
 
 
-def get_user_service(session=Depends(get_session)) -> UserService:
-    repo = UserRepository(session)
-    role_repo = RoleRepository(session)
-    return UserService(repo, role_repo)
+async def get_user_service() -> AsyncIterator[UserService]:
+    """Yield a user service on the async engine, or on the sync engine via the threadpool."""
+
+    if get_settings().database_async:
+        async with async_session_scope() as session:
+            yield UserService(AsyncUserRepository(session), AsyncRoleRepository(session))
+        return
+    async with contextmanager_in_threadpool(session_scope()) as session:
+        yield UserService(
+            ThreadedRepository(UserRepository(session)),  # type: ignore[arg-type]
+            ThreadedRepository(RoleRepository(session)),  # type: ignore[arg-type]
+        )
+
+
+async def get_auth_service(user_service: UserService = Depends(get_user_service)) -> AuthService:
+    session = user_service.user_repo.session  # share the request's session and transaction
+    if get_settings().database_async:
+        return AuthService(user_service, AsyncRefreshTokenRepository(session), AsyncTokenRevocationRepository(session))
+    return AuthService(
+        user_service,
+        ThreadedRepository(RefreshTokenRepository(session)),  # type: ignore[arg-type]
+        ThreadedRepository(TokenRevocationRepository(session)),  # type: ignore[arg-type]
+    )
+
+
+async def get_user_import_service(user_service: UserService = Depends(get_user_service)) -> UserImportService:
+    return UserImportService(user_service.user_repo, user_service.role_repo)
+
+
+async def get_login_throttle(request: Request) -> LoginThrottle:
+    return request.app.state.login_throttle
+
 
+async def get_session_store(request: Request) -> "SessionStore | None":
+    """The application's SSR session store, or ``None`` when SSR pages use JWT cookies."""
 
-def get_auth_service(user_service: UserService = Depends(get_user_service)) -> AuthService:
-    return AuthService(user_service)
+    return request.app.state.session_store
 
 
-def get_permission_service() -> PermissionService:
+async def get_permission_service() -> PermissionService:
     return PermissionService()
 
 
-def get_current_user(
+async def get_current_user(
     token: OAuth2Token,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> UserEntity:
     try:
-        return auth_service.verify_token(token)
+        if get_settings().stateless_auth:
+            return await auth_service.principal_from_token(token)
+        return await auth_service.verify_token(token)
     except ValueError as exc:  # pragma: no cover - tested via API
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
 
 
-def require_role_level(level: int) -> Callable[[UserEntity], UserEntity]:
-    def dependency(
+def require_role_level(level: int) -> Callable[..., Awaitable[UserEntity]]:
+    async def dependency(
         user: UserEntity = Depends(get_current_user),
         permission_service: PermissionService = Depends(get_permission_service),
     ) -> UserEntity:
@@ -48,4 +95,4 @@ def require_role_level(level: int) -> Callable[[UserEntity], UserEntity]:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
         return user
 
-    return dependency
\ No newline at end of file
+    return dependency
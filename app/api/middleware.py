@@ -0,0 +1,73 @@
+"""ASGI middleware shared by the API and SSR routes."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import REQUEST_DURATION, REQUESTS_IN_FLIGHT
+from app.db.query_stats import QueryStats, stop_tracking, track_queries
+
+
+class MetricsMiddleware:
+    """Records request latency per route template and the number of in-flight requests.
+
+    Written as plain ASGI rather than ``BaseHTTPMiddleware`` so streaming responses are
+    timed to their last chunk and no extra task is spawned per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", None) or ("static" if scope["path"].startswith("/static") else "unmatched")
+            REQUEST_DURATION.observe(time.perf_counter() - started, scope["method"], template, str(status_code))
+
+
+class QueryStatsMiddleware:
+    """Counts the SQL statements each request issues and reports them in ``Server-Timing``.
+
+    The header is written when the response starts, so statements run while a streaming
+    body is being produced are counted (and slow-logged) but not reported.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        token = track_queries(stats)
+        try:
+            await self.app(scope, receive, send_with_timing if self.server_timing else send)
+        finally:
+            stop_tracking(token)
@@ -2,10 +2,12 @@
 
 from fastapi import APIRouter
 
+from .metrics import router as metrics_router
 from .v1.auth import router as auth_router
 from .v1.health import router as health_router
 from .v1.roles import router as roles_router
 from .v1.users import router as users_router
+from .well_known import router as well_known_router
 
 v1_router = APIRouter(prefix="/api/v1")
 v1_router.include_router(health_router)
@@ -13,4 +15,4 @@ v1_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 v1_router.include_router(users_router, prefix="/users", tags=["users"])
 v1_router.include_router(roles_router, prefix="/roles", tags=["roles"])
 
-__all__ = ["v1_router"]
\ No newline at end of file
+__all__ = ["metrics_router", "v1_router", "well_known_router"]
\ No newline at end of file
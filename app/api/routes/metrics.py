@@ -0,0 +1,14 @@
+"""Prometheus scrape endpoint."""
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render
+
+router = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(render(), media_type=CONTENT_TYPE)
@@ -2,16 +2,41 @@
 
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.dependencies.permission import get_auth_service, get_current_user
+from app.api.dependencies.permission import (
+    OAuth2Token,
+    get_auth_service,
+    get_current_user,
+    get_login_throttle,
+    get_session_store,
+    require_role_level,
+)
 from app.core.config import get_settings
+from app.core.rate_limit import LoginThrottle
 from app.domain import AuthService, UserEntity
-from app.schemas import LoginRequest, RegisterRequest, Token, UserRead
+from app.schemas import (
+    IntrospectionRequest,
+    IntrospectionResponse,
+    LoginRequest,
+    RefreshRequest,
+    RegisterRequest,
+    Token,
+    TokenIntrospection,
+    UserRead,
+)
+from app.web.sessions import SessionStore
 
 router = APIRouter()
 
 
+def _issue(response: Response, token: str, refresh_token: str) -> Token:
+    expires_minutes = get_settings().access_token_expire_minutes
+    expires_at = datetime.utcnow() + timedelta(minutes=expires_minutes)
+    response.set_cookie("access_token", token, httponly=True, max_age=int(expires_minutes * 60))
+    return Token(access_token=token, expires_at=expires_at, refresh_token=refresh_token)
+
+
 def _to_user_read(user: UserEntity) -> UserRead:
     return UserRead(
         id=user.id or 0,
@@ -24,27 +49,116 @@ def _to_user_read(user: UserEntity) -> UserRead:
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED, summary="Register a new account")
-def register_user(payload: RegisterRequest, auth_service: AuthService = Depends(get_auth_service)) -> UserRead:
+async def register_user(payload: RegisterRequest, auth_service: AuthService = Depends(get_auth_service)) -> UserRead:
     try:
-        user = auth_service.register(email=payload.email, password=payload.password, full_name=payload.full_name)
+        user = await auth_service.register(email=payload.email, password=payload.password, full_name=payload.full_name)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return _to_user_read(user)
 
 
-@router.post("/login", response_model=Token, summary="Exchange credentials for an access token")
-def login(payload: LoginRequest, response: Response, auth_service: AuthService = Depends(get_auth_service)) -> Token:
+@router.post(
+    "/login",
+    response_model=Token,
+    summary="Exchange credentials for an access token",
+    responses={status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Too many attempts; see Retry-After"}},
+)
+async def login(
+    payload: LoginRequest,
+    request: Request,
+    response: Response,
+    auth_service: AuthService = Depends(get_auth_service),
+    throttle: LoginThrottle = Depends(get_login_throttle),
+) -> Token:
+    await throttle.check(request.client.host if request.client else None, payload.email)
     try:
-        _, token = auth_service.authenticate(email=payload.email, password=payload.password)
+        user, token = await auth_service.authenticate(email=payload.email, password=payload.password)
     except ValueError as exc:
+        await throttle.record_failure(payload.email)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
-    settings = get_settings()
-    expires_minutes = settings.access_token_expire_minutes
-    expires_at = datetime.utcnow() + timedelta(minutes=expires_minutes)
-    response.set_cookie("access_token", token, httponly=True, max_age=int(expires_minutes * 60))
-    return Token(access_token=token, expires_at=expires_at)
+    return _issue(response, token, await auth_service.issue_refresh_token(user))
+
+
+@router.post("/refresh", response_model=Token, summary="Exchange a refresh token for new access and refresh tokens")
+async def refresh(
+    payload: RefreshRequest, response: Response, auth_service: AuthService = Depends(get_auth_service)
+) -> Token:
+    try:
+        _, token, refresh_token = await auth_service.refresh(payload.refresh_token)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+    return _issue(response, token, refresh_token)
+
+
+@router.post(
+    "/revoke", status_code=status.HTTP_204_NO_CONTENT, summary="Revoke a refresh token and every token rotated from it"
+)
+async def revoke(payload: RefreshRequest, auth_service: AuthService = Depends(get_auth_service)) -> Response:
+    await auth_service.revoke_refresh_token(payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, summary="Revoke the presented access token")
+async def logout(
+    token: OAuth2Token,
+    _: UserEntity = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> Response:
+    await auth_service.revoke_access_token(token)
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    response.delete_cookie("access_token")
+    return response
+
+
+@router.post(
+    "/logout-all",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revoke every access and refresh token issued to the current user",
+)
+async def logout_everywhere(
+    current_user: UserEntity = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service),
+    sessions: SessionStore | None = Depends(get_session_store),
+) -> Response:
+    await auth_service.logout_everywhere(current_user.id or 0)
+    if sessions is not None:
+        await sessions.invalidate_user(current_user.id or 0)
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    response.delete_cookie("access_token")
+    return response
 
 
 @router.get("/me", response_model=UserRead, summary="Return the current user profile")
-def read_me(current_user: UserEntity = Depends(get_current_user)) -> UserRead:
-    return _to_user_read(current_user)
\ No newline at end of file
+async def read_me(current_user: UserEntity = Depends(get_current_user)) -> UserRead:
+    return _to_user_read(current_user)
+
+
+@router.post(
+    "/introspect",
+    response_model=IntrospectionResponse,
+    response_model_exclude_none=True,
+    summary="Introspect a batch of access tokens (RFC 7662 style)",
+)
+async def introspect_tokens(
+    payload: IntrospectionRequest,
+    _: UserEntity = Depends(require_role_level(5)),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> IntrospectionResponse:
+    results = []
+    for resolved in await auth_service.introspect(payload.tokens):
+        if resolved is None:
+            results.append(TokenIntrospection(active=False))
+            continue
+        claims, user = resolved
+        results.append(
+            TokenIntrospection(
+                active=True,
+                sub=claims["sub"],
+                username=str(user.email),
+                token_type="Bearer",
+                exp=claims.get("exp"),
+                iat=claims.get("iat"),
+                role_levels=user.role_levels,
+            )
+        )
+    return IntrospectionResponse(results=results)
@@ -6,5 +6,5 @@ router = APIRouter(tags=["health"])
 
 
 @router.get("/health", summary="Health probe")
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     return {"status": "ok"}
\ No newline at end of file
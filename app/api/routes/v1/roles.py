@@ -12,8 +12,8 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[RoleRead], summary="List available roles")
-def list_roles(
+async def list_roles(
     _: UserEntity = Depends(require_role_level(2)),
     user_service: UserService = Depends(get_user_service),
 ) -> List[RoleRead]:
-    return [RoleRead(id=role.id, name=role.name, level=role.level) for role in user_service.list_roles()]
\ No newline at end of file
+    return [RoleRead(id=role.id, name=role.name, level=role.level) for role in await user_service.list_roles()]
\ No newline at end of file
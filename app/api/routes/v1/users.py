@@ -1,15 +1,25 @@
 """User management routes."""
 
-from typing import List
+from dataclasses import asdict
+from typing import AsyncIterator, Iterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
 
-from app.api.dependencies.permission import get_user_service, require_role_level
-from app.domain import UserEntity, UserService
-from app.schemas import UserRead
+from app.api.dependencies.permission import get_user_import_service, get_user_service, require_role_level
+from app.core.config import get_settings
+from app.db.repositories import AsyncUserRepository, UserRepository, UserSummary
+from app.db.session import async_session_scope, session_scope
+from app.domain import UserEntity, UserImportService, UserService
+from app.domain.services import parse_import_rows
+from app.schemas import BulkRoleChange, BulkRoleChangeResult, UserImportReport, UserImportResult, UserRead
 
 router = APIRouter()
 
+STREAM_CHUNK_SIZE = 1000
+IMPORT_FORMATS = {"text/csv": "csv", "application/x-ndjson": "ndjson"}
+
 
 def _to_schema(user: UserEntity) -> UserRead:
     return UserRead(
@@ -22,21 +32,115 @@ def _to_schema(user: UserEntity) -> UserRead:
     )
 
 
-@router.get("/", response_model=List[UserRead], summary="List all users")
-def list_users(
+def _summary_line(summary: UserSummary) -> bytes:
+    user = UserRead(
+        id=summary.id,
+        email=summary.email,
+        full_name=summary.full_name,
+        is_active=summary.is_active,
+        created_at=summary.created_at,
+        role_levels=list(summary.role_levels),
+    )
+    return user.json().encode() + b"\n"
+
+
+def _sync_user_lines() -> Iterator[bytes]:
+    with session_scope() as session:
+        for summary in UserRepository(session).stream_summaries(STREAM_CHUNK_SIZE):
+            yield _summary_line(summary)
+
+
+async def _user_lines() -> AsyncIterator[bytes]:
+    """NDJSON lines for every user; owns its session because it outlives the request scope."""
+
+    if not get_settings().database_async:
+        async for line in iterate_in_threadpool(_sync_user_lines()):
+            yield line
+        return
+    async with async_session_scope() as session:
+        async for summary in AsyncUserRepository(session).stream_summaries(STREAM_CHUNK_SIZE):
+            yield _summary_line(summary)
+
+
+@router.get("/", response_model=List[UserRead], summary="List users by keyset page or as an NDJSON stream")
+async def list_users(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum users per page"),
+    after: int | None = Query(None, ge=0, description="Return users whose id is greater than this cursor"),
+    stream: bool = Query(False, description="Stream every user as NDJSON instead of returning a page"),
     _: UserEntity = Depends(require_role_level(4)),
     user_service: UserService = Depends(get_user_service),
-) -> List[UserRead]:
-    return [_to_schema(user) for user in user_service.list_users()]
+) -> List[UserRead] | StreamingResponse:
+    if stream:
+        return StreamingResponse(_user_lines(), media_type="application/x-ndjson")
+    users = await user_service.list_users(after=after, limit=limit)
+    if len(users) == limit:
+        next_page = request.url.include_query_params(after=users[-1].id, limit=limit)
+        response.headers["Link"] = f'<{next_page}>; rel="next"'
+    return [_to_schema(user) for user in users]
+
+
+@router.post("/import", response_model=UserImportReport, summary="Bulk-create users from CSV or NDJSON")
+async def import_users(
+    request: Request,
+    _: UserEntity = Depends(require_role_level(5)),
+    import_service: UserImportService = Depends(get_user_import_service),
+) -> UserImportReport:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = IMPORT_FORMATS.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send the import as text/csv or application/x-ndjson",
+        )
+    try:
+        data = (await request.body()).decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Import must be UTF-8") from exc
+    results = await import_service.import_users(parse_import_rows(data, fmt))
+    created = sum(result.status == "created" for result in results)
+    return UserImportReport(
+        created=created,
+        failed=len(results) - created,
+        results=[UserImportResult(**asdict(result)) for result in results],
+    )
+
+
+async def _change_roles(user_service: UserService, change: BulkRoleChange, granted: bool) -> BulkRoleChangeResult:
+    apply = user_service.assign_role_bulk if granted else user_service.revoke_role_bulk
+    try:
+        changed = await apply(change.level, user_ids=change.user_ids, has_level=change.has_level)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return BulkRoleChangeResult(level=change.level, granted=granted, changed=changed)
+
+
+@router.post("/roles/grant", response_model=BulkRoleChangeResult, summary="Grant a role to many users at once")
+async def grant_role_bulk(
+    change: BulkRoleChange,
+    _: UserEntity = Depends(require_role_level(5)),
+    user_service: UserService = Depends(get_user_service),
+) -> BulkRoleChangeResult:
+    return await _change_roles(user_service, change, granted=True)
+
+
+@router.post("/roles/revoke", response_model=BulkRoleChangeResult, summary="Revoke a role from many users at once")
+async def revoke_role_bulk(
+    change: BulkRoleChange,
+    _: UserEntity = Depends(require_role_level(5)),
+    user_service: UserService = Depends(get_user_service),
+) -> BulkRoleChangeResult:
+    return await _change_roles(user_service, change, granted=False)
 
 
 @router.get("/{user_id}", response_model=UserRead, summary="Retrieve a user by id")
-def get_user(
+async def get_user(
     user_id: int,
     _: UserEntity = Depends(require_role_level(3)),
     user_service: UserService = Depends(get_user_service),
 ) -> UserRead:
-    user = user_service.get_user(user_id)
+    user = await user_service.get_user(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return _to_schema(user)
\ No newline at end of file
+    return _to_schema(user)
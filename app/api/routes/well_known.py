@@ -0,0 +1,20 @@
+"""Well-known discovery endpoints."""
+
+from fastapi import APIRouter, Request, Response, status
+
+from app.core.config import get_settings
+from app.core.keys import get_key_ring
+
+router = APIRouter(tags=["well-known"])
+
+
+@router.get("/.well-known/jwks.json", summary="Public keys for verifying access tokens")
+async def jwks(request: Request) -> Response:
+    body, etag = get_key_ring().jwks_document
+    headers = {
+        "Cache-Control": f"public, max-age={get_settings().jwks_max_age_seconds}",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
@@ -1,5 +1,6 @@
 """Application configuration settings."""
 
+import os
 from functools import lru_cache
 from typing import List
 
@@ -13,8 +14,98 @@ class Settings(BaseSettings):
     environment: str = Field("local", description="Deployment environment name")
     secret_key: str = Field(..., description="JWT signing secret")
     access_token_expire_minutes: int = Field(30, ge=1, description="Default JWT expiry in minutes")
-    algorithm: str = Field("HS256", description="JWT signing algorithm")
+    algorithm: str = Field("HS256", description="JWT signing algorithm, e.g. HS256 or ES256")
+    refresh_token_expire_days: int = Field(
+        14, ge=1, description="Lifetime of a refresh token; each use issues a successor with a fresh lifetime"
+    )
+    token_revocation_refresh_seconds: float = Field(
+        60.0, gt=0, description="How often each worker reloads revoked tokens; bounds cross-worker revocation delay"
+    )
+    token_revocation_false_positive_rate: float = Field(
+        0.01, gt=0, lt=1, description="Bloom filter false positives, each of which costs one revocation lookup"
+    )
+    web_session_backend: str | None = Field(
+        None,
+        regex="^(memory|database)$",
+        description="Sign SSR pages in with a server-side session (memory or database) instead of JWT cookies",
+    )
+    web_session_ttl_seconds: int = Field(1800, ge=60, description="Idle time after which an SSR session expires")
+    web_session_max_entries: int = Field(100_000, ge=1, description="Sessions kept by the in-memory session store")
+    template_cache_dir: str | None = Field(
+        None, description="Directory for compiled Jinja templates, kept across restarts; a temp directory when unset"
+    )
+    jwt_keys_dir: str | None = Field(None, description="Directory of <kid>.pem keys for asymmetric algorithms")
+    jwt_active_kid: str | None = Field(None, description="Key id used for signing; defaults to the newest key")
+    jwks_max_age_seconds: int = Field(3600, ge=0, description="Cache-Control max-age of the JWKS document")
+    # Stateless mode rejects tokens issued before a user's latest role change or
+    # deactivation. The change writes a revocation entry for the user, so the worker that
+    # handled it rejects older tokens at once and the others within
+    # token_revocation_refresh_seconds.
+    stateless_auth: bool = Field(
+        False, description="Authorize API requests from verified JWT claims without loading the user"
+    )
     database_url: str = Field("sqlite:///./auth.db", description="Database connection URL")
+    migrate_on_startup: bool = Field(
+        True, description="Upgrade the schema at boot when behind head; disable when migrations run out of band"
+    )
+    database_async: bool = Field(True, description="Serve API requests through the async engine")
+    async_database_url: str | None = Field(
+        None, description="Async driver URL; derived from database_url when unset"
+    )
+    db_pool_size: int = Field(5, ge=1, description="Connections kept open per engine (and per worker)")
+    db_max_overflow: int = Field(10, ge=0, description="Extra connections allowed above db_pool_size under load")
+    db_pool_timeout_seconds: float = Field(30.0, gt=0, description="Wait for a free pooled connection before failing")
+    db_pool_recycle_seconds: int = Field(
+        1800, ge=-1, description="Reopen connections older than this (below MySQL wait_timeout); -1 disables"
+    )
+    db_pool_pre_ping: bool = Field(True, description="Check connections on checkout so dropped ones are replaced")
+    sqlite_journal_mode: str = Field(
+        "WAL",
+        regex=r"(?i)^(DELETE|TRUNCATE|PERSIST|MEMORY|WAL|OFF)$",
+        description="PRAGMA journal_mode; WAL lets readers run during writes",
+    )
+    sqlite_synchronous: str = Field(
+        "NORMAL",
+        regex=r"(?i)^(OFF|NORMAL|FULL|EXTRA)$",
+        description="PRAGMA synchronous; NORMAL is durable enough under WAL",
+    )
+    sqlite_busy_timeout_ms: int = Field(5000, ge=0, description="PRAGMA busy_timeout: wait on locks instead of failing")
+    sqlite_mmap_size: int = Field(256 * 1024 * 1024, ge=0, description="PRAGMA mmap_size in bytes; 0 disables")
+    password_hash_scheme: str = Field(
+        "bcrypt", regex=r"^(bcrypt|argon2)$", description="Scheme for new hashes; argon2 means argon2id"
+    )
+    bcrypt_rounds: int = Field(
+        12, ge=4, le=31, description="bcrypt cost factor; pick it with scripts/calibrate_password_hash.py"
+    )
+    argon2_time_cost: int = Field(3, ge=1, description="argon2id iterations")
+    argon2_memory_cost_kib: int = Field(65536, ge=8, description="argon2id memory per hash, in KiB")
+    argon2_parallelism: int = Field(4, ge=1, description="argon2id lanes")
+    password_hash_workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        ge=0,
+        description="Processes dedicated to password hashing; 0 uses a thread executor",
+    )
+    password_hash_queue_size: int = Field(
+        32, ge=0, description="Hashing jobs allowed to wait for a worker before returning 503"
+    )
+    login_ip_limit: int = Field(20, ge=0, description="Login attempts allowed per client IP per window; 0 disables")
+    login_ip_window_seconds: float = Field(60.0, gt=0, description="Window over which login_ip_limit refills")
+    login_email_failure_limit: int = Field(
+        5, ge=0, description="Failed logins allowed per account per window before 429; 0 disables"
+    )
+    login_email_window_seconds: float = Field(
+        300.0, gt=0, description="Window over which login_email_failure_limit refills"
+    )
+    rate_limit_backend_url: str | None = Field(
+        None, description="redis:// URL shared by all workers; in-process buckets when unset"
+    )
+    rate_limit_max_keys: int = Field(100_000, ge=1, description="Buckets kept by the in-process backend")
+    token_cache_size: int = Field(10_000, ge=0, description="Decoded tokens cached per process; 0 disables")
+    principal_cache_size: int = Field(10_000, ge=0, description="Cached principals per process; 0 disables")
+    principal_cache_ttl_seconds: float = Field(30.0, ge=0, description="Lifetime of a cached principal")
+    slow_query_ms: float = Field(200.0, ge=0, description="Log statements slower than this, with their route; 0 disables")
+    server_timing: bool = Field(True, description="Report per-request SQL count and time in a Server-Timing header")
+    metrics_enabled: bool = Field(True, description="Record request/stage timings and serve them at /metrics")
     allowed_hosts: List[str] = Field(default_factory=lambda: ["*"])
     superuser_email: str = Field("admin@example.com", description="Initial administrator email")
     superuser_password: str = Field("ChangeMe123!", description="Initial administrator password")
@@ -26,9 +117,9 @@ class Settings(BaseSettings):
 
     @validator("database_url")
     def validate_database_url(cls, value: str) -> str:  # noqa: D401
-        """Ensure SQLite URLs include a relative path prefix."""
+        """Ensure file-based SQLite URLs include a path after ``sqlite:///``."""
 
-        if value.startswith("sqlite") and ":" not in value.split("///", maxsplit=1)[-1]:
+        if value.startswith("sqlite") and "///" in value and not value.split("///", maxsplit=1)[1]:
             raise ValueError("SQLite URL must include a file path, e.g. sqlite:///./auth.db")
         return value
 
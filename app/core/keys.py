@@ -0,0 +1,129 @@
+"""JWT signing key ring with ``kid``-based selection and JWKS publication."""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
+
+from app.core.config import Settings, get_settings
+from app.core.metrics import STAGE_DURATION
+
+if TYPE_CHECKING:  # python-jose is imported on first use to keep worker start-up cheap
+    from jose.backends.base import Key
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """A parsed JWT key; ``can_sign`` is False for retired, public-only keys."""
+
+    kid: str | None
+    algorithm: str
+    key: "Key"
+    can_sign: bool
+
+    @cached_property
+    def verify_key(self) -> "Key":
+        from jose.constants import ALGORITHMS
+
+        if self.algorithm in ALGORITHMS.HMAC or not self.can_sign:
+            return self.key
+        return self.key.public_key()
+
+    def public_jwk(self) -> Dict[str, Any]:
+        return {**self.verify_key.to_dict(), "kid": self.kid, "use": "sig"}
+
+
+class KeyRing:
+    """Keys used to sign and verify access tokens, parsed once per configuration.
+
+    HMAC algorithms use ``secret_key`` as a single unnamed key that is never published.
+    Asymmetric algorithms load every ``<kid>.pem`` file from ``jwt_keys_dir``: private
+    keys may sign, public keys only verify, so a rotated-out key can keep validating
+    live tokens until they expire. ``jwt_active_kid`` selects the signing key and
+    defaults to the last signing-capable kid in sorted order.
+    """
+
+    def __init__(self, keys: Dict[str | None, SigningKey], active_kid: str | None) -> None:
+        if active_kid not in keys or not keys[active_kid].can_sign:
+            raise ValueError(f"Active signing key {active_kid!r} is not a private key in the key ring")
+        self.keys = keys
+        self.active = keys[active_kid]
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "KeyRing":
+        from jose import jwk
+        from jose.constants import ALGORITHMS
+
+        algorithm = settings.algorithm
+        if algorithm in ALGORITHMS.HMAC:
+            key = SigningKey(None, algorithm, jwk.construct(settings.secret_key, algorithm), can_sign=True)
+            return cls({None: key}, None)
+        if not settings.jwt_keys_dir:
+            raise ValueError(f"JWT_KEYS_DIR is required for {algorithm}")
+        keys: Dict[str | None, SigningKey] = {}
+        for path in sorted(Path(settings.jwt_keys_dir).glob("*.pem")):
+            pem = path.read_bytes()
+            keys[path.stem] = SigningKey(
+                path.stem, algorithm, jwk.construct(pem, algorithm), can_sign=b"PRIVATE KEY" in pem
+            )
+        signing_kids = [kid for kid, key in keys.items() if key.can_sign]
+        active_kid = settings.jwt_active_kid or (signing_kids[-1] if signing_kids else None)
+        return cls(keys, active_kid)
+
+    def sign(self, claims: Dict[str, Any]) -> str:
+        from jose import jwt
+
+        headers = {"kid": self.active.kid} if self.active.kid else None
+        with STAGE_DURATION.time("create_access_token"):
+            return jwt.encode(claims, self.active.key, algorithm=self.active.algorithm, headers=headers)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Verify ``token`` against the key named by its ``kid`` header."""
+
+        from jose import JWTError, jwt
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError as exc:
+            raise ValueError("Invalid token") from exc
+        key = self.keys.get(kid)
+        if key is None:
+            raise ValueError("Unknown signing key")
+        try:
+            return jwt.decode(token, key.verify_key, algorithms=[key.algorithm])
+        except JWTError as exc:
+            raise ValueError("Invalid token") from exc
+
+    def jwks(self) -> Dict[str, Any]:
+        """Return the public JSON Web Key Set; empty for shared-secret algorithms."""
+
+        return {"keys": [key.public_jwk() for key in self.keys.values() if key.kid is not None]}
+
+    @cached_property
+    def jwks_document(self) -> tuple[bytes, str]:
+        """Serialized JWKS and its strong ETag, computed once per key ring."""
+
+        body = json.dumps(self.jwks(), separators=(",", ":"), sort_keys=True).encode()
+        return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+_ring: KeyRing | None = None
+_ring_config: tuple | None = None
+_lock = threading.Lock()
+
+
+def get_key_ring() -> KeyRing:
+    """Return the key ring for the current settings, rebuilding it when they change."""
+
+    global _ring, _ring_config
+    settings = get_settings()
+    config = (settings.algorithm, settings.secret_key, settings.jwt_keys_dir, settings.jwt_active_kid)
+    if _ring is None or _ring_config != config:
+        with _lock:
+            if _ring is None or _ring_config != config:
+                _ring = KeyRing.from_settings(settings)
+                _ring_config = config
+    return _ring
@@ -0,0 +1,228 @@
+"""Dependency-free metrics in the Prometheus text exposition format.
+
+Histograms keep one shard of counters per thread. Only the owning thread writes to
+a shard, so observing a value takes no lock; shards are merged when ``/metrics`` is
+scraped. Point-in-time values (pool usage, cache counters) are read at scrape time by
+collectors registered with :func:`register_collector`.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from app.core.cache import CacheStats
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Histogram:
+    """Cumulative histogram with a fixed label set, e.g. ``route`` or ``stage``."""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, List[float]]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[Labels, List[float]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record ``value`` (seconds) for the series named by ``labelvalues``."""
+
+        shard = self._shard()
+        series = shard.get(labelvalues)
+        if series is None:
+            # one slot per finite bucket, one for +Inf, then the running sum
+            series = shard[labelvalues] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labelvalues)
+
+    def collect(self) -> Iterator[str]:
+        merged: Dict[Labels, List[float]] = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for labelvalues, series in list(shard.items()):
+                total = merged.setdefault(labelvalues, [0.0] * len(series))
+                for index, count in enumerate(series):
+                    total[index] += count
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labelvalues, series in sorted(merged.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), series):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                yield f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(series[-1])}"
+            yield f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}"
+
+
+class Gauge:
+    """A single value updated in place; meant for state owned by one thread (the event loop)."""
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def collect(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_format_value(self.value)}"
+
+
+class CollectorMetric:
+    """A metric family whose samples are produced by a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, kind: str, callback: Callable[[], Iterable[Sample]]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.callback = callback
+
+    def collect(self) -> Iterator[str]:
+        samples = list(self.callback())
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labels, value in samples:
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+Metric = TypeVar("Metric", bound=Union[Histogram, Gauge, CollectorMetric])
+
+_registry: Dict[str, Union[Histogram, Gauge, CollectorMetric]] = {}
+
+
+def register(metric: Metric) -> Metric:
+    """Add ``metric`` to the exposition; re-registering a name replaces the previous metric."""
+
+    _registry[metric.name] = metric
+    return metric
+
+
+def register_collector(name: str, documentation: str, kind: str, callback: Callable[[], Iterable[Sample]]) -> None:
+    """Expose values computed by ``callback`` at scrape time, e.g. pool or cache statistics."""
+
+    register(CollectorMetric(name, documentation, kind, callback))
+
+
+_caches: Dict[str, Callable[[], Optional[CacheStats]]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], Optional[CacheStats]]) -> None:
+    """Report a cache's counters under ``cache="<name>"``; ``stats`` returns ``None`` while it is unused."""
+
+    _caches[name] = stats
+
+
+def _cache_samples(field: str) -> Callable[[], Iterator[Sample]]:
+    def samples() -> Iterator[Sample]:
+        for name, stats in list(_caches.items()):
+            current = stats()
+            if current is not None:
+                yield {"cache": name}, float(getattr(current, field))
+
+    return samples
+
+
+def render() -> str:
+    """Serialize every registered metric in the Prometheus text format (version 0.0.4)."""
+
+    lines: List[str] = []
+    for metric in list(_registry.values()):
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+REQUEST_DURATION = register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+REQUESTS_IN_FLIGHT = register(Gauge("http_requests_in_flight", "HTTP requests currently being served."))
+STAGE_DURATION = register(
+    Histogram(
+        "auth_stage_duration_seconds",
+        "Time spent in password hashing and token signing/validation stages.",
+        ("stage",),
+    )
+)
+REPOSITORY_DURATION = register(
+    Histogram(
+        "db_repository_call_duration_seconds",
+        "Latency of repository method calls, including time waiting for a connection.",
+        ("repository", "method"),
+    )
+)
+for _field, _kind, _doc in (
+    ("hits", "counter", "Cache lookups that returned an entry."),
+    ("misses", "counter", "Cache lookups that found no live entry."),
+    ("evictions", "counter", "Entries evicted to respect the cache size."),
+    ("size", "gauge", "Entries currently cached."),
+    ("hit_ratio", "gauge", "Hits divided by lookups since the cache was created."),
+):
+    register_collector(
+        f"cache_{_field}_total" if _kind == "counter" else f"cache_{_field}", _doc, _kind, _cache_samples(_field)
+    )
+
+__all__ = [
+    "CollectorMetric",
+    "Gauge",
+    "Histogram",
+    "REPOSITORY_DURATION",
+    "REQUESTS_IN_FLIGHT",
+    "REQUEST_DURATION",
+    "STAGE_DURATION",
+    "register",
+    "register_cache",
+    "register_collector",
+    "render",
+]
@@ -0,0 +1,212 @@
+"""Token-bucket rate limiting for login attempts.
+
+Every login runs a slow password-hash verification, so throttling has to happen before
+:meth:`AuthService.authenticate` and must itself be cheap: the in-memory backend is
+a dictionary lookup and a little arithmetic under a lock. Buckets hold ``limit``
+tokens and refill continuously at ``limit / window`` per second, which behaves like
+a sliding window without storing timestamps per attempt.
+
+The in-memory backend is per process. With several workers or hosts, point
+``rate_limit_backend_url`` at a Redis-compatible server so that all of them share
+the buckets; the update is a single atomic script call.
+"""
+
+import math
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Protocol
+
+from app.core.config import Settings
+from app.core.metrics import register_collector
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class LoginThrottled(Exception):
+    """Raised when a login attempt exceeds a rate limit; mapped to HTTP 429."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Too many login attempts, retry later")
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """``Retry-After`` value in whole seconds, never less than one."""
+
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> float:
+        """Take ``cost`` tokens from bucket ``key`` if it holds at least ``max(cost, 1)``.
+
+        Returns 0 when the tokens were taken, otherwise the seconds until enough have
+        refilled; a rejected hit takes nothing. ``cost=0`` only checks the bucket.
+        """
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+class MemoryRateLimitBackend:
+    """Process-local buckets, evicting the least recently used beyond ``max_keys``."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> float:
+        rate = limit / window
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(limit), now]
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            needed = max(cost, 1)
+            if bucket[0] < needed:
+                return (needed - bucket[0]) / rate
+            bucket[0] -= cost
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    async def close(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# KEYS[1] = bucket; ARGV = limit, window, cost. Uses the server clock so that every
+# client agrees on refill timing, and expires idle buckets once they would be full.
+_TOKEN_BUCKET_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = limit / window
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or limit
+local ts = tonumber(state[2]) or now
+tokens = math.min(limit, tokens + (now - ts) * rate)
+local needed = math.max(cost, 1)
+local retry = 0
+if tokens < needed then
+  retry = (needed - tokens) / rate
+else
+  tokens = tokens - cost
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return tostring(retry)
+"""
+
+
+class RedisRateLimitBackend:
+    """Buckets shared through Redis (or a protocol-compatible server such as Valkey or KeyDB)."""
+
+    def __init__(self, client: "Redis", prefix: str = "ratelimit:") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisRateLimitBackend":
+        from redis.asyncio import Redis  # optional dependency, only needed for a shared backend
+
+        return cls(Redis.from_url(url))
+
+    async def hit(self, key: str, limit: int, window: float, cost: int = 1) -> float:
+        retry_after = await self._script(keys=[self.prefix + key], args=[limit, window, cost])
+        return float(retry_after)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+_throttled: Counter = Counter()
+
+
+class LoginThrottle:
+    """Per-client-IP and per-account limits on login attempts.
+
+    Every attempt from an IP takes a token from that IP's bucket. The per-email
+    bucket is only charged for failed attempts, so an attacker guessing one account's
+    password is stopped while the owner's successful logins never drain it.
+    A limit of 0 disables that check.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        *,
+        ip_limit: int,
+        ip_window: float,
+        email_limit: int,
+        email_window: float,
+    ) -> None:
+        self.backend = backend
+        self.ip_limit = ip_limit
+        self.ip_window = ip_window
+        self.email_limit = email_limit
+        self.email_window = email_window
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"login:email:{email.strip().lower()}"
+
+    async def check(self, client_ip: str | None, email: str) -> None:
+        """Raise :class:`LoginThrottled` if this attempt must be rejected without verifying it."""
+
+        if self.ip_limit and client_ip:
+            retry_after = await self.backend.hit(f"login:ip:{client_ip}", self.ip_limit, self.ip_window)
+            if retry_after:
+                _throttled["ip"] += 1
+                raise LoginThrottled(retry_after)
+        if self.email_limit:
+            retry_after = await self.backend.hit(self._email_key(email), self.email_limit, self.email_window, cost=0)
+            if retry_after:
+                _throttled["email"] += 1
+                raise LoginThrottled(retry_after)
+
+    async def record_failure(self, email: str) -> None:
+        """Charge a failed attempt to the account's bucket."""
+
+        if self.email_limit:
+            await self.backend.hit(self._email_key(email), self.email_limit, self.email_window)
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def build_login_throttle(settings: Settings) -> LoginThrottle:
+    """Create the throttle configured by ``settings``; each application owns one."""
+
+    if settings.rate_limit_backend_url:
+        backend: RateLimitBackend = RedisRateLimitBackend.from_url(settings.rate_limit_backend_url)
+    else:
+        backend = MemoryRateLimitBackend(settings.rate_limit_max_keys)
+    return LoginThrottle(
+        backend,
+        ip_limit=settings.login_ip_limit,
+        ip_window=settings.login_ip_window_seconds,
+        email_limit=settings.login_email_failure_limit,
+        email_window=settings.login_email_window_seconds,
+    )
+
+
+register_collector(
+    "login_throttled_total",
+    "Login attempts rejected by rate limiting, by the limit that was hit.",
+    "counter",
+    lambda: [({"scope": scope}, float(count)) for scope, count in sorted(_throttled.items())],
+)
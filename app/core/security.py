@@ -1,35 +1,92 @@
 """Security helpers wrapping password hashing and JWT utilities."""
 
+import hashlib
+import secrets
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict
-
-from jose import JWTError, jwt
+from typing import Any, Dict, Mapping
 
 from app.core.config import get_settings
-from app.utils.password import hash_password, verify_password
-
-settings = get_settings()
+from app.core.keys import get_key_ring
+from app.core.token_cache import decode_cached
+from app.utils.password import (
+    hash_password,
+    hash_password_async,
+    verify_and_update_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 
 def create_access_token(subject: str, expires_minutes: int | None = None, **claims: Any) -> str:
-    """Generate a signed JWT access token."""
+    """Generate a signed JWT access token with a unique ``jti`` so it can be revoked.
+
+    Besides the whole-second ``iat``, the token carries its issue time in milliseconds
+    as ``iat_ms`` so that revocations can tell apart tokens issued in the same second.
+    """
+
+    settings = get_settings()
+    now = time.time()
+    issued_at = datetime.utcfromtimestamp(now)
+    expire = issued_at + timedelta(minutes=expires_minutes or settings.access_token_expire_minutes)
+    payload: Dict[str, Any] = {
+        "sub": subject,
+        "iat": issued_at,
+        "iat_ms": int(now * 1000),
+        "exp": expire,
+        "jti": uuid.uuid4().hex,
+        **claims,
+    }
+    return get_key_ring().sign(payload)
 
-    expire = datetime.utcnow() + timedelta(minutes=expires_minutes or settings.access_token_expire_minutes)
-    payload: Dict[str, Any] = {"sub": subject, "exp": expire, **claims}
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+
+def issued_at_ms(claims: Mapping[str, Any]) -> int | None:
+    """Issue time of the token with ``claims`` in milliseconds, ``None`` if it has none.
+
+    Tokens without ``iat_ms`` are taken to be issued at the start of their ``iat``
+    second, so that a revocation in that second still covers them.
+    """
+
+    if claims.get("iat_ms") is not None:
+        return int(claims["iat_ms"])
+    if claims.get("iat") is not None:
+        return int(claims["iat"]) * 1000
+    return None
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    """Decode and validate a JWT access token."""
+    """Decode and validate a JWT access token, served from the decoded-token cache when possible."""
+
+    return decode_cached(token)
+
+
+def generate_refresh_token() -> tuple[str, str]:
+    """Return a new opaque refresh token and the digest stored in its place."""
+
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Digest under which a refresh token is stored and looked up.
+
+    The token carries 256 random bits, so a plain SHA-256 cannot be brute-forced and
+    no slow password hash is needed; a leaked table still yields no usable tokens.
+    """
+
+    return hashlib.sha256(token.encode()).hexdigest()
 
-    try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError as exc:  # pragma: no cover - delegated to tests
-        raise ValueError("Invalid token") from exc
 
 __all__ = [
     "create_access_token",
     "decode_access_token",
+    "generate_refresh_token",
+    "hash_refresh_token",
+    "issued_at_ms",
     "hash_password",
+    "hash_password_async",
+    "verify_and_update_password_async",
     "verify_password",
+    "verify_password_async",
 ]
\ No newline at end of file
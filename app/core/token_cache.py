@@ -0,0 +1,43 @@
+"""Cache of validated JWT payloads shared by the token helpers."""
+
+import hashlib
+import time
+from typing import Any, Dict
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.keys import get_key_ring
+from app.core.metrics import STAGE_DURATION, register_cache
+
+_cache: TTLCache[bytes, Dict[str, Any]] | None = None
+
+
+def get_token_cache() -> TTLCache[bytes, Dict[str, Any]]:
+    """Return the process-wide ``sha256(token) -> payload`` cache."""
+
+    global _cache
+    if _cache is None:
+        _cache = TTLCache(get_settings().token_cache_size, ttl=0)
+    return _cache
+
+
+def decode_cached(token: str) -> Dict[str, Any]:
+    """Decode and verify ``token``, reusing the payload of an earlier verification.
+
+    Entries live until the token's ``exp`` claim, so a cached payload is never
+    served for an expired token. Tokens without ``exp`` are not cached.
+    """
+
+    with STAGE_DURATION.time("decode_access_token"):
+        cache = get_token_cache()
+        key = hashlib.sha256(token.encode()).digest()
+        payload = cache.get(key)
+        if payload is None:
+            payload = get_key_ring().verify(token)
+            exp = payload.get("exp")
+            if isinstance(exp, (int, float)):
+                cache.set(key, payload, ttl=exp - time.time())
+        return dict(payload)
+
+
+register_cache("token", lambda: _cache.stats() if _cache is not None else None)
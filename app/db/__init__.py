@@ -1,5 +1,5 @@
 """Database helpers for AuthService."""
 
-from .session import get_session, get_sessionmaker, init_db
+from .session import get_async_session, get_async_sessionmaker, get_session, get_sessionmaker, init_db
 
-__all__ = ["get_session", "get_sessionmaker", "init_db"]
\ No newline at end of file
+__all__ = ["get_async_session", "get_async_sessionmaker", "get_session", "get_sessionmaker", "init_db"]
\ No newline at end of file
@@ -19,7 +19,7 @@ from app.db.models import Base  # noqa: E402  pylint: disable=wrong-import-posit
 config = context.config
 
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,32 @@
+"""Add token revocations."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20241021_0003"
+down_revision = "20241020_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the token revocation table."""
+
+    op.create_table(
+        "token_revocations",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(op.f("ix_token_revocations_expires_at"), "token_revocations", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the token revocation table."""
+
+    op.drop_index(op.f("ix_token_revocations_expires_at"), table_name="token_revocations")
+    op.drop_table("token_revocations")
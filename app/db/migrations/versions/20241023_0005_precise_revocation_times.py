@@ -0,0 +1,41 @@
+"""Keep fractions of a second in the times revocation checks compare."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "20241023_0005"
+down_revision = "20241022_0004"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (("token_revocations", "revoked_at"), ("refresh_tokens", "created_at"))
+
+
+def _is_mysql() -> bool:
+    return op.get_bind().dialect.name in {"mysql", "mariadb"}
+
+
+def upgrade() -> None:
+    """Give the columns microsecond precision on MySQL; other backends already keep it."""
+
+    if not _is_mysql():
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table, column, existing_type=sa.DateTime(), type_=mysql.DATETIME(fsp=6), existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Return the columns to whole seconds on MySQL."""
+
+    if not _is_mysql():
+        return
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table, column, existing_type=mysql.DATETIME(fsp=6), type_=sa.DateTime(), existing_nullable=False
+        )
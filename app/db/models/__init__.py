@@ -1,11 +1,20 @@
 """SQLAlchemy models for AuthService."""
 
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+# MySQL rounds DATETIME to whole seconds unless it is given a fractional precision;
+# revocation checks compare these columns with token issue times in milliseconds.
+PreciseDateTime = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql", "mariadb")
+
+from .refresh_token import RefreshToken  # noqa: E402  pylint: disable=wrong-import-position
 from .role import Role  # noqa: E402  pylint: disable=wrong-import-position
+from .token_revocation import TokenRevocation  # noqa: E402  pylint: disable=wrong-import-position
 from .user import User  # noqa: E402  pylint: disable=wrong-import-position
 from .user_role import UserRole  # noqa: E402  pylint: disable=wrong-import-position
+from .web_session import WebSession  # noqa: E402  pylint: disable=wrong-import-position
 
-__all__ = ["Base", "User", "Role", "UserRole"]
\ No newline at end of file
+__all__ = ["Base", "PreciseDateTime", "RefreshToken", "User", "Role", "TokenRevocation", "UserRole", "WebSession"]
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""Refresh token SQLAlchemy model."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+
+from . import Base, PreciseDateTime
+
+
+class RefreshToken(Base):
+    """One issued refresh token, stored only as a SHA-256 digest.
+
+    Tokens issued by rotating one another share a ``family_id``; presenting a token
+    that was already rotated revokes the whole family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id = Column(String(32), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False)
+    created_at = Column(PreciseDateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    rotated_at = Column(DateTime, nullable=True)
+    revoked_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:  # pragma: no cover - debug helper
+        return f"RefreshToken(id={self.id!r}, user_id={self.user_id!r}, family_id={self.family_id!r})"
@@ -0,0 +1,22 @@
+"""Token revocation SQLAlchemy model."""
+
+from sqlalchemy import Column, DateTime, String
+
+from . import Base, PreciseDateTime
+
+
+class TokenRevocation(Base):
+    """A revoked access token (``jti:<id>``) or a user's tokens issued before ``revoked_at`` (``user:<id>``).
+
+    Rows are only needed until ``expires_at``, after which every token they cover has
+    expired anyway, and are pruned when the in-memory revocation filter is rebuilt.
+    """
+
+    __tablename__ = "token_revocations"
+
+    key = Column(String(64), primary_key=True)
+    revoked_at = Column(PreciseDateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:  # pragma: no cover - debug helper
+        return f"TokenRevocation(key={self.key!r}, expires_at={self.expires_at!r})"
@@ -0,0 +1,20 @@
+"""Web session SQLAlchemy model."""
+
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String
+
+from . import Base
+
+
+class WebSession(Base):
+    """Server-side session of the SSR pages, keyed by the SHA-256 digest of the cookie value."""
+
+    __tablename__ = "web_sessions"
+
+    id_hash = Column(String(64), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user = Column(JSON, nullable=False)
+    loaded_at = Column(Float, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:  # pragma: no cover - debug helper
+        return f"WebSession(user_id={self.user_id!r}, expires_at={self.expires_at!r})"
@@ -0,0 +1,78 @@
+"""Per-request SQL statement counting and slow-query logging via SQLAlchemy events."""
+
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, MutableMapping
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("app.db.slow_query")
+
+
+@dataclass
+class QueryStats:
+    """Statements issued while serving one request and the time spent executing them."""
+
+    scope: MutableMapping[str, Any] = field(default_factory=dict, repr=False)
+    count: int = 0
+    seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+    def server_timing(self) -> str:
+        """Value for a ``Server-Timing`` header, e.g. ``db;dur=1.42;desc="3 queries"``."""
+
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+def track_queries(stats: QueryStats) -> Any:
+    """Make ``stats`` collect the statements of the current context; returns a reset token."""
+
+    return _current.set(stats)
+
+
+def stop_tracking(token: Any) -> None:
+    _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    threshold_ms = get_settings().slow_query_ms
+    if threshold_ms and elapsed * 1000 >= threshold_ms:
+        logger.warning(
+            "slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            stats.route if stats is not None else "-",
+            " ".join(statement.split()),
+        )
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Count and time every statement run through ``engine`` (use ``.sync_engine`` for async)."""
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,6 +1,28 @@
 """Repository layer abstractions."""
 
-from .role_repository import RoleRepository
-from .user_repository import UserRepository
+from .refresh_token_repository import AsyncRefreshTokenRepository, RefreshTokenRecord, RefreshTokenRepository
+from .revocation_repository import AsyncTokenRevocationRepository, RevocationRecord, TokenRevocationRepository
+from .role_repository import AsyncRoleRepository, RoleRecord, RoleRepository
+from .threaded import ThreadedRepository
+from .user_repository import AsyncUserRepository, UserCredentials, UserRepository, UserSummary
+from .web_session_repository import AsyncWebSessionRepository, WebSessionRecord, WebSessionRepository
 
-__all__ = ["UserRepository", "RoleRepository"]
\ No newline at end of file
+__all__ = [
+    "AsyncRefreshTokenRepository",
+    "AsyncRoleRepository",
+    "AsyncTokenRevocationRepository",
+    "AsyncUserRepository",
+    "AsyncWebSessionRepository",
+    "RefreshTokenRecord",
+    "RefreshTokenRepository",
+    "RevocationRecord",
+    "RoleRecord",
+    "RoleRepository",
+    "ThreadedRepository",
+    "TokenRevocationRepository",
+    "UserCredentials",
+    "UserRepository",
+    "UserSummary",
+    "WebSessionRecord",
+    "WebSessionRepository",
+]
@@ -0,0 +1,53 @@
+"""Latency instrumentation for repository classes."""
+
+import inspect
+import time
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from app.core.metrics import REPOSITORY_DURATION
+
+R = TypeVar("R", bound=type)
+
+
+def _timed(func: Callable[..., Any], repository: str, method: str) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                REPOSITORY_DURATION.observe(time.perf_counter() - started, repository, method)
+
+        return timed_coroutine
+
+    @wraps(func)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            REPOSITORY_DURATION.observe(time.perf_counter() - started, repository, method)
+
+    return timed
+
+
+def instrumented(repository: str) -> Callable[[R], R]:
+    """Class decorator recording the latency of each public repository method.
+
+    Generator methods (the streaming readers) are left alone: their cost is spread
+    over the response body and is already part of the request latency.
+    """
+
+    def decorate(cls: R) -> R:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            if inspect.isgeneratorfunction(member) or inspect.isasyncgenfunction(member):
+                continue
+            setattr(cls, name, _timed(member, repository, name))
+        return cls
+
+    return decorate
@@ -0,0 +1,149 @@
+"""Data access helpers for refresh tokens."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ColumnElement, Insert, Select, Update, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.models import RefreshToken
+from app.db.repositories.instrumented import instrumented
+
+
+@dataclass(frozen=True)
+class RefreshTokenRecord:
+    """Session-independent view of a stored refresh token."""
+
+    id: int
+    user_id: int
+    family_id: str
+    created_at: datetime
+    expires_at: datetime
+    rotated_at: datetime | None
+    revoked_at: datetime | None
+
+
+def _lookup_query(token_hash: str) -> Select:
+    return select(
+        RefreshToken.id,
+        RefreshToken.user_id,
+        RefreshToken.family_id,
+        RefreshToken.created_at,
+        RefreshToken.expires_at,
+        RefreshToken.rotated_at,
+        RefreshToken.revoked_at,
+    ).where(RefreshToken.token_hash == token_hash)
+
+
+def _insert_statement(*, user_id: int, family_id: str, token_hash: str, expires_at: datetime) -> Insert:
+    return insert(RefreshToken).values(
+        user_id=user_id,
+        family_id=family_id,
+        token_hash=token_hash,
+        created_at=datetime.utcnow(),
+        expires_at=expires_at,
+    )
+
+
+def _claim_statement(token_id: int) -> Update:
+    # Only one caller can flip rotated_at from NULL, so concurrent refreshes with the
+    # same token cannot both obtain a successor.
+    return (
+        update(RefreshToken)
+        .where(RefreshToken.id == token_id, RefreshToken.rotated_at.is_(None), RefreshToken.revoked_at.is_(None))
+        .values(rotated_at=datetime.utcnow())
+    )
+
+
+def _revoke_statement(criterion: ColumnElement[bool]) -> Update:
+    return (
+        update(RefreshToken)
+        .where(criterion, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+    )
+
+
+@instrumented("refresh_token")
+class RefreshTokenRepository:
+    """Stores refresh token digests and performs rotation."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_by_hash(self, token_hash: str) -> Optional[RefreshTokenRecord]:
+        row = self.session.execute(_lookup_query(token_hash)).first()
+        return RefreshTokenRecord(**row._mapping) if row else None
+
+    def create(self, *, user_id: int, family_id: str, token_hash: str, expires_at: datetime) -> None:
+        self.session.execute(
+            _insert_statement(user_id=user_id, family_id=family_id, token_hash=token_hash, expires_at=expires_at)
+        )
+        self.session.commit()
+
+    def rotate(self, current: RefreshTokenRecord, *, token_hash: str, expires_at: datetime) -> bool:
+        """Mark ``current`` used and store its successor atomically; ``False`` if it was already used or revoked."""
+
+        if self.session.execute(_claim_statement(current.id)).rowcount != 1:
+            self.session.rollback()
+            return False
+        self.session.execute(
+            _insert_statement(
+                user_id=current.user_id, family_id=current.family_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        self.session.commit()
+        return True
+
+    def revoke_family(self, family_id: str) -> int:
+        revoked = self.session.execute(_revoke_statement(RefreshToken.family_id == family_id)).rowcount
+        self.session.commit()
+        return revoked
+
+    def revoke_for_user(self, user_id: int) -> int:
+        revoked = self.session.execute(_revoke_statement(RefreshToken.user_id == user_id)).rowcount
+        self.session.commit()
+        return revoked
+
+
+@instrumented("refresh_token")
+class AsyncRefreshTokenRepository:
+    """Async variant of :class:`RefreshTokenRepository` bound to an ``AsyncSession``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_by_hash(self, token_hash: str) -> Optional[RefreshTokenRecord]:
+        row = (await self.session.execute(_lookup_query(token_hash))).first()
+        return RefreshTokenRecord(**row._mapping) if row else None
+
+    async def create(self, *, user_id: int, family_id: str, token_hash: str, expires_at: datetime) -> None:
+        await self.session.execute(
+            _insert_statement(user_id=user_id, family_id=family_id, token_hash=token_hash, expires_at=expires_at)
+        )
+        await self.session.commit()
+
+    async def rotate(self, current: RefreshTokenRecord, *, token_hash: str, expires_at: datetime) -> bool:
+        """Mark ``current`` used and store its successor atomically; ``False`` if it was already used or revoked."""
+
+        if (await self.session.execute(_claim_statement(current.id))).rowcount != 1:
+            await self.session.rollback()
+            return False
+        await self.session.execute(
+            _insert_statement(
+                user_id=current.user_id, family_id=current.family_id, token_hash=token_hash, expires_at=expires_at
+            )
+        )
+        await self.session.commit()
+        return True
+
+    async def revoke_family(self, family_id: str) -> int:
+        revoked = (await self.session.execute(_revoke_statement(RefreshToken.family_id == family_id))).rowcount
+        await self.session.commit()
+        return revoked
+
+    async def revoke_for_user(self, user_id: int) -> int:
+        revoked = (await self.session.execute(_revoke_statement(RefreshToken.user_id == user_id))).rowcount
+        await self.session.commit()
+        return revoked
@@ -0,0 +1,110 @@
+"""Data access helpers for token revocations."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+
+from sqlalchemy import Delete, Insert, Select, Update, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.models import TokenRevocation
+from app.db.repositories.instrumented import instrumented
+
+
+@dataclass(frozen=True)
+class RevocationRecord:
+    key: str
+    revoked_at: datetime
+    expires_at: datetime
+
+
+def _update_statement(key: str, revoked_at: datetime, expires_at: datetime) -> Update:
+    return update(TokenRevocation).where(TokenRevocation.key == key).values(revoked_at=revoked_at, expires_at=expires_at)
+
+
+def _lookup_query(keys: Iterable[str]) -> Select:
+    return select(TokenRevocation.key, TokenRevocation.revoked_at, TokenRevocation.expires_at).where(
+        TokenRevocation.key.in_(list(keys))
+    )
+
+
+def user_revocation_statements(
+    user_ids: Sequence[int], *, revoked_at: datetime, expires_at: datetime
+) -> tuple[Delete, Insert]:
+    """Statements (re)writing the ``user:<id>`` entries of ``user_ids``, for a caller's own transaction."""
+
+    keys = [f"user:{user_id}" for user_id in user_ids]
+    return (
+        delete(TokenRevocation).where(TokenRevocation.key.in_(keys)),
+        insert(TokenRevocation).values(
+            [{"key": key, "revoked_at": revoked_at, "expires_at": expires_at} for key in keys]
+        ),
+    )
+
+
+def _active_query(now: datetime) -> Select:
+    return select(TokenRevocation.key).where(TokenRevocation.expires_at > now)
+
+
+def _prune_statement(now: datetime) -> Delete:
+    return delete(TokenRevocation).where(TokenRevocation.expires_at <= now)
+
+
+@instrumented("token_revocation")
+class TokenRevocationRepository:
+    """Stores revocation entries keyed by ``jti:<id>`` or ``user:<id>``."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def revoke(self, key: str, *, revoked_at: datetime, expires_at: datetime) -> None:
+        """Insert or overwrite the entry for ``key``."""
+
+        if not self.session.execute(_update_statement(key, revoked_at, expires_at)).rowcount:
+            self.session.execute(insert(TokenRevocation).values(key=key, revoked_at=revoked_at, expires_at=expires_at))
+        self.session.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, RevocationRecord]:
+        return {row.key: RevocationRecord(**row._mapping) for row in self.session.execute(_lookup_query(keys))}
+
+    def active_keys(self, now: datetime) -> List[str]:
+        return list(self.session.execute(_active_query(now)).scalars())
+
+    def prune(self, now: datetime) -> int:
+        """Delete entries that no longer cover any unexpired token."""
+
+        pruned = self.session.execute(_prune_statement(now)).rowcount
+        self.session.commit()
+        return pruned
+
+
+@instrumented("token_revocation")
+class AsyncTokenRevocationRepository:
+    """Async variant of :class:`TokenRevocationRepository` bound to an ``AsyncSession``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def revoke(self, key: str, *, revoked_at: datetime, expires_at: datetime) -> None:
+        """Insert or overwrite the entry for ``key``."""
+
+        if not (await self.session.execute(_update_statement(key, revoked_at, expires_at))).rowcount:
+            await self.session.execute(
+                insert(TokenRevocation).values(key=key, revoked_at=revoked_at, expires_at=expires_at)
+            )
+        await self.session.commit()
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, RevocationRecord]:
+        result = await self.session.execute(_lookup_query(keys))
+        return {row.key: RevocationRecord(**row._mapping) for row in result}
+
+    async def active_keys(self, now: datetime) -> List[str]:
+        return list((await self.session.execute(_active_query(now))).scalars())
+
+    async def prune(self, now: datetime) -> int:
+        """Delete entries that no longer cover any unexpired token."""
+
+        pruned = (await self.session.execute(_prune_statement(now))).rowcount
+        await self.session.commit()
+        return pruned
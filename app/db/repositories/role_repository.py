@@ -1,12 +1,53 @@
 """Data access helpers for roles."""
 
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Protocol
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 
 from app.db.models import Role
+from app.db.repositories.instrumented import instrumented
+from app.events import RolesChangedEvent, publish_roles_changed
 
 
+class RoleRecord(Protocol):
+    """Anything carrying a persisted role's columns, e.g. a ``RoleEntity`` from the role catalog."""
+
+    id: int | None
+    name: str
+    level: int
+
+
+def _insert_missing_roles(dialect: str, roles: dict[int, str]) -> Optional[Insert]:
+    """One multi-row ``INSERT`` that skips existing roles, or ``None`` if the dialect has no such syntax."""
+
+    from sqlalchemy.dialects import mysql, postgresql, sqlite  # only needed while seeding
+
+    rows = [{"level": level, "name": name} for level, name in roles.items()]
+    if dialect == "sqlite":
+        return sqlite.insert(Role).values(rows).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        return postgresql.insert(Role).values(rows).on_conflict_do_nothing()
+    if dialect in {"mysql", "mariadb"}:
+        return mysql.insert(Role).values(rows).prefix_with("IGNORE")
+    return None
+
+
+def _attach(session: Session, role: RoleRecord) -> Role:
+    """Bind a known role to ``session`` without a SELECT, reusing an already loaded instance."""
+
+    existing = session.identity_map.get(identity_key(Role, role.id))
+    if existing is not None:
+        return existing
+    model = Role(id=role.id, name=role.name, level=role.level)
+    make_transient_to_detached(model)
+    session.add(model)
+    return model
+
+
+@instrumented("role")
 class RoleRepository:
     """CRUD logic for role records."""
 
@@ -22,11 +63,47 @@ class RoleRepository:
     def list(self) -> Iterable[Role]:
         return self.session.query(Role).order_by(Role.level.asc()).all()
 
+    def attach(self, role: RoleRecord) -> Role:
+        """Return a session-bound ``Role`` for a role known from the catalog, without querying it."""
+
+        return _attach(self.session, role)
+
     def ensure_roles(self, roles: dict[int, str]) -> None:
-        """Ensure all roles exist; create any missing ones."""
+        """Ensure all roles exist with one set-based upsert that leaves existing rows untouched."""
+
+        upsert = _insert_missing_roles(self.session.get_bind().dialect.name, roles)
+        if upsert is not None:
+            inserted = self.session.execute(upsert).rowcount
+        else:
+            existing = set(self.session.execute(select(Role.level).where(Role.level.in_(list(roles)))).scalars())
+            missing = [Role(level=level, name=name) for level, name in roles.items() if level not in existing]
+            self.session.add_all(missing)
+            inserted = len(missing)
+        self.session.commit()
+        if inserted:
+            publish_roles_changed(RolesChangedEvent(levels=tuple(roles)))
+
+
+@instrumented("role")
+class AsyncRoleRepository:
+    """Async variant of :class:`RoleRepository` bound to an ``AsyncSession``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_by_level(self, level: int) -> Optional[Role]:
+        result = await self.session.execute(select(Role).where(Role.level == level))
+        return result.scalars().first()
+
+    async def get_by_name(self, name: str) -> Optional[Role]:
+        result = await self.session.execute(select(Role).where(Role.name == name))
+        return result.scalars().first()
+
+    async def list(self) -> Iterable[Role]:
+        result = await self.session.execute(select(Role).order_by(Role.level.asc()))
+        return result.scalars().all()
+
+    async def attach(self, role: RoleRecord) -> Role:
+        """Return a session-bound ``Role`` for a role known from the catalog, without querying it."""
 
-        for level, name in roles.items():
-            if not self.get_by_level(level):
-                role = Role(level=level, name=name)
-                self.session.add(role)
-        self.session.commit()
\ No newline at end of file
+        return _attach(self.session.sync_session, role)
@@ -0,0 +1,27 @@
+"""Adapter exposing synchronous repositories through awaitable methods."""
+
+from functools import partial
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+
+class ThreadedRepository:
+    """Wrap a sync repository so async services can ``await`` its methods.
+
+    Each call runs in the Starlette threadpool, which keeps the blocking driver off the
+    event loop when the application is configured with ``DATABASE_ASYNC=false``.
+    """
+
+    def __init__(self, repository: Any) -> None:
+        self.repository = repository
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.repository, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_in_threadpool(partial(attribute, *args, **kwargs))
+
+        return call
@@ -1,12 +1,235 @@
 """Data access helpers for user persistence."""
 
-from typing import Iterable, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Mapping, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Delete, Insert, Row, Select, Update, delete, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.db.models import Role, User
+from app.core.config import get_settings
+from app.db.models import Role, User, UserRole
+from app.db.repositories.instrumented import instrumented
+from app.db.repositories.revocation_repository import user_revocation_statements
+from app.db.repositories.role_repository import RoleRecord
+from app.events import (
+    PermissionBatchEvent,
+    PermissionEvent,
+    UserChangedEvent,
+    publish_permission_batch,
+    publish_permission_granted,
+    publish_user_changed,
+)
 
 
+@dataclass(frozen=True)
+class UserCredentials:
+    """Read model with everything a login needs, loaded in a single round trip."""
+
+    id: int
+    email: str
+    full_name: str | None
+    hashed_password: str
+    is_active: bool
+    created_at: datetime | None
+    role_levels: tuple[int, ...]
+
+
+def _credentials_query(email: str) -> Select:
+    return (
+        select(
+            User.id,
+            User.email,
+            User.full_name,
+            User.hashed_password,
+            User.is_active,
+            User.created_at,
+            Role.level,
+        )
+        .outerjoin(UserRole, UserRole.user_id == User.id)
+        .outerjoin(Role, Role.id == UserRole.role_id)
+        .where(User.email == email)
+    )
+
+
+@dataclass(frozen=True)
+class UserSummary:
+    """Flat, session-independent user row used when streaming the whole table."""
+
+    id: int
+    email: str
+    full_name: str | None
+    is_active: bool
+    created_at: datetime | None
+    role_levels: tuple[int, ...]
+
+
+class _SummaryBuilder:
+    """Folds ``users ⟕ roles`` rows, ordered by user id, into one summary per user."""
+
+    def __init__(self) -> None:
+        self._row: Row | None = None
+        self._levels: list[int] = []
+
+    def add(self, row: Row) -> UserSummary | None:
+        finished = self.flush() if self._row is not None and row.id != self._row.id else None
+        if self._row is None:
+            self._row = row
+        if row.level is not None:
+            self._levels.append(row.level)
+        return finished
+
+    def flush(self) -> UserSummary | None:
+        row, levels = self._row, self._levels
+        self._row, self._levels = None, []
+        if row is None:
+            return None
+        return UserSummary(
+            id=row.id,
+            email=row.email,
+            full_name=row.full_name,
+            is_active=bool(row.is_active),
+            created_at=row.created_at,
+            role_levels=tuple(sorted(levels)),
+        )
+
+
+def _summaries_query(chunk_size: int) -> Select:
+    return (
+        select(User.id, User.email, User.full_name, User.is_active, User.created_at, Role.level)
+        .outerjoin(UserRole, UserRole.user_id == User.id)
+        .outerjoin(Role, Role.id == UserRole.role_id)
+        .order_by(User.id)
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def _page_query(after: int | None, limit: int | None) -> Select:
+    query = select(User).options(selectinload(User.roles)).order_by(User.id)
+    if after is not None:
+        query = query.where(User.id > after)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _role_links(users: Sequence[Mapping[str, Any]]) -> list[Insert]:
+    """``INSERT ... SELECT`` statements linking freshly inserted users to their roles, one per role."""
+
+    emails_by_role: dict[int, list[str]] = {}
+    for user in users:
+        if user.get("role_id") is not None:
+            emails_by_role.setdefault(user["role_id"], []).append(user["email"])
+    return [
+        insert(UserRole).from_select(
+            ["user_id", "role_id"], select(User.id, literal(role_id)).where(User.email.in_(emails))
+        )
+        for role_id, emails in emails_by_role.items()
+    ]
+
+
+def _existing_emails_query(emails: Iterable[str]) -> Select:
+    # Case-insensitive, like the duplicate check within one import file.
+    return select(User.email).where(func.lower(User.email).in_([email.lower() for email in emails]))
+
+
+def _user_rows(users: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {"email": user["email"], "hashed_password": user["hashed_password"], "full_name": user.get("full_name")}
+        for user in users
+    ]
+
+
+def _targets_query(user_ids: Iterable[int] | None, has_level: int | None) -> Select:
+    """Ids of the users selected by a bulk role change: explicit ids and/or current holders of a level."""
+
+    query = select(User.id)
+    if user_ids is not None:
+        query = query.where(User.id.in_(list(user_ids)))
+    if has_level is not None:
+        query = query.where(User.roles.any(Role.level == has_level))
+    return query
+
+
+def _missing_query(targets: Select, role: RoleRecord) -> Select:
+    """Users among ``targets`` lacking ``role``."""
+
+    return targets.where(~User.roles.any(Role.id == role.id))
+
+
+def _link_statement(role: RoleRecord, user_ids: Sequence[int]) -> Insert:
+    # Links exactly the ids already read by _missing_query, so users who start matching the
+    # targets in between are not granted without appearing in the batch event. The repeated
+    # "lacks the role" check skips links made concurrently.
+    linkable = _missing_query(select(User.id).where(User.id.in_(list(user_ids))), role)
+    return insert(UserRole).from_select(["user_id", "role_id"], linkable.add_columns(literal(role.id)))
+
+
+def _holding_query(targets: Select, role: RoleRecord) -> Select:
+    """Users among ``targets`` holding ``role``."""
+
+    return targets.where(User.roles.any(Role.id == role.id))
+
+
+def _unlink_statement(role: RoleRecord, user_ids: Sequence[int]) -> Delete:
+    # Takes the ids already read by _holding_query rather than a subquery: MySQL refuses a
+    # DELETE whose WHERE reads the table being deleted from (error 1093).
+    return (
+        delete(UserRole)
+        .where(UserRole.role_id == role.id, UserRole.user_id.in_(list(user_ids)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _publish_batch(user_ids: Sequence[int], role: RoleRecord, granted: bool) -> None:
+    if user_ids:
+        publish_permission_batch(PermissionBatchEvent(user_ids=tuple(user_ids), role_level=role.level, granted=granted))
+
+
+def _token_revocations(user_ids: Sequence[int]) -> tuple[Delete | Insert, ...]:
+    # Stateless tokens carry the roles and active flag they were issued with, so a change
+    # revokes the users' earlier tokens in the same transaction. Other workers learn of it
+    # from the revocation table, as they do of "log out everywhere".
+    settings = get_settings()
+    if not settings.stateless_auth or not user_ids:
+        return ()
+    now = datetime.utcnow()
+    expires_at = now + timedelta(minutes=settings.access_token_expire_minutes)
+    return user_revocation_statements(user_ids, revoked_at=now, expires_at=expires_at)
+
+
+def _rehash_statement(user_id: int, old_hash: str, new_hash: str) -> Update:
+    # Guarded by the old hash so a password change that raced the login is not overwritten.
+    return (
+        update(User)
+        .where(User.id == user_id, User.hashed_password == old_hash)
+        .values(hashed_password=new_hash)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _many_query(user_ids: Iterable[int]) -> Select:
+    return select(User).options(joinedload(User.roles)).where(User.id.in_(list(user_ids)))
+
+
+def _credentials_from_rows(rows: Sequence[Row]) -> Optional[UserCredentials]:
+    if not rows:
+        return None
+    first = rows[0]
+    return UserCredentials(
+        id=first.id,
+        email=first.email,
+        full_name=first.full_name,
+        hashed_password=first.hashed_password,
+        is_active=bool(first.is_active),
+        created_at=first.created_at,
+        role_levels=tuple(sorted(row.level for row in rows if row.level is not None)),
+    )
+
+
+@instrumented("user")
 class UserRepository:
     """Encapsulates CRUD operations for users."""
 
@@ -14,13 +237,68 @@ class UserRepository:
         self.session = session
 
     def get_by_email(self, email: str) -> Optional[User]:
-        return self.session.query(User).filter(User.email == email).first()
+        return self.session.query(User).options(selectinload(User.roles)).filter(User.email == email).first()
+
+    def get_credentials(self, email: str) -> Optional[UserCredentials]:
+        """Return login credentials and role levels for ``email`` with one joined query."""
+
+        return _credentials_from_rows(self.session.execute(_credentials_query(email)).all())
+
+    def update_password_hash(self, user_id: int, *, old_hash: str, new_hash: str) -> None:
+        """Replace an outdated hash with one ``UPDATE``, without loading the user."""
+
+        self.session.execute(_rehash_statement(user_id, old_hash, new_hash))
+        self.session.commit()
+
+    def existing_emails(self, emails: Iterable[str]) -> set[str]:
+        """Return the registered emails matching ``emails`` ignoring case, using one set query."""
+
+        return set(self.session.execute(_existing_emails_query(emails)).scalars())
+
+    def bulk_create(self, users: Sequence[Mapping[str, Any]]) -> bool:
+        """Insert ``users`` (email, hashed_password, full_name, role_id) in one transaction.
+
+        Users go in as a single executemany batch and role links as one
+        ``INSERT ... SELECT`` per role, followed by a single commit. Returns ``False``,
+        with nothing inserted, if one of the emails was registered concurrently.
+        """
+
+        if not users:
+            return True
+        try:
+            self.session.execute(insert(User), _user_rows(users))
+            for statement in _role_links(users):
+                self.session.execute(statement)
+        except IntegrityError:
+            self.session.rollback()
+            return False
+        self.session.commit()
+        return True
 
     def get(self, user_id: int) -> Optional[User]:
-        return self.session.query(User).filter(User.id == user_id).first()
+        return self.session.query(User).options(selectinload(User.roles)).filter(User.id == user_id).first()
+
+    def list(self, *, after: int | None = None, limit: int | None = None) -> Iterable[User]:
+        """Return users ordered by id, optionally as a keyset page starting after ``after``."""
 
-    def list(self) -> Iterable[User]:
-        return self.session.query(User).all()
+        return self.session.execute(_page_query(after, limit)).scalars().all()
+
+    def stream_summaries(self, chunk_size: int = 1000) -> Iterator[UserSummary]:
+        """Walk every user with a server-side cursor, holding one chunk in memory at a time."""
+
+        builder = _SummaryBuilder()
+        for row in self.session.execute(_summaries_query(chunk_size)):
+            summary = builder.add(row)
+            if summary is not None:
+                yield summary
+        last = builder.flush()
+        if last is not None:
+            yield last
+
+    def get_many(self, user_ids: Iterable[int]) -> Iterable[User]:
+        """Return the users among ``user_ids`` with roles, in a single ``IN`` query."""
+
+        return self.session.execute(_many_query(user_ids)).unique().scalars().all()
 
     def create(
         self,
@@ -36,12 +314,206 @@ class UserRepository:
         self.session.add(user)
         self.session.commit()
         self.session.refresh(user)
+        publish_user_changed(UserChangedEvent(user_id=user.id, reason="created"))
         return user
 
     def add_role(self, user: User, role: Role) -> User:
         if role not in user.roles:
             user.roles.append(role)
             self.session.add(user)
+            for statement in _token_revocations([user.id]):
+                self.session.execute(statement)
             self.session.commit()
             self.session.refresh(user)
-        return user
\ No newline at end of file
+            publish_permission_granted(PermissionEvent(user_id=user.id, role_level=role.level, timestamp=datetime.utcnow()))
+        return user
+
+    def grant_role_bulk(
+        self, role: RoleRecord, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Link ``role`` to every targeted user lacking it with one ``INSERT ... SELECT``; return their ids."""
+
+        missing = _missing_query(_targets_query(user_ids, has_level), role)
+        changed = list(self.session.execute(missing).scalars())
+        if changed:
+            self.session.execute(_link_statement(role, changed))
+        for statement in _token_revocations(changed):
+            self.session.execute(statement)
+        self.session.commit()
+        _publish_batch(changed, role, granted=True)
+        return changed
+
+    def revoke_role_bulk(
+        self, role: RoleRecord, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Unlink ``role`` from every targeted user that holds it with one ``DELETE``; return their ids."""
+
+        holding = _holding_query(_targets_query(user_ids, has_level), role)
+        changed = list(self.session.execute(holding).scalars())
+        if changed:
+            self.session.execute(_unlink_statement(role, changed))
+        for statement in _token_revocations(changed):
+            self.session.execute(statement)
+        self.session.commit()
+        _publish_batch(changed, role, granted=False)
+        return changed
+
+    def set_active(self, user: User, is_active: bool) -> User:
+        if user.is_active != is_active:
+            user.is_active = is_active
+            for statement in _token_revocations([user.id]):
+                self.session.execute(statement)
+            self.session.commit()
+            self.session.refresh(user)
+            publish_user_changed(UserChangedEvent(user_id=user.id, reason="activated" if is_active else "deactivated"))
+        return user
+
+
+@instrumented("user")
+class AsyncUserRepository:
+    """Async variant of :class:`UserRepository` bound to an ``AsyncSession``.
+
+    Lazy loading is unavailable under asyncio, so every read eager-loads ``User.roles``
+    and writes rely on ``expire_on_commit=False`` instead of refreshing after commit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        result = await self.session.execute(
+            select(User).options(selectinload(User.roles)).where(User.email == email)
+        )
+        return result.scalars().first()
+
+    async def get_credentials(self, email: str) -> Optional[UserCredentials]:
+        """Return login credentials and role levels for ``email`` with one joined query."""
+
+        result = await self.session.execute(_credentials_query(email))
+        return _credentials_from_rows(result.all())
+
+    async def update_password_hash(self, user_id: int, *, old_hash: str, new_hash: str) -> None:
+        """Replace an outdated hash with one ``UPDATE``, without loading the user."""
+
+        await self.session.execute(_rehash_statement(user_id, old_hash, new_hash))
+        await self.session.commit()
+
+    async def existing_emails(self, emails: Iterable[str]) -> set[str]:
+        """Return the registered emails matching ``emails`` ignoring case, using one set query."""
+
+        result = await self.session.execute(_existing_emails_query(emails))
+        return set(result.scalars())
+
+    async def bulk_create(self, users: Sequence[Mapping[str, Any]]) -> bool:
+        """Insert ``users`` (email, hashed_password, full_name, role_id) in one transaction.
+
+        Users go in as a single executemany batch and role links as one
+        ``INSERT ... SELECT`` per role, followed by a single commit. Returns ``False``,
+        with nothing inserted, if one of the emails was registered concurrently.
+        """
+
+        if not users:
+            return True
+        try:
+            await self.session.execute(insert(User), _user_rows(users))
+            for statement in _role_links(users):
+                await self.session.execute(statement)
+        except IntegrityError:
+            await self.session.rollback()
+            return False
+        await self.session.commit()
+        return True
+
+    async def get(self, user_id: int) -> Optional[User]:
+        result = await self.session.execute(
+            select(User).options(selectinload(User.roles)).where(User.id == user_id)
+        )
+        return result.scalars().first()
+
+    async def list(self, *, after: int | None = None, limit: int | None = None) -> Iterable[User]:
+        """Return users ordered by id, optionally as a keyset page starting after ``after``."""
+
+        result = await self.session.execute(_page_query(after, limit))
+        return result.scalars().all()
+
+    async def stream_summaries(self, chunk_size: int = 1000) -> AsyncIterator[UserSummary]:
+        """Walk every user with a server-side cursor, holding one chunk in memory at a time."""
+
+        builder = _SummaryBuilder()
+        result = await self.session.stream(_summaries_query(chunk_size))
+        async for row in result:
+            summary = builder.add(row)
+            if summary is not None:
+                yield summary
+        last = builder.flush()
+        if last is not None:
+            yield last
+
+    async def get_many(self, user_ids: Iterable[int]) -> Iterable[User]:
+        """Return the users among ``user_ids`` with roles, in a single ``IN`` query."""
+
+        result = await self.session.execute(_many_query(user_ids))
+        return result.unique().scalars().all()
+
+    async def create(
+        self,
+        *,
+        email: str,
+        hashed_password: str,
+        full_name: str | None = None,
+        roles: Iterable[Role] | None = None,
+    ) -> User:
+        user = User(email=email, hashed_password=hashed_password, full_name=full_name, roles=list(roles or []))
+        self.session.add(user)
+        await self.session.commit()
+        publish_user_changed(UserChangedEvent(user_id=user.id, reason="created"))
+        return user
+
+    async def add_role(self, user: User, role: Role) -> User:
+        if role not in user.roles:
+            user.roles.append(role)
+            self.session.add(user)
+            for statement in _token_revocations([user.id]):
+                await self.session.execute(statement)
+            await self.session.commit()
+            publish_permission_granted(PermissionEvent(user_id=user.id, role_level=role.level, timestamp=datetime.utcnow()))
+        return user
+
+    async def grant_role_bulk(
+        self, role: RoleRecord, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Link ``role`` to every targeted user lacking it with one ``INSERT ... SELECT``; return their ids."""
+
+        missing = _missing_query(_targets_query(user_ids, has_level), role)
+        changed = list((await self.session.execute(missing)).scalars())
+        if changed:
+            await self.session.execute(_link_statement(role, changed))
+        for statement in _token_revocations(changed):
+            await self.session.execute(statement)
+        await self.session.commit()
+        _publish_batch(changed, role, granted=True)
+        return changed
+
+    async def revoke_role_bulk(
+        self, role: RoleRecord, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Unlink ``role`` from every targeted user that holds it with one ``DELETE``; return their ids."""
+
+        holding = _holding_query(_targets_query(user_ids, has_level), role)
+        changed = list((await self.session.execute(holding)).scalars())
+        if changed:
+            await self.session.execute(_unlink_statement(role, changed))
+        for statement in _token_revocations(changed):
+            await self.session.execute(statement)
+        await self.session.commit()
+        _publish_batch(changed, role, granted=False)
+        return changed
+
+    async def set_active(self, user: User, is_active: bool) -> User:
+        if user.is_active != is_active:
+            user.is_active = is_active
+            for statement in _token_revocations([user.id]):
+                await self.session.execute(statement)
+            await self.session.commit()
+            publish_user_changed(UserChangedEvent(user_id=user.id, reason="activated" if is_active else "deactivated"))
+        return user
@@ -0,0 +1,122 @@
+"""Data access helpers for server-side web sessions."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import ColumnElement, Delete, Insert, Select, Update, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.models import WebSession
+from app.db.repositories.instrumented import instrumented
+
+
+@dataclass(frozen=True)
+class WebSessionRecord:
+    user_id: int
+    user: Dict[str, Any]
+    loaded_at: float
+    expires_at: datetime
+
+
+def _insert_statement(
+    id_hash: str, *, user_id: int, user: Dict[str, Any], loaded_at: float, expires_at: datetime
+) -> Insert:
+    return insert(WebSession).values(
+        id_hash=id_hash, user_id=user_id, user=user, loaded_at=loaded_at, expires_at=expires_at
+    )
+
+
+def _lookup_query(id_hash: str, now: datetime) -> Select:
+    return select(WebSession.user_id, WebSession.user, WebSession.loaded_at, WebSession.expires_at).where(
+        WebSession.id_hash == id_hash, WebSession.expires_at > now
+    )
+
+
+def _update_statement(id_hash: str, **values: Any) -> Update:
+    return update(WebSession).where(WebSession.id_hash == id_hash).values(**values)
+
+
+def _delete_statement(criterion: ColumnElement[bool]) -> Delete:
+    return delete(WebSession).where(criterion)
+
+
+@instrumented("web_session")
+class WebSessionRepository:
+    """Stores SSR sessions keyed by the digest of their cookie value."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def create(
+        self, id_hash: str, *, user_id: int, user: Dict[str, Any], loaded_at: float, expires_at: datetime
+    ) -> None:
+        self.session.execute(
+            _insert_statement(id_hash, user_id=user_id, user=user, loaded_at=loaded_at, expires_at=expires_at)
+        )
+        self.session.commit()
+
+    def get(self, id_hash: str, now: datetime) -> Optional[WebSessionRecord]:
+        """Return the session unless it is missing or has expired by ``now``."""
+
+        row = self.session.execute(_lookup_query(id_hash, now)).first()
+        return WebSessionRecord(**row._mapping) if row else None
+
+    def update(self, id_hash: str, **values: Any) -> None:
+        self.session.execute(_update_statement(id_hash, **values))
+        self.session.commit()
+
+    def delete(self, id_hash: str) -> None:
+        self.session.execute(_delete_statement(WebSession.id_hash == id_hash))
+        self.session.commit()
+
+    def delete_for_user(self, user_id: int) -> int:
+        deleted = self.session.execute(_delete_statement(WebSession.user_id == user_id)).rowcount
+        self.session.commit()
+        return deleted
+
+    def prune(self, now: datetime) -> int:
+        pruned = self.session.execute(_delete_statement(WebSession.expires_at <= now)).rowcount
+        self.session.commit()
+        return pruned
+
+
+@instrumented("web_session")
+class AsyncWebSessionRepository:
+    """Async variant of :class:`WebSessionRepository` bound to an ``AsyncSession``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create(
+        self, id_hash: str, *, user_id: int, user: Dict[str, Any], loaded_at: float, expires_at: datetime
+    ) -> None:
+        await self.session.execute(
+            _insert_statement(id_hash, user_id=user_id, user=user, loaded_at=loaded_at, expires_at=expires_at)
+        )
+        await self.session.commit()
+
+    async def get(self, id_hash: str, now: datetime) -> Optional[WebSessionRecord]:
+        """Return the session unless it is missing or has expired by ``now``."""
+
+        row = (await self.session.execute(_lookup_query(id_hash, now))).first()
+        return WebSessionRecord(**row._mapping) if row else None
+
+    async def update(self, id_hash: str, **values: Any) -> None:
+        await self.session.execute(_update_statement(id_hash, **values))
+        await self.session.commit()
+
+    async def delete(self, id_hash: str) -> None:
+        await self.session.execute(_delete_statement(WebSession.id_hash == id_hash))
+        await self.session.commit()
+
+    async def delete_for_user(self, user_id: int) -> int:
+        deleted = (await self.session.execute(_delete_statement(WebSession.user_id == user_id))).rowcount
+        await self.session.commit()
+        return deleted
+
+    async def prune(self, now: datetime) -> int:
+        pruned = (await self.session.execute(_delete_statement(WebSession.expires_at <= now))).rowcount
+        await self.session.commit()
+        return pruned
@@ -1,29 +1,101 @@
 """Database session factory and migration helpers."""
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
 
-from alembic import command
-from alembic.config import Config
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.metrics import Sample, register_collector
+from app.db.query_stats import install_query_hooks
+
+if TYPE_CHECKING:  # Alembic is only imported when a migration check or upgrade needs it
+    from alembic.config import Config
 
 _engine: Engine | None = None
+_engine_settings: Settings | None = None
 _SessionLocal: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_async_engine_settings: Settings | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+asyncmy",
+}
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _engine_options(url: URL, settings: Settings) -> dict[str, Any]:
+    """Pool keyword arguments for ``create_engine`` appropriate to the backend of ``url``."""
+
+    if url.get_backend_name() == "sqlite":
+        if _is_memory_sqlite(url):
+            return {"connect_args": {"check_same_thread": False}}
+        return {
+            "connect_args": {"check_same_thread": False},
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+        }
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def _install_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    """Apply the configured PRAGMAs to every new SQLite connection of ``engine``."""
+
+    pragmas = [
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _create_engine(url: URL, settings: Settings) -> Engine:
+    engine = create_engine(url, future=True, **_engine_options(url, settings))
+    if url.get_backend_name() == "sqlite":
+        _install_sqlite_pragmas(engine, settings)
+    install_query_hooks(engine)
+    return engine
 
 
 def get_engine() -> Engine:
-    """Return a cached SQLAlchemy engine configured from settings."""
-    
-    global _engine
+    """Return a cached SQLAlchemy engine configured from settings.
+
+    The engine is rebuilt only when the settings object itself is replaced (e.g. after
+    ``get_settings.cache_clear()``), so the per-session lookup is an identity check.
+    """
+
+    global _engine, _engine_settings
     settings = get_settings()
-    if _engine is None or str(_engine.url) != settings.database_url:
-        connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-        _engine = create_engine(settings.database_url, connect_args=connect_args, future=True)
+    if _engine is None or _engine_settings is not settings:
+        _engine = _create_engine(make_url(settings.database_url), settings)
+        _engine_settings = settings
     return _engine
 
 
@@ -36,9 +108,81 @@ def get_sessionmaker() -> sessionmaker:
         _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
     return _SessionLocal
 
-def _get_alembic_config() -> Config:
+
+def get_async_database_url() -> str:
+    """Return the async driver URL, deriving it from ``database_url`` when not configured."""
+
+    settings = get_settings()
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for {url.get_backend_name()!r}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return a cached async SQLAlchemy engine configured from settings, rebuilt like :func:`get_engine`."""
+
+    global _async_engine, _async_engine_settings
+    settings = get_settings()
+    if _async_engine is None or _async_engine_settings is not settings:
+        url = make_url(get_async_database_url())
+        _async_engine = create_async_engine(url, **_engine_options(url, settings))
+        if url.get_backend_name() == "sqlite":
+            _install_sqlite_pragmas(_async_engine.sync_engine, settings)
+        install_query_hooks(_async_engine.sync_engine)
+        _async_engine_settings = settings
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Return a cached async session factory bound to the current async engine."""
+
+    global _AsyncSessionLocal
+    engine = get_async_engine()
+    if _AsyncSessionLocal is None or _AsyncSessionLocal.kw.get("bind") is not engine:
+        _AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections, e.g. when the event loop shuts down."""
+
+    global _async_engine, _async_engine_settings, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_engine_settings = None
+    _AsyncSessionLocal = None
+
+
+def _pool_samples(stat: str) -> Callable[[], Iterator[Sample]]:
+    def samples() -> Iterator[Sample]:
+        for label, engine in (("sync", _engine), ("async", _async_engine)):
+            pool = engine.pool if engine is not None else None
+            if pool is not None and hasattr(pool, stat):
+                yield {"engine": label}, float(getattr(pool, stat)())
+
+    return samples
+
+
+register_collector("db_pool_size", "Connections the pool keeps open.", "gauge", _pool_samples("size"))
+register_collector(
+    "db_pool_checked_out", "Connections currently checked out of the pool.", "gauge", _pool_samples("checkedout")
+)
+register_collector("db_pool_checked_in", "Idle connections in the pool.", "gauge", _pool_samples("checkedin"))
+register_collector(
+    "db_pool_overflow", "Connections open beyond pool_size (negative while below it).", "gauge", _pool_samples("overflow")
+)
+
+
+def _get_alembic_config() -> "Config":
     """Build an Alembic configuration bound to the active database URL."""
 
+    from alembic.config import Config
+
     settings = get_settings()
     project_root = Path(__file__).resolve().parents[2]
     alembic_cfg = Config(str(project_root / "alembic.ini"))
@@ -49,10 +193,39 @@ def _get_alembic_config() -> Config:
     return alembic_cfg
 
 
-def init_db() -> None:
-    """Apply the latest database migrations using Alembic."""
+@lru_cache()
+def get_head_revisions() -> frozenset[str]:
+    """Return the head revision(s) of the migration scripts shipped with this build."""
+
+    from alembic.script import ScriptDirectory
+
+    return frozenset(ScriptDirectory.from_config(_get_alembic_config()).get_heads())
+
+
+def get_current_revisions(engine: Engine | None = None) -> frozenset[str]:
+    """Return the revision(s) recorded in ``alembic_version``; empty when never migrated."""
+
+    try:
+        with (engine or get_engine()).connect() as connection:
+            return frozenset(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+    except (OperationalError, ProgrammingError):
+        return frozenset()
+
+
+def init_db(*, force: bool = False) -> bool:
+    """Apply the latest database migrations using Alembic, unless the schema is already at head.
+
+    The check is a single ``SELECT`` against ``alembic_version``, so booting workers on an
+    up-to-date database neither loads the migration environment nor takes its locks.
+    Returns whether migrations were run.
+    """
+
+    if not force and get_current_revisions() == get_head_revisions():
+        return False
+    from alembic import command
 
     command.upgrade(_get_alembic_config(), "head")
+    return True
 
 
 @contextmanager
@@ -75,4 +248,26 @@ def get_session() -> Iterator[Session]:
     """FastAPI dependency that yields a database session."""
 
     with session_scope() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Async counterpart of :func:`session_scope`."""
+
+    session = get_async_sessionmaker()()
+    try:
+        yield session
+        await session.commit()
+    except Exception:  # pragma: no cover - defensive
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency that yields an async database session."""
+
+    async with async_session_scope() as session:
+        yield session
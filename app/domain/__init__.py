@@ -1,7 +1,7 @@
 """Domain package exports."""
 
 from .entities import RoleEntity, UserEntity
-from .services import AuthService, PermissionService, UserService
+from .services import AuthService, PermissionService, UserImportService, UserService
 from .value_objects import Email
 
 __all__ = [
@@ -10,5 +10,6 @@ __all__ = [
     "PermissionService",
     "RoleEntity",
     "UserEntity",
+    "UserImportService",
     "UserService",
 ]
\ No newline at end of file
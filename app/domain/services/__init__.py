@@ -2,6 +2,28 @@
 
 from .auth_service import AuthService
 from .permission_service import PermissionService
+from .principal_cache import get_principal_cache
+from .role_catalog import RoleCatalog, get_role_catalog, invalidate_role_catalog, load_role_catalog
+from .token_epoch import bump_token_epoch, get_token_epoch
+from .token_revocation import load_revocation_filter, refresh_revocation_filter
+from .user_import import ImportResult, ImportRow, UserImportService, parse_import_rows
 from .user_service import UserService
 
-__all__ = ["AuthService", "PermissionService", "UserService"]
\ No newline at end of file
+__all__ = [
+    "AuthService",
+    "ImportResult",
+    "ImportRow",
+    "PermissionService",
+    "RoleCatalog",
+    "UserImportService",
+    "UserService",
+    "bump_token_epoch",
+    "get_principal_cache",
+    "get_role_catalog",
+    "get_token_epoch",
+    "invalidate_role_catalog",
+    "load_revocation_filter",
+    "load_role_catalog",
+    "parse_import_rows",
+    "refresh_revocation_filter",
+]
\ No newline at end of file
@@ -1,37 +1,178 @@
 """Authentication domain logic."""
 
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from uuid import uuid4
 
-from app.core.security import create_access_token, decode_access_token, verify_password
+from app.core.config import get_settings
+from app.core.security import (
+    create_access_token,
+    decode_access_token,
+    generate_refresh_token,
+    hash_refresh_token,
+    issued_at_ms,
+    verify_and_update_password_async,
+)
+from app.db.repositories import AsyncRefreshTokenRepository, AsyncTokenRevocationRepository
 from app.domain.entities import UserEntity
+from app.domain.services.principal_cache import get_principal_cache
+from app.domain.services.token_epoch import get_token_epoch
+from app.domain.services.token_revocation import is_revoked, revoke_token, revoke_user_tokens, user_revoked_since
 from app.domain.services.user_service import UserService
+from app.domain.value_objects import Email
+from app.schemas.auth import TokenPayload
 
 
 class AuthService:
     """Coordinates authentication flows between HTTP and persistence layers."""
 
-    def __init__(self, user_service: UserService) -> None:
+    def __init__(
+        self,
+        user_service: UserService,
+        refresh_repo: AsyncRefreshTokenRepository | None = None,
+        revocation_repo: AsyncTokenRevocationRepository | None = None,
+    ) -> None:
         self.user_service = user_service
+        self.refresh_repo = refresh_repo
+        self.revocation_repo = revocation_repo
 
-    def register(self, *, email: str, password: str, full_name: str | None = None) -> UserEntity:
-        return self.user_service.create_user(email=email, password=password, full_name=full_name)
+    async def register(self, *, email: str, password: str, full_name: str | None = None) -> UserEntity:
+        return await self.user_service.create_user(email=email, password=password, full_name=full_name)
 
-    def authenticate(self, *, email: str, password: str) -> tuple[UserEntity, str]:
-        user = self.user_service.get_user_by_email(email)
-        if not user or not verify_password(password, self._get_hashed_password(email)):
+    async def authenticate(self, *, email: str, password: str) -> tuple[UserEntity, str]:
+        credentials = await self.user_service.user_repo.get_credentials(email)
+        if not credentials:
             raise ValueError("Invalid credentials")
-        if not user.is_active:
+        verified, new_hash = await verify_and_update_password_async(password, credentials.hashed_password)
+        if not verified:
+            raise ValueError("Invalid credentials")
+        if not credentials.is_active:
             raise ValueError("Inactive account")
-        token = create_access_token(subject=str(user.id), role_levels=user.role_levels)
-        return user, token
+        if new_hash is not None:
+            # The hash predates the configured scheme or cost; the upgrade was computed in
+            # the same pool job as the verification, so only the write remains.
+            await self.user_service.user_repo.update_password_hash(
+                credentials.id, old_hash=credentials.hashed_password, new_hash=new_hash
+            )
+        user = UserEntity(
+            id=credentials.id,
+            email=Email(credentials.email),
+            full_name=credentials.full_name,
+            is_active=credentials.is_active,
+            created_at=credentials.created_at,
+            role_levels=list(credentials.role_levels),
+        )
+        return user, self._access_token(user)
 
-    def _get_hashed_password(self, email: str) -> str:
-        model = self.user_service.user_repo.get_by_email(email)
-        if not model:
-            raise ValueError("User not found")
-        return model.hashed_password
+    @staticmethod
+    def _access_token(user: UserEntity) -> str:
+        return create_access_token(subject=str(user.id), email=str(user.email), role_levels=user.role_levels)
+
+    def _refresh_tokens(self) -> AsyncRefreshTokenRepository:
+        if self.refresh_repo is None:
+            raise RuntimeError("AuthService was created without a refresh token repository")
+        return self.refresh_repo
+
+    @staticmethod
+    def _refresh_expiry() -> datetime:
+        return datetime.utcnow() + timedelta(days=get_settings().refresh_token_expire_days)
+
+    async def issue_refresh_token(self, user: UserEntity) -> str:
+        """Start a new refresh token family for ``user`` (typically right after a password login)."""
+
+        token, digest = generate_refresh_token()
+        await self._refresh_tokens().create(
+            user_id=user.id, family_id=uuid4().hex, token_hash=digest, expires_at=self._refresh_expiry()
+        )
+        return token
+
+    async def refresh(self, refresh_token: str) -> tuple[UserEntity, str, str]:
+        """Exchange a refresh token for a new access token and the token's successor.
+
+        Each refresh token is single use. Presenting one that was already exchanged
+        means it has been copied, so its whole family is revoked and both the holder
+        of the copy and the legitimate client must log in again.
+        """
+
+        repo = self._refresh_tokens()
+        record = await repo.get_by_hash(hash_refresh_token(refresh_token))
+        if record is None or record.revoked_at is not None:
+            raise ValueError("Invalid refresh token")
+        if record.rotated_at is not None:
+            await repo.revoke_family(record.family_id)
+            raise ValueError("Refresh token reuse detected")
+        if record.expires_at <= datetime.utcnow():
+            raise ValueError("Refresh token expired")
+        # A rotation racing "log out everywhere" can commit a successor the bulk revoke
+        # did not see; it was created before the user-level entry, so it is refused here.
+        if self.revocation_repo is not None and await user_revoked_since(
+            record.user_id, record.created_at, self.revocation_repo
+        ):
+            await repo.revoke_family(record.family_id)
+            raise ValueError("Invalid refresh token")
+        user = await self.load_principal(record.user_id)
+        if user is None or not user.is_active:
+            await repo.revoke_family(record.family_id)
+            raise ValueError("Inactive account")
+        # Minted before the rotation commits, so a racing "log out everywhere" covers it too.
+        access_token = self._access_token(user)
+        token, digest = generate_refresh_token()
+        if not await repo.rotate(record, token_hash=digest, expires_at=self._refresh_expiry()):
+            await repo.revoke_family(record.family_id)  # lost a race against another use of the same token
+            raise ValueError("Refresh token reuse detected")
+        return user, access_token, token
+
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Revoke the family of ``refresh_token``, e.g. on logout; unknown tokens are ignored."""
+
+        repo = self._refresh_tokens()
+        record = await repo.get_by_hash(hash_refresh_token(refresh_token))
+        if record is not None:
+            await repo.revoke_family(record.family_id)
+
+    async def _ensure_not_revoked(self, payload: Dict[str, Any]) -> None:
+        # Services built without a revocation repository (scripts, benchmarks) skip the check.
+        if self.revocation_repo is not None and await is_revoked(payload, self.revocation_repo):
+            raise ValueError("Token has been revoked")
+
+    def _revocations(self) -> AsyncTokenRevocationRepository:
+        if self.revocation_repo is None:
+            raise RuntimeError("AuthService was created without a token revocation repository")
+        return self.revocation_repo
+
+    async def revoke_access_token(self, token: str) -> None:
+        """Revoke ``token`` alone, e.g. on logout; it is rejected from now on even before ``exp``."""
+
+        try:
+            payload = decode_access_token(token)
+        except ValueError as exc:
+            raise ValueError("Token validation failed") from exc
+        await revoke_token(payload, self._revocations())
+
+    async def logout_everywhere(self, user_id: int) -> None:
+        """Revoke every access and refresh token issued to ``user_id`` so far."""
+
+        # Refresh tokens first: a rotation in flight holds its token's row until it
+        # commits, so the user-level entry written afterwards is newer than any
+        # successor (and its access token) that the bulk revoke could not see.
+        await self._refresh_tokens().revoke_for_user(user_id)
+        await revoke_user_tokens(user_id, self._revocations())
+
+    async def load_principal(self, user_id: int) -> UserEntity | None:
+        """Return the user with their roles, from the principal cache when possible."""
 
-    def verify_token(self, token: str) -> UserEntity:
+        cache = get_principal_cache()
+        user = cache.get(user_id)
+        if user is None:
+            generation = cache.generation
+            user = await self.user_service.get_user(user_id)
+            if not user:
+                return None
+            cache.set(user_id, user, generation=generation)
+        return replace(user, role_levels=list(user.role_levels))
+
+    async def verify_token(self, token: str) -> UserEntity:
         try:
             payload = decode_access_token(token)
         except ValueError as exc:  # pragma: no cover - delegated to tests
@@ -39,11 +180,83 @@ class AuthService:
         subject = payload.get("sub")
         if subject is None:
             raise ValueError("Token missing subject")
-        user = self.user_service.get_user(int(subject))
-        if not user:
+        await self._ensure_not_revoked(payload)
+        user = await self.load_principal(int(subject))
+        if user is None:
             raise ValueError("User not found")
         return user
 
+    async def principal_from_token(self, token: str) -> UserEntity:
+        """Build the principal from verified claims alone, without a database lookup.
+
+        Tokens issued up to the user's token epoch (a role change or deactivation seen
+        by this process) are rejected, as are revoked tokens, which include those issued
+        before a change made through another worker; the revocation filter keeps that
+        check free of queries unless the token may have been revoked.
+        Tokens lacking the ``email`` claim predate stateless mode and fall back to
+        :meth:`verify_token`.
+        """
+
+        try:
+            payload = TokenPayload(**decode_access_token(token))
+        except ValueError as exc:
+            raise ValueError("Token validation failed") from exc
+        if payload.sub is None:
+            raise ValueError("Token missing subject")
+        if payload.email is None or payload.iat is None:
+            return await self.verify_token(token)
+        user_id = int(payload.sub)
+        claims = payload.dict()
+        epoch = get_token_epoch(user_id)
+        if epoch is not None and (issued_at_ms(claims) or 0) <= epoch:
+            raise ValueError("Token issued before the latest account change")
+        await self._ensure_not_revoked(claims)
+        return UserEntity(id=user_id, email=Email(payload.email), role_levels=list(payload.role_levels))
+
+    async def introspect(self, tokens: List[str]) -> List[tuple[Dict[str, Any], UserEntity] | None]:
+        """Verify many tokens and resolve all referenced users with one batched lookup.
+
+        Returns, in input order, the claims and current user of each token, or ``None``
+        when the token is invalid or revoked, or its user is missing or inactive.
+        """
+
+        payloads: List[Dict[str, Any] | None] = []
+        for token in tokens:
+            try:
+                payload = decode_access_token(token)
+            except ValueError:
+                payload = None
+            if payload and str(payload.get("sub", "")).isdigit():
+                try:
+                    await self._ensure_not_revoked(payload)
+                except ValueError:
+                    payload = None
+            else:
+                payload = None
+            payloads.append(payload)
+
+        cache = get_principal_cache()
+        users: Dict[int, UserEntity] = {}
+        missing: List[int] = []
+        for user_id in {int(payload["sub"]) for payload in payloads if payload}:
+            cached = cache.get(user_id)
+            if cached is None:
+                missing.append(user_id)
+            else:
+                users[user_id] = cached
+        if missing:
+            generation = cache.generation
+            loaded = await self.user_service.get_users(missing)
+            for user_id, user in loaded.items():
+                cache.set(user_id, user, generation=generation)
+            users.update(loaded)
+
+        results: List[tuple[Dict[str, Any], UserEntity] | None] = []
+        for payload in payloads:
+            user = users.get(int(payload["sub"])) if payload else None
+            results.append((payload, user) if payload and user and user.is_active else None)
+        return results
+
     def token_expired(self, token: str) -> bool:
         try:
             payload = decode_access_token(token)
@@ -52,4 +265,4 @@ class AuthService:
         exp = payload.get("exp")
         if exp is None:
             return True
-        return datetime.utcfromtimestamp(exp) <= datetime.utcnow()
\ No newline at end of file
+        return datetime.utcfromtimestamp(exp) <= datetime.utcnow()
@@ -0,0 +1,44 @@
+"""Process-local cache of resolved principals for token verification."""
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.metrics import register_cache
+from app.domain.entities import UserEntity
+from app.events import PermissionBatchEvent, PermissionEvent, UserChangedEvent, subscribe
+
+_cache: TTLCache[int, UserEntity] | None = None
+
+
+def get_principal_cache() -> TTLCache[int, UserEntity]:
+    """Return the per-process ``user id -> UserEntity`` cache configured from settings.
+
+    Entries are dropped as soon as a user or permission event is published in this
+    process; the TTL bounds staleness for changes made by other workers.
+    """
+
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = TTLCache(settings.principal_cache_size, settings.principal_cache_ttl_seconds)
+    return _cache
+
+
+def invalidate_principal(event: UserChangedEvent | PermissionEvent) -> None:
+    """Drop the cached principal referenced by ``event``."""
+
+    if _cache is not None:
+        _cache.pop(event.user_id)
+
+
+def invalidate_principals(event: PermissionBatchEvent) -> None:
+    """Drop every cached principal touched by a bulk role change."""
+
+    if _cache is not None:
+        for user_id in event.user_ids:
+            _cache.pop(user_id)
+
+
+subscribe(UserChangedEvent, invalidate_principal)
+subscribe(PermissionEvent, invalidate_principal)
+subscribe(PermissionBatchEvent, invalidate_principals)
+register_cache("principal", lambda: _cache.stats() if _cache is not None else None)
\ No newline at end of file
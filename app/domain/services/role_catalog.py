@@ -0,0 +1,77 @@
+"""Immutable, process-wide snapshot of the role table."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional
+
+from app.db.repositories import AsyncRoleRepository
+from app.domain.entities import RoleEntity
+from app.events import RolesChangedEvent, subscribe
+
+
+@dataclass(frozen=True)
+class RoleCatalog:
+    """Every role indexed by level, name and id.
+
+    A catalog is never mutated; a refresh builds a new one and swaps the module
+    reference, so readers always see a complete, consistent snapshot.
+    """
+
+    roles: tuple[RoleEntity, ...]
+    _by_level: Mapping[int, RoleEntity] = field(init=False, repr=False, compare=False)
+    _by_name: Mapping[str, RoleEntity] = field(init=False, repr=False, compare=False)
+    _by_id: Mapping[int, RoleEntity] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_level", MappingProxyType({role.level: role for role in self.roles}))
+        object.__setattr__(self, "_by_name", MappingProxyType({role.name: role for role in self.roles}))
+        object.__setattr__(self, "_by_id", MappingProxyType({role.id: role for role in self.roles}))
+
+    def get_by_level(self, level: int) -> Optional[RoleEntity]:
+        return self._by_level.get(level)
+
+    def get_by_name(self, name: str) -> Optional[RoleEntity]:
+        return self._by_name.get(name)
+
+    def get(self, role_id: int) -> Optional[RoleEntity]:
+        return self._by_id.get(role_id)
+
+    def list_roles(self) -> List[RoleEntity]:
+        return list(self.roles)
+
+
+_catalog: RoleCatalog | None = None
+
+
+def get_role_catalog() -> Optional[RoleCatalog]:
+    """Return the current snapshot, or ``None`` until one has been loaded."""
+
+    return _catalog
+
+
+def load_role_catalog(roles: Iterable[RoleEntity]) -> RoleCatalog:
+    """Build a snapshot from ``roles`` and publish it atomically."""
+
+    global _catalog
+    catalog = RoleCatalog(tuple(sorted(roles, key=lambda role: role.level)))
+    _catalog = catalog
+    return catalog
+
+
+async def current_role_catalog(role_repo: AsyncRoleRepository) -> RoleCatalog:
+    """Return the snapshot, loading it through ``role_repo`` with one query if none is loaded."""
+
+    catalog = _catalog
+    if catalog is None:
+        catalog = load_role_catalog(RoleEntity.from_orm(role) for role in await role_repo.list())
+    return catalog
+
+
+def invalidate_role_catalog(event: RolesChangedEvent | None = None) -> None:
+    """Discard the snapshot so the next reader reloads it from the database."""
+
+    global _catalog
+    _catalog = None
+
+
+subscribe(RolesChangedEvent, invalidate_role_catalog)
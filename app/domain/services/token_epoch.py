@@ -0,0 +1,60 @@
+"""Per-user token epochs used to reject stale stateless tokens.
+
+Epochs are kept in milliseconds in the memory of this process, so the worker that
+handled a change rejects older tokens at once. The change itself also writes a
+``user:<id>`` revocation entry (see ``UserRepository``), which is how the other
+workers learn of it.
+"""
+
+import threading
+import time
+from typing import Iterable
+
+from app.core.config import get_settings
+from app.events import PermissionBatchEvent, PermissionEvent, UserChangedEvent, subscribe
+
+_epochs: dict[int, int] = {}
+_lock = threading.Lock()
+
+
+def get_token_epoch(user_id: int) -> int | None:
+    """Return the UNIX time in milliseconds up to which tokens for ``user_id`` are no longer trusted."""
+
+    return _epochs.get(user_id)
+
+
+def bump_token_epoch(user_id: int, max_age_seconds: int | None = None) -> None:
+    """Distrust tokens issued for ``user_id`` until now.
+
+    Passing ``max_age_seconds`` (the access-token lifetime) also prunes epochs that
+    are older than any token that could still be valid.
+    """
+
+    bump_token_epochs([user_id], max_age_seconds)
+
+
+def bump_token_epochs(user_ids: Iterable[int], max_age_seconds: int | None = None) -> None:
+    """Distrust tokens issued until now for every user in ``user_ids``, under one lock."""
+
+    now = int(time.time() * 1000)
+    with _lock:
+        _epochs.update(dict.fromkeys(user_ids, now))
+        if max_age_seconds is not None:
+            cutoff = now - max_age_seconds * 1000
+            for stale in [key for key, epoch in _epochs.items() if epoch < cutoff]:
+                del _epochs[stale]
+
+
+def _on_user_event(event: UserChangedEvent | PermissionEvent) -> None:
+    if isinstance(event, UserChangedEvent) and event.reason == "created":
+        return
+    bump_token_epoch(event.user_id, get_settings().access_token_expire_minutes * 60)
+
+
+def _on_batch_event(event: PermissionBatchEvent) -> None:
+    bump_token_epochs(event.user_ids, get_settings().access_token_expire_minutes * 60)
+
+
+subscribe(UserChangedEvent, _on_user_event)
+subscribe(PermissionEvent, _on_user_event)
+subscribe(PermissionBatchEvent, _on_batch_event)
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""Access-token revocation: a table of revoked keys behind an in-memory Bloom filter.
+
+A token is covered by two keys: ``jti:<id>`` revokes that token alone and
+``user:<id>`` revokes every token of the user issued up to the entry's
+``revoked_at`` (logout everywhere), compared in milliseconds. Checking a token probes the filter for both keys
+and only reads the table when one of them may be present, so the common case of a
+token that was never revoked costs a few hash probes and no query.
+
+Every process rebuilds its filter from the table at start-up and then every
+``token_revocation_refresh_seconds``, pruning expired rows as it goes. Revocations
+made by this process are visible immediately; those made by other workers become
+visible at their next rebuild.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping
+
+from app.core.bloom import BloomFilter
+from app.core.config import get_settings
+from app.core.security import issued_at_ms
+from app.db.repositories import AsyncTokenRevocationRepository
+
+logger = logging.getLogger(__name__)
+
+MIN_CAPACITY = 1024
+
+_filter: BloomFilter | None = None
+# Keys revoked by this process, re-added to every rebuilt filter until the rebuild has
+# certainly loaded them from the table.
+_recent: Dict[str, float] = {}
+
+
+def _keys(payload: Mapping[str, Any]) -> List[str]:
+    keys = [f"jti:{payload['jti']}"] if payload.get("jti") else []
+    if payload.get("sub") is not None:
+        keys.append(f"user:{payload['sub']}")
+    return keys
+
+
+def _milliseconds(moment: datetime) -> int:
+    return int(moment.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def load_revocation_filter(keys: Iterable[str]) -> BloomFilter:
+    """Replace the filter with one holding ``keys`` and the recent local revocations."""
+
+    global _filter
+    settings = get_settings()
+    horizon = time.monotonic() - 2 * settings.token_revocation_refresh_seconds
+    for key in [key for key, added in _recent.items() if added < horizon]:
+        del _recent[key]
+    keys = [*keys, *_recent]
+    bloom = BloomFilter(max(2 * len(keys), MIN_CAPACITY), settings.token_revocation_false_positive_rate)
+    for key in keys:
+        bloom.add(key)
+    _filter = bloom
+    return bloom
+
+
+def _remember(key: str) -> None:
+    _recent[key] = time.monotonic()
+    if _filter is not None:
+        _filter.add(key)
+
+
+async def is_revoked(payload: Mapping[str, Any], repo: AsyncTokenRevocationRepository) -> bool:
+    """Return whether the verified claims ``payload`` belong to a revoked token."""
+
+    bloom = _filter
+    candidates = [key for key in _keys(payload) if bloom is None or key in bloom]
+    if not candidates:
+        return False
+    for key, record in (await repo.get_many(candidates)).items():
+        if key.startswith("jti:"):
+            return True
+        issued_ms = issued_at_ms(payload)
+        if issued_ms is None or issued_ms <= _milliseconds(record.revoked_at):
+            return True
+    return False
+
+
+async def user_revoked_since(user_id: int, moment: datetime, repo: AsyncTokenRevocationRepository) -> bool:
+    """Whether every token of ``user_id`` was revoked at or after ``moment`` (UTC).
+
+    Reads the table rather than the filter, so revocations by other workers count
+    immediately; meant for rare operations such as refreshing a token.
+    """
+
+    record = (await repo.get_many([f"user:{user_id}"])).get(f"user:{user_id}")
+    return record is not None and _milliseconds(moment) <= _milliseconds(record.revoked_at)
+
+
+async def revoke_token(payload: Mapping[str, Any], repo: AsyncTokenRevocationRepository) -> None:
+    """Revoke the single token with claims ``payload`` until it would have expired."""
+
+    if not payload.get("jti") or payload.get("exp") is None:
+        raise ValueError("Token cannot be revoked individually")
+    key = f"jti:{payload['jti']}"
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    await repo.revoke(key, revoked_at=datetime.utcnow(), expires_at=expires_at)
+    _remember(key)
+
+
+async def revoke_user_tokens(user_id: int, repo: AsyncTokenRevocationRepository) -> None:
+    """Revoke every access token issued to ``user_id`` until now."""
+
+    key = f"user:{user_id}"
+    now = datetime.utcnow()
+    expires_at = now + timedelta(minutes=get_settings().access_token_expire_minutes)
+    await repo.revoke(key, revoked_at=now, expires_at=expires_at)
+    _remember(key)
+
+
+async def refresh_revocation_filter(load_keys: Callable[[], Iterable[str]], interval: float) -> None:
+    """Rebuild the filter from ``load_keys()`` (run in a thread) every ``interval`` seconds, forever."""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            load_revocation_filter(await asyncio.to_thread(lambda: list(load_keys())))
+        except Exception:  # keep the previous filter; the next round retries
+            logger.exception("Rebuilding the token revocation filter failed")
@@ -0,0 +1,165 @@
+"""Bulk user import: parsing, validation and chunked persistence."""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+
+from app.db.repositories import AsyncRoleRepository, AsyncUserRepository
+from app.domain.services.role_catalog import current_role_catalog
+from app.domain.value_objects import Email
+from app.utils.password import PasswordHashingBusy, hash_passwords_async
+
+MIN_PASSWORD_LENGTH = 8
+# Inserting a chunk fails as a whole when one of its emails is registered between the
+# duplicate check and the insert; the check and insert are retried this many times.
+CHUNK_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    """One account to create, as read from the source file."""
+
+    line: int
+    email: str
+    password: str
+    full_name: str | None = None
+    role_level: int = 1
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """Outcome for one source row: ``created``, ``duplicate``, ``invalid`` or ``skipped``."""
+
+    line: int
+    email: str
+    status: str
+    error: str | None = None
+
+
+def _csv_records(data: str) -> Iterator[tuple[int, object]]:
+    reader = csv.DictReader(io.StringIO(data))
+    for record in reader:
+        # An empty cell is how CSV leaves a field out; NDJSON rows omit the key instead.
+        yield reader.line_num, {key: value if value != "" else None for key, value in record.items()}
+
+
+def _ndjson_records(data: str) -> Iterator[tuple[int, object]]:
+    for number, line in enumerate(data.splitlines(), start=1):
+        if line.strip():
+            yield number, line
+
+
+def parse_import_rows(data: str, fmt: str) -> Iterator[ImportRow | ImportResult]:
+    """Parse CSV (with a header row) or NDJSON; malformed rows come back as ``invalid`` results."""
+
+    if fmt == "csv":
+        records = _csv_records(data)
+    elif fmt == "ndjson":
+        records = _ndjson_records(data)
+    else:
+        raise ValueError(f"Unsupported import format {fmt!r}")
+
+    for line, record in records:
+        try:
+            fields = json.loads(record) if isinstance(record, str) else record
+            if not isinstance(fields, dict):
+                raise ValueError("Row must be an object")
+            level = fields.get("role_level")
+            if level is None:
+                level = 1
+            yield ImportRow(
+                line=line,
+                email=str(fields.get("email") or "").strip(),
+                password=str(fields.get("password") or ""),
+                full_name=fields.get("full_name") or None,
+                role_level=int(level),
+            )
+        except (TypeError, ValueError) as exc:  # TypeError: non-scalar values such as "role_level": [1]
+            yield ImportResult(line=line, email="", status="invalid", error=str(exc))
+
+
+class UserImportService:
+    """Creates accounts in bulk: set-based duplicate checks, parallel hashing, chunked inserts."""
+
+    def __init__(self, user_repo: AsyncUserRepository, role_repo: AsyncRoleRepository) -> None:
+        self.user_repo = user_repo
+        self.role_repo = role_repo
+
+    async def import_users(
+        self, rows: Iterable[ImportRow | ImportResult], chunk_size: int = 1000
+    ) -> List[ImportResult]:
+        """Create every valid, new row and return one result per input row, ordered by line."""
+
+        role_ids = {role.level: role.id for role in (await current_role_catalog(self.role_repo)).list_roles()}
+        results: List[ImportResult] = []
+        pending: List[ImportRow] = []
+        seen: set[str] = set()
+
+        for row in rows:
+            if isinstance(row, ImportResult):
+                results.append(row)
+                continue
+            error = self._validate(row, role_ids)
+            if error:
+                results.append(ImportResult(row.line, row.email, "invalid", error))
+            elif row.email.lower() in seen:
+                results.append(ImportResult(row.line, row.email, "duplicate", "Duplicate email in import"))
+            else:
+                seen.add(row.email.lower())
+                pending.append(row)
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start : start + chunk_size]
+            try:
+                results.extend(await self._import_chunk(chunk, role_ids))
+            except PasswordHashingBusy as exc:
+                results.extend(
+                    ImportResult(row.line, row.email, "skipped", str(exc)) for row in pending[start:]
+                )
+                break
+        return sorted(results, key=lambda result: result.line)
+
+    async def _import_chunk(self, chunk: List[ImportRow], role_ids: dict[int, int]) -> List[ImportResult]:
+        hashes: dict[int, str] = {}  # by line, so a retry does not hash the same password twice
+        for _ in range(CHUNK_ATTEMPTS):
+            existing = {email.lower() for email in await self.user_repo.existing_emails(row.email for row in chunk)}
+            fresh = [row for row in chunk if row.email.lower() not in existing]
+            unhashed = [row for row in fresh if row.line not in hashes]
+            hashed = await hash_passwords_async([row.password for row in unhashed])
+            hashes.update(zip((row.line for row in unhashed), hashed))
+            created = await self.user_repo.bulk_create(
+                [
+                    {
+                        "email": row.email,
+                        "hashed_password": hashes[row.line],
+                        "full_name": row.full_name,
+                        "role_id": role_ids[row.role_level],
+                    }
+                    for row in fresh
+                ]
+            )
+            if created:
+                return [
+                    ImportResult(row.line, row.email, "duplicate", "Email already registered")
+                    if row.email.lower() in existing
+                    else ImportResult(row.line, row.email, "created")
+                    for row in chunk
+                ]
+        return [
+            ImportResult(row.line, row.email, "skipped", "Conflicting concurrent registrations; import the row again")
+            for row in chunk
+        ]
+
+    @staticmethod
+    def _validate(row: ImportRow, role_ids: dict[int, int]) -> str | None:
+        try:
+            Email(row.email)
+        except ValueError:
+            return "Invalid email address"
+        if len(row.password) < MIN_PASSWORD_LENGTH:
+            return f"Password must be at least {MIN_PASSWORD_LENGTH} characters"
+        if row.role_level not in role_ids:
+            return f"Unknown role level {row.role_level}"
+        return None
@@ -1,51 +1,101 @@
 """Domain service for user operations."""
 
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from app.domain.entities import RoleEntity, UserEntity
 from app.domain.value_objects import Email
-from app.utils.password import hash_password
+from app.utils.password import hash_password_async
 from app.db.models import Role
-from app.db.repositories import RoleRepository, UserRepository
+from app.db.repositories import AsyncRoleRepository, AsyncUserRepository
+from app.domain.services.role_catalog import current_role_catalog
 
 
 class UserService:
-    """High-level user orchestration that mediates between repositories and entities."""
+    """High-level user orchestration that mediates between repositories and entities.
 
-    def __init__(self, user_repo: UserRepository, role_repo: RoleRepository) -> None:
+    Repository calls are awaited, so the service runs on top of the async repositories or
+    on sync repositories wrapped in :class:`~app.db.repositories.ThreadedRepository`.
+    """
+
+    def __init__(self, user_repo: AsyncUserRepository, role_repo: AsyncRoleRepository) -> None:
         self.user_repo = user_repo
         self.role_repo = role_repo
 
-    def list_users(self) -> List[UserEntity]:
-        return [UserEntity.from_orm(user) for user in self.user_repo.list()]
+    async def list_users(self, *, after: int | None = None, limit: int | None = None) -> List[UserEntity]:
+        users = await self.user_repo.list(after=after, limit=limit)
+        return [UserEntity.from_orm(user) for user in users]
 
-    def get_user(self, user_id: int) -> Optional[UserEntity]:
-        user = self.user_repo.get(user_id)
+    async def get_user(self, user_id: int) -> Optional[UserEntity]:
+        user = await self.user_repo.get(user_id)
         return UserEntity.from_orm(user) if user else None
 
-    def get_user_by_email(self, email: str) -> Optional[UserEntity]:
-        user = self.user_repo.get_by_email(email)
+    async def get_users(self, user_ids: Iterable[int]) -> Dict[int, UserEntity]:
+        """Resolve many users at once, keyed by id; unknown ids are omitted."""
+
+        ids = set(user_ids)
+        if not ids:
+            return {}
+        return {user.id: UserEntity.from_orm(user) for user in await self.user_repo.get_many(ids)}
+
+    async def get_user_by_email(self, email: str) -> Optional[UserEntity]:
+        user = await self.user_repo.get_by_email(email)
         return UserEntity.from_orm(user) if user else None
 
-    def create_user(self, *, email: str, password: str, full_name: str | None = None, default_level: int = 1) -> UserEntity:
+    async def create_user(
+        self, *, email: str, password: str, full_name: str | None = None, default_level: int = 1
+    ) -> UserEntity:
         Email(email)  # validation
-        if self.user_repo.get_by_email(email):
+        if await self.user_repo.get_by_email(email):
             raise ValueError("Email already registered")
-        hashed = hash_password(password)
-        role = self.role_repo.get_by_level(default_level)
-        roles: Iterable[Role] | None = [role] if role else None
-        user = self.user_repo.create(email=email, hashed_password=hashed, full_name=full_name, roles=roles)
+        hashed = await hash_password_async(password)
+        role = (await current_role_catalog(self.role_repo)).get_by_level(default_level)
+        roles: Iterable[Role] | None = [await self.role_repo.attach(role)] if role else None
+        user = await self.user_repo.create(email=email, hashed_password=hashed, full_name=full_name, roles=roles)
         return UserEntity.from_orm(user)
 
-    def assign_role(self, user_id: int, level: int) -> UserEntity:
-        user_model = self.user_repo.get(user_id)
+    async def assign_role(self, user_id: int, level: int) -> UserEntity:
+        user_model = await self.user_repo.get(user_id)
         if not user_model:
             raise ValueError("User not found")
-        role = self.role_repo.get_by_level(level)
+        role = (await current_role_catalog(self.role_repo)).get_by_level(level)
         if not role:
             raise ValueError("Role not found")
-        updated = self.user_repo.add_role(user_model, role)
+        updated = await self.user_repo.add_role(user_model, await self.role_repo.attach(role))
+        return UserEntity.from_orm(updated)
+
+    async def assign_role_bulk(
+        self, level: int, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Grant ``level`` to many users at once; returns the ids that did not already hold it.
+
+        Users are chosen by ``user_ids``, by currently holding ``has_level``, or by both.
+        """
+
+        role = await self._bulk_role(level, user_ids, has_level)
+        return await self.user_repo.grant_role_bulk(role, user_ids=user_ids, has_level=has_level)
+
+    async def revoke_role_bulk(
+        self, level: int, *, user_ids: Iterable[int] | None = None, has_level: int | None = None
+    ) -> List[int]:
+        """Revoke ``level`` from many users at once; returns the ids that held it."""
+
+        role = await self._bulk_role(level, user_ids, has_level)
+        return await self.user_repo.revoke_role_bulk(role, user_ids=user_ids, has_level=has_level)
+
+    async def _bulk_role(self, level: int, user_ids: Iterable[int] | None, has_level: int | None) -> RoleEntity:
+        if user_ids is None and has_level is None:
+            raise ValueError("Select users by id or by current role level")
+        role = (await current_role_catalog(self.role_repo)).get_by_level(level)
+        if not role:
+            raise ValueError("Role not found")
+        return role
+
+    async def set_active(self, user_id: int, is_active: bool) -> UserEntity:
+        user_model = await self.user_repo.get(user_id)
+        if not user_model:
+            raise ValueError("User not found")
+        updated = await self.user_repo.set_active(user_model, is_active)
         return UserEntity.from_orm(updated)
 
-    def list_roles(self) -> List[RoleEntity]:
-        return [RoleEntity.from_orm(role) for role in self.role_repo.list()]
\ No newline at end of file
+    async def list_roles(self) -> List[RoleEntity]:
+        return (await current_role_catalog(self.role_repo)).list_roles()
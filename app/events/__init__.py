@@ -1,5 +1,27 @@
-"""Event bus placeholder."""
+"""In-process domain event bus."""
 
-from .publishers.permission_events import PermissionEvent, publish_permission_granted
+from .publishers import (
+    PermissionBatchEvent,
+    PermissionEvent,
+    RolesChangedEvent,
+    UserChangedEvent,
+    publish_permission_batch,
+    publish_permission_granted,
+    publish_roles_changed,
+    publish_user_changed,
+)
+from .subscribers import dispatch, subscribe, unsubscribe
 
-__all__ = ["PermissionEvent", "publish_permission_granted"]
\ No newline at end of file
+__all__ = [
+    "PermissionBatchEvent",
+    "PermissionEvent",
+    "RolesChangedEvent",
+    "UserChangedEvent",
+    "dispatch",
+    "publish_permission_batch",
+    "publish_permission_granted",
+    "publish_roles_changed",
+    "publish_user_changed",
+    "subscribe",
+    "unsubscribe",
+]
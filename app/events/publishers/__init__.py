@@ -1,5 +1,21 @@
 """Publishers for domain events."""
 
-from .permission_events import PermissionEvent, publish_permission_granted
+from .permission_events import (
+    PermissionBatchEvent,
+    PermissionEvent,
+    publish_permission_batch,
+    publish_permission_granted,
+)
+from .role_events import RolesChangedEvent, publish_roles_changed
+from .user_events import UserChangedEvent, publish_user_changed
 
-__all__ = ["PermissionEvent", "publish_permission_granted"]
\ No newline at end of file
+__all__ = [
+    "PermissionBatchEvent",
+    "PermissionEvent",
+    "RolesChangedEvent",
+    "UserChangedEvent",
+    "publish_permission_batch",
+    "publish_permission_granted",
+    "publish_roles_changed",
+    "publish_user_changed",
+]
@@ -1,9 +1,11 @@
-"""Event publisher stubs for permission changes."""
+"""Event publishers for permission changes."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Callable
 
+from app.events.subscribers import dispatch
+
 
 @dataclass
 class PermissionEvent:
@@ -13,7 +15,24 @@ class PermissionEvent:
 
 
 def publish_permission_granted(event: PermissionEvent, sink: Callable[[PermissionEvent], None] | None = None) -> None:
-    """Publish a permission granted event. Defaults to logging via print."""
+    """Publish a permission granted event. Defaults to in-process subscribers."""
+
+    (sink or dispatch)(event)
+
+
+@dataclass
+class PermissionBatchEvent:
+    """One role granted to, or revoked from, many users in a single transaction."""
+
+    user_ids: tuple[int, ...]
+    role_level: int
+    granted: bool
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+def publish_permission_batch(
+    event: PermissionBatchEvent, sink: Callable[[PermissionBatchEvent], None] | None = None
+) -> None:
+    """Publish a bulk role change as one event. Defaults to in-process subscribers."""
 
-    sink = sink or (lambda evt: print(f"[permission_granted] {evt}"))  # pragma: no cover - logging helper
-    sink(event)
\ No newline at end of file
+    (sink or dispatch)(event)
@@ -0,0 +1,19 @@
+"""Event publishers for changes to the role table."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from app.events.subscribers import dispatch
+
+
+@dataclass
+class RolesChangedEvent:
+    levels: tuple[int, ...]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+def publish_roles_changed(event: RolesChangedEvent, sink: Callable[[RolesChangedEvent], None] | None = None) -> None:
+    """Publish that roles were created or altered. Defaults to in-process subscribers."""
+
+    (sink or dispatch)(event)
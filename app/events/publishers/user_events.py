@@ -0,0 +1,20 @@
+"""Event publishers for user account changes."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from app.events.subscribers import dispatch
+
+
+@dataclass
+class UserChangedEvent:
+    user_id: int
+    reason: str
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+def publish_user_changed(event: UserChangedEvent, sink: Callable[[UserChangedEvent], None] | None = None) -> None:
+    """Publish a user change (creation, activation, ...). Defaults to in-process subscribers."""
+
+    (sink or dispatch)(event)
@@ -1 +1,30 @@
-"""Subscriber registry placeholder for future integrations."""
\ No newline at end of file
+"""In-process subscriber registry for domain events."""
+
+from collections import defaultdict
+from typing import Any, Callable
+
+_handlers: dict[type, list[Callable[[Any], None]]] = defaultdict(list)
+
+
+def subscribe(event_type: type, handler: Callable[[Any], None]) -> None:
+    """Register ``handler`` to be called for every published ``event_type``."""
+
+    if handler not in _handlers[event_type]:
+        _handlers[event_type].append(handler)
+
+
+def unsubscribe(event_type: type, handler: Callable[[Any], None]) -> None:
+    """Remove a handler registered with :func:`subscribe`."""
+
+    if handler in _handlers[event_type]:
+        _handlers[event_type].remove(handler)
+
+
+def dispatch(event: Any) -> None:
+    """Deliver ``event`` synchronously to the handlers registered for its type."""
+
+    for handler in list(_handlers.get(type(event), ())):
+        handler(event)
+
+
+__all__ = ["dispatch", "subscribe", "unsubscribe"]
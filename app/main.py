@@ -1,16 +1,26 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+import asyncio
+from datetime import datetime
+from typing import Any, List
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import RedirectResponse
+from starlette.responses import JSONResponse, RedirectResponse
 
-from app.api import api_router
+from app.api import api_router, metrics_router
+from app.api.middleware import MetricsMiddleware, QueryStatsMiddleware
 from app.core.config import get_settings
-from app.db.repositories import RoleRepository, UserRepository
-from app.db.session import init_db, session_scope
-from app.utils.password import hash_password
+from app.core.rate_limit import LoginThrottled, build_login_throttle
+from app.db.repositories import RoleRepository, TokenRevocationRepository, UserRepository
+from app.db.session import dispose_async_engine, init_db, session_scope
+from app.domain.entities import RoleEntity
+from app.domain.services import load_revocation_filter, load_role_catalog, refresh_revocation_filter
+from app.utils.password import PasswordHashingBusy, hash_password, shutdown_password_hasher
 from app.web import web_router
+from app.web.rendering import precompile_templates
+from app.web.sessions import build_session_store
 
 ROLE_PRESETS = {
     1: "Viewer",
@@ -21,9 +31,21 @@ ROLE_PRESETS = {
 }
 
 
+def _active_revocation_keys() -> List[str]:
+    """Prune expired revocations and return the keys still in force."""
+
+    now = datetime.utcnow()
+    with session_scope() as session:
+        repo = TokenRevocationRepository(session)
+        repo.prune(now)
+        return repo.active_keys(now)
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
     app = FastAPI(title=settings.app_name)
+    app.state.login_throttle = build_login_throttle(settings)
+    app.state.session_store = build_session_store(settings)
 
     app.add_middleware(
         CORSMiddleware,
@@ -33,33 +55,79 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_middleware(QueryStatsMiddleware, server_timing=settings.server_timing)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
     app.include_router(api_router)
     app.include_router(web_router)
 
     app.mount("/static", StaticFiles(directory="app/web/static"), name="static")
 
+    @app.exception_handler(PasswordHashingBusy)
+    async def password_hashing_busy(request: Request, exc: PasswordHashingBusy) -> JSONResponse:
+        return JSONResponse(
+            {"detail": str(exc)},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(LoginThrottled)
+    async def login_throttled(request: Request, exc: LoginThrottled) -> JSONResponse:
+        return JSONResponse(
+            {"detail": str(exc)},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": exc.retry_after_header},
+        )
+
     @app.get("/", include_in_schema=False)
     async def root_redirect() -> RedirectResponse:
         return RedirectResponse(url="/auth/login", status_code=307)
 
     @app.on_event("startup")
     def on_startup() -> None:
-        init_db()
+        if settings.migrate_on_startup:
+            init_db()
         with session_scope() as session:
             role_repo = RoleRepository(session)
             user_repo = UserRepository(session)
             role_repo.ensure_roles(ROLE_PRESETS)
+            catalog = load_role_catalog(RoleEntity.from_orm(role) for role in role_repo.list())
             if not user_repo.get_by_email(settings.superuser_email):
-                admin_role = role_repo.get_by_level(5)
-                roles = [admin_role] if admin_role else None
+                admin_role = catalog.get_by_level(5)
+                roles = [role_repo.attach(admin_role)] if admin_role else None
                 user_repo.create(
                     email=settings.superuser_email,
                     hashed_password=hash_password(settings.superuser_password),
                     full_name="System Administrator",
                     roles=roles,
                 )
+        load_revocation_filter(_active_revocation_keys())
+        precompile_templates()
+
+    @app.on_event("startup")
+    async def start_background_tasks() -> None:
+        app.state.revocation_refresher = asyncio.create_task(
+            refresh_revocation_filter(_active_revocation_keys, settings.token_revocation_refresh_seconds)
+        )
+
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        app.state.revocation_refresher.cancel()
+        await dispose_async_engine()
+        await app.state.login_throttle.close()
+        if app.state.session_store is not None:
+            await app.state.session_store.close()
+        shutdown_password_hasher()
 
     return app
 
 
-app = create_app()
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+    # ``app.main:app`` is built on first access, so importing ``create_app`` (e.g. from
+    # scripts/generate_openapi.py) does not construct and configure a second application.
+    if name == "app":
+        application = globals()["app"] = create_app()
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
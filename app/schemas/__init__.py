@@ -1,17 +1,43 @@
 """Pydantic schema exports."""
 
-from .auth import LoginRequest, RegisterRequest, Token, TokenPayload
+from .auth import (
+    IntrospectionRequest,
+    IntrospectionResponse,
+    LoginRequest,
+    RefreshRequest,
+    RegisterRequest,
+    Token,
+    TokenIntrospection,
+    TokenPayload,
+)
 from .permission import RoleRead
-from .user import UserBase, UserCreate, UserRead, UserUpdate
+from .user import (
+    BulkRoleChange,
+    BulkRoleChangeResult,
+    UserBase,
+    UserCreate,
+    UserImportReport,
+    UserImportResult,
+    UserRead,
+    UserUpdate,
+)
 
 __all__ = [
+    "BulkRoleChange",
+    "BulkRoleChangeResult",
+    "IntrospectionRequest",
+    "IntrospectionResponse",
     "LoginRequest",
+    "RefreshRequest",
     "RegisterRequest",
     "RoleRead",
     "Token",
+    "TokenIntrospection",
     "TokenPayload",
     "UserBase",
     "UserCreate",
+    "UserImportReport",
+    "UserImportResult",
     "UserRead",
     "UserUpdate",
 ]
\ No newline at end of file
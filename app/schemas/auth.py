@@ -9,11 +9,16 @@ class Token(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field("bearer", description="Token type indicator")
     expires_at: datetime | None = Field(None, description="Optional expiry timestamp")
+    refresh_token: str | None = Field(None, description="Single-use token for POST /api/v1/auth/refresh")
 
 
 class TokenPayload(BaseModel):
     sub: str | None = None
     exp: int | None = None
+    iat: int | None = None
+    iat_ms: int | None = None
+    jti: str | None = None
+    email: str | None = None
     role_levels: list[int] = Field(default_factory=list)
 
 
@@ -22,7 +27,31 @@ class LoginRequest(BaseModel):
     password: str = Field(min_length=8)
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(..., min_length=1, max_length=128)
+
+
 class RegisterRequest(BaseModel):
     email: EmailStr
     password: str = Field(min_length=8)
-    full_name: str | None = None
\ No newline at end of file
+    full_name: str | None = None
+
+
+class IntrospectionRequest(BaseModel):
+    tokens: list[str] = Field(..., min_items=1, max_items=1000, description="Access tokens to introspect")
+
+
+class TokenIntrospection(BaseModel):
+    """RFC 7662 style introspection result for a single token."""
+
+    active: bool
+    sub: str | None = None
+    username: str | None = None
+    token_type: str | None = None
+    exp: int | None = None
+    iat: int | None = None
+    role_levels: list[int] | None = None
+
+
+class IntrospectionResponse(BaseModel):
+    results: list[TokenIntrospection]
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, root_validator
 
 
 class UserBase(BaseModel):
@@ -26,4 +26,35 @@ class UserRead(UserBase):
 
 class UserUpdate(BaseModel):
     full_name: str | None = None
-    is_active: bool | None = None
\ No newline at end of file
+    is_active: bool | None = None
+
+
+class UserImportResult(BaseModel):
+    line: int
+    email: str
+    status: str = Field(..., description="created, duplicate, invalid or skipped")
+    error: str | None = None
+
+
+class UserImportReport(BaseModel):
+    created: int
+    failed: int
+    results: list[UserImportResult]
+
+
+class BulkRoleChange(BaseModel):
+    level: int = Field(..., ge=1, le=5, description="Role level to grant or revoke")
+    user_ids: list[int] | None = Field(None, max_items=50_000, description="Users to change")
+    has_level: int | None = Field(None, ge=1, le=5, description="Also (or instead) select users holding this level")
+
+    @root_validator(skip_on_failure=True)
+    def _requires_selection(cls, values: dict) -> dict:  # noqa: N805 - pydantic validator signature
+        if values.get("user_ids") is None and values.get("has_level") is None:
+            raise ValueError("Provide user_ids, has_level, or both")
+        return values
+
+
+class BulkRoleChangeResult(BaseModel):
+    level: int
+    granted: bool
+    changed: list[int]
@@ -1,6 +1,13 @@
 """Utility helpers for AuthService."""
 
 from .jwt import decode as decode_jwt, encode as encode_jwt
-from .password import hash_password, verify_password
+from .password import hash_password, hash_password_async, verify_password, verify_password_async
 
-__all__ = ["decode_jwt", "encode_jwt", "hash_password", "verify_password"]
\ No newline at end of file
+__all__ = [
+    "decode_jwt",
+    "encode_jwt",
+    "hash_password",
+    "hash_password_async",
+    "verify_password",
+    "verify_password_async",
+]
\ No newline at end of file
@@ -3,26 +3,22 @@
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
-from jose import JWTError, jwt
-
 from app.core.config import get_settings
-
-settings = get_settings()
+from app.core.keys import get_key_ring
+from app.core.token_cache import decode_cached
 
 
 def encode(payload: Dict[str, Any], expires_minutes: int | None = None) -> str:
     """Encode the provided payload into a signed JWT."""
 
+    settings = get_settings()
     to_encode = payload.copy()
     expire = datetime.utcnow() + timedelta(minutes=expires_minutes or settings.access_token_expire_minutes)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return get_key_ring().sign(to_encode)
 
 
 def decode(token: str) -> Dict[str, Any]:
-    """Decode a JWT token."""
+    """Decode a JWT token through the shared decoded-token cache."""
 
-    try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError as exc:  # pragma: no cover
-        raise ValueError("Invalid token") from exc
\ No newline at end of file
+    return decode_cached(token)
\ No newline at end of file
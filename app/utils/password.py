@@ -1,17 +1,230 @@
 """Password hashing utilities."""
 
-from passlib.context import CryptContext
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, TypeVar
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import get_settings
+from app.core.metrics import STAGE_DURATION
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+# Passwords per pool job in bulk hashing; about two seconds of work at bcrypt cost 12.
+HASH_BATCH_SIZE = 8
+
+
+class PasswordHashingBusy(RuntimeError):
+    """Raised when the hashing pool has no free slot; mapped to HTTP 503."""
+
+
+def _context_options(scheme: str, **params: int) -> Dict[str, Any]:
+    """passlib options for ``scheme``; ``params`` use the names of the settings without prefix."""
+
+    if scheme == "argon2":
+        return {
+            "argon2__type": "ID",
+            "argon2__rounds": params["time_cost"],
+            "argon2__memory_cost": params["memory_cost_kib"],
+            "argon2__parallelism": params["parallelism"],
+        }
+    # ``rounds`` (rather than ``default_rounds``) makes hashes of any other cost count as outdated.
+    return {"bcrypt__rounds": params["rounds"]}
+
+
+@lru_cache()
+def _pwd_context() -> "CryptContext":
+    """Build the passlib context on first use; passlib and its hash backends are slow to import.
+
+    New hashes use the configured scheme and cost. Hashes made with another scheme or
+    cost still verify but are reported by ``needs_update``, so logins can upgrade them.
+    """
+
+    from passlib.context import CryptContext
+
+    settings = get_settings()
+    scheme = settings.password_hash_scheme
+    options = {
+        **_context_options("bcrypt", rounds=settings.bcrypt_rounds),
+        **(
+            _context_options(
+                "argon2",
+                time_cost=settings.argon2_time_cost,
+                memory_cost_kib=settings.argon2_memory_cost_kib,
+                parallelism=settings.argon2_parallelism,
+            )
+            if scheme == "argon2"
+            else {}
+        ),
+    }
+    schemes = [scheme] + [other for other in ("bcrypt",) if other != scheme]
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
 
 
 def hash_password(plain_password: str) -> str:
-    """Return a bcrypt hash for the provided password."""
+    """Hash the password with the configured scheme (bcrypt or argon2id) and cost."""
 
-    return _pwd_context.hash(plain_password)
+    return _pwd_context().hash(plain_password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify that the plain password matches the stored hash."""
 
-    return _pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return _pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, str | None]:
+    """Verify a password and, if its hash is outdated, return a fresh hash computed in the same call."""
+
+    return _pwd_context().verify_and_update(plain_password, hashed_password)
+
+
+def calibrate(scheme: str, target_seconds: float, **params: int) -> Dict[str, int]:
+    """Pick the largest cost whose hash time on this host stays within ``target_seconds``.
+
+    For bcrypt this chooses ``rounds`` (each step doubles the work); for argon2 it
+    chooses ``time_cost`` for the given ``memory_cost_kib`` and ``parallelism``.
+    Returns the chosen parameters under their setting names.
+    """
+
+    from passlib.context import CryptContext
+
+    def measure(**cost: int) -> float:
+        context = CryptContext(schemes=[scheme], **_context_options(scheme, **params, **cost))
+        context.hash("calibration-password")  # warm up the backend
+        started = time.perf_counter()
+        context.hash("calibration-password")
+        return time.perf_counter() - started
+
+    knob, cost, limit = ("rounds", 4, 31) if scheme == "bcrypt" else ("time_cost", 1, 64)
+    while cost < limit and measure(**{knob: cost + 1}) <= target_seconds:
+        cost += 1
+    return {**params, knob: cost}
+
+
+def hash_passwords(plain_passwords: List[str]) -> List[str]:
+    """Hash a batch of passwords; one pool job per batch keeps IPC overhead low."""
+
+    return [_pwd_context().hash(password) for password in plain_passwords]
+
+
+class PasswordHasher:
+    """Runs CPU-bound hashing in a process pool with bounded admission.
+
+    At most ``workers + queue_size`` jobs may be pending at once; further callers fail
+    immediately with :class:`PasswordHashingBusy` instead of queueing without limit.
+    A ``workers`` value of 0 falls back to the event loop's default thread executor.
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.capacity = max(workers, 1) + queue_size
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor | None:
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusy("Password hashing capacity exhausted, retry shortly")
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+        finally:
+            self._slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hashing pool configured from settings."""
+
+    global _hasher
+    if _hasher is None:
+        settings = get_settings()
+        _hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_queue_size)
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Stop the hashing pool; it is recreated lazily on next use."""
+
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+    _hasher = None
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+
+    with STAGE_DURATION.time("hash_password"):
+        return await get_password_hasher().run(hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+
+    with STAGE_DURATION.time("verify_password"):
+        return await get_password_hasher().run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, str | None]:
+    """Verify a password and compute its upgraded hash, if any, in a single hashing-pool job."""
+
+    with STAGE_DURATION.time("verify_password"):
+        return await get_password_hasher().run(verify_and_update_password, plain_password, hashed_password)
+
+
+async def hash_passwords_async(plain_passwords: List[str], batch_size: int = HASH_BATCH_SIZE) -> List[str]:
+    """Hash many passwords on the hashing pool, preserving order.
+
+    Work is submitted in jobs of ``batch_size`` with at most ``workers - 1`` (at least
+    one) in flight, so a bulk import neither queues its whole workload ahead of
+    interactive logins nor takes every admission slot: logins reach a free worker, or
+    the next one to finish a short batch.
+    """
+
+    hasher = get_password_hasher()
+    if not plain_passwords:
+        return []
+    batches = [plain_passwords[start : start + batch_size] for start in range(0, len(plain_passwords), batch_size)]
+    results: List[List[str]] = [[] for _ in batches]
+    pending = iter(enumerate(batches))
+
+    async def drain() -> None:
+        for index, batch in pending:
+            results[index] = await hasher.run(hash_passwords, batch)
+
+    lanes = [asyncio.ensure_future(drain()) for _ in range(min(max(hasher.workers - 1, 1), len(batches)))]
+    with STAGE_DURATION.time("hash_password_batch"):
+        try:
+            await asyncio.gather(*lanes)
+        except BaseException:
+            for lane in lanes:
+                lane.cancel()
+            raise
+    return [hashed for batch in results for hashed in batch]
@@ -0,0 +1,161 @@
+"""Template rendering for the SSR pages.
+
+Compiled templates are kept in a Jinja bytecode cache on disk, which
+:func:`precompile_templates` fills at deploy or start-up so that no request pays for
+compiling one. Pages whose HTML is the same for every visitor are rendered once per
+locale by :func:`render_page` and then served from memory, gzipped when the client
+accepts it and answered with 304 when its ``If-None-Match`` still matches. A cached
+page is rendered again as soon as its template, or any template it extends or
+includes, changes on disk.
+"""
+
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.cache import CacheStats
+from app.core.config import get_settings
+from app.core.metrics import register_cache
+
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+    from jinja2 import Environment
+
+TEMPLATES_DIR = "app/web/templates"
+DEFAULT_LOCALE = "ko"
+
+
+@lru_cache()
+def get_templates() -> "Jinja2Templates":
+    """Return the shared Jinja2 environment, created (and Jinja imported) on first render."""
+
+    from fastapi.templating import Jinja2Templates
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = get_settings().template_cache_dir
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    return Jinja2Templates(directory=TEMPLATES_DIR, bytecode_cache=FileSystemBytecodeCache(cache_dir))
+
+
+def precompile_templates() -> int:
+    """Compile every template into the bytecode and in-memory caches; returns how many."""
+
+    env = get_templates().env
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+@dataclass(frozen=True)
+class _RenderedPage:
+    body: bytes
+    gzipped: bytes
+    digest: str
+    sources: Tuple[Tuple[str, float], ...]  # (path, mtime) of the template and its dependencies
+
+    def is_current(self) -> bool:
+        try:
+            return all(os.stat(path).st_mtime == mtime for path, mtime in self.sources)
+        except OSError:
+            return False
+
+
+_pages: Dict[Tuple[str, str], _RenderedPage] = {}
+_hits = 0
+_misses = 0
+
+
+def _template_sources(env: "Environment", name: str) -> Tuple[Tuple[str, float], ...]:
+    from jinja2 import meta
+
+    seen: Dict[str, float] = {}
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        source, filename, _ = env.loader.get_source(env, current)  # type: ignore[union-attr]
+        if filename is None or filename in seen:
+            continue
+        seen[filename] = os.stat(filename).st_mtime
+        pending.extend(ref for ref in meta.find_referenced_templates(env.parse(source)) if ref)
+    return tuple(seen.items())
+
+
+def _render(request: Request, name: str, locale: str) -> _RenderedPage:
+    env = get_templates().env
+    # Stat before rendering: an edit racing the render then only costs one more render.
+    sources = _template_sources(env, name)
+    body = env.get_template(name).render(request=request, locale=locale).encode()
+    return _RenderedPage(
+        body=body,
+        gzipped=gzip.compress(body, compresslevel=9),
+        digest=hashlib.blake2b(body, digest_size=16).hexdigest(),
+        sources=sources,
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether ``Accept-Encoding`` allows gzip: listed (or matched by ``*``) with a non-zero q-value."""
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding.strip()] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+def render_page(request: Request, name: str, *, locale: str = DEFAULT_LOCALE) -> Response:
+    """Serve template ``name``, which must not depend on the request, from the page cache."""
+
+    global _hits, _misses
+    page = _pages.get((name, locale))
+    if page is not None and page.is_current():
+        _hits += 1
+    else:
+        _misses += 1
+        page = _pages[(name, locale)] = _render(request, name, locale)
+
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    # Each encoding is a different representation and needs its own validator.
+    etag = f'"{page.digest}-gzip"' if use_gzip else f'"{page.digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding", "Content-Language": locale}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(page.gzipped, media_type="text/html", headers=headers)
+    return Response(page.body, media_type="text/html", headers=headers)
+
+
+def _page_cache_stats() -> CacheStats | None:
+    if not _hits and not _misses:
+        return None
+    return CacheStats(hits=_hits, misses=_misses, evictions=0, size=len(_pages), maxsize=len(_pages))
+
+
+register_cache("page", _page_cache_stats)
@@ -2,36 +2,76 @@
 
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, Form, Request, status
+from fastapi import APIRouter, Depends, Form, Request, Response, status
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 
-from app.api.dependencies import get_auth_service
+from app.api.dependencies import get_auth_service, get_login_throttle, get_session_store
 from app.core.config import get_settings
+from app.core.rate_limit import LoginThrottle, LoginThrottled
 from app.domain import AuthService, UserEntity
+from app.web.rendering import get_templates, render_page
+from app.web.sessions import SESSION_COOKIE, SessionStore
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/web/templates")
-settings = get_settings()
 
 
 def _context(request: Request, **extra):
     return {"request": request, **extra}
 
 
-def _current_user(request: Request, auth_service: AuthService) -> UserEntity | None:
+def _set_session_cookies(response: Response, token: str, refresh_token: str) -> None:
+    settings = get_settings()
+    response.set_cookie("access_token", token, httponly=True, max_age=settings.access_token_expire_minutes * 60)
+    response.set_cookie(
+        "refresh_token",
+        refresh_token,
+        httponly=True,
+        max_age=settings.refresh_token_expire_days * 86400,
+        path="/auth",  # only the SSR pages need it; keeps it out of API requests
+    )
+
+
+async def _current_user(
+    request: Request, auth_service: AuthService, sessions: SessionStore | None
+) -> tuple[UserEntity | None, tuple[str, str] | None]:
+    """Resolve the signed-in user, renewing an expired access cookie from the refresh cookie.
+
+    A server-side session, when there is one, answers without touching the tokens.
+    Returns the user and, when the token session was renewed, the new access and
+    refresh tokens that the caller must set on its response.
+    """
+
+    session_id = request.cookies.get(SESSION_COOKIE)
+    if sessions is not None and session_id:
+        session = await sessions.get(session_id)
+        if session is not None:
+            if not session.is_stale(get_settings().access_token_expire_minutes * 60):
+                return session.user, None
+            user = await auth_service.load_principal(session.user.id or 0)
+            if user is None or not user.is_active:
+                await sessions.delete(session_id)
+                return None, None
+            await sessions.replace(session_id, user)
+            return user, None
     token = request.cookies.get("access_token")
-    if not token:
-        return None
+    if token:
+        try:
+            return await auth_service.verify_token(token), None
+        except ValueError:
+            pass
+    refresh_token = request.cookies.get("refresh_token")
+    if not refresh_token:
+        return None, None
     try:
-        return auth_service.verify_token(token)
+        user, token, refresh_token = await auth_service.refresh(refresh_token)
     except ValueError:
-        return None
+        return None, None
+    return user, (token, refresh_token)
 
 
 @router.get("/login", name="login")
 async def login_form(request: Request) -> RedirectResponse | object:
-    return templates.TemplateResponse("auth/login.html", _context(request))
+    return render_page(request, "auth/login.html")
 
 
 @router.post("/login")
@@ -40,29 +80,39 @@ async def login_submit(
     email: str = Form(...),
     password: str = Form(...),
     auth_service: AuthService = Depends(get_auth_service),
+    throttle: LoginThrottle = Depends(get_login_throttle),
+    sessions: SessionStore | None = Depends(get_session_store),
 ):
     try:
-        _, token = auth_service.authenticate(email=email, password=password)
+        await throttle.check(request.client.host if request.client else None, email)
+    except LoginThrottled as exc:
+        return get_templates().TemplateResponse(
+            "auth/login.html",
+            _context(request, error="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요."),
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": exc.retry_after_header},
+        )
+    try:
+        user, token = await auth_service.authenticate(email=email, password=password)
     except ValueError:
-        return templates.TemplateResponse(
+        await throttle.record_failure(email)
+        return get_templates().TemplateResponse(
             "auth/login.html",
             _context(request, error="이메일 또는 비밀번호가 올바르지 않습니다."),
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
 
     response = RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
-    response.set_cookie(
-        "access_token",
-        token,
-        httponly=True,
-        max_age=settings.access_token_expire_minutes * 60,
-    )
+    if sessions is not None:
+        response.set_cookie(SESSION_COOKIE, await sessions.create(user), httponly=True, samesite="lax")
+    else:
+        _set_session_cookies(response, token, await auth_service.issue_refresh_token(user))
     return response
 
 
 @router.get("/register", name="register")
 async def register_form(request: Request) -> object:
-    return templates.TemplateResponse("auth/register.html", _context(request))
+    return render_page(request, "auth/register.html")
 
 
 @router.post("/register")
@@ -74,9 +124,9 @@ async def register_submit(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     try:
-        auth_service.register(email=email, password=password, full_name=full_name or None)
+        await auth_service.register(email=email, password=password, full_name=full_name or None)
     except ValueError as exc:
-        return templates.TemplateResponse(
+        return get_templates().TemplateResponse(
             "auth/register.html",
             _context(request, error=str(exc)),
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -86,30 +136,62 @@ async def register_submit(
 
 
 @router.get("/logout")
-async def logout() -> RedirectResponse:
+async def logout(
+    request: Request,
+    auth_service: AuthService = Depends(get_auth_service),
+    sessions: SessionStore | None = Depends(get_session_store),
+) -> RedirectResponse:
+    session_id = request.cookies.get(SESSION_COOKIE)
+    if sessions is not None and session_id:
+        await sessions.delete(session_id)
+    refresh_token = request.cookies.get("refresh_token")
+    if refresh_token:
+        await auth_service.revoke_refresh_token(refresh_token)
+    token = request.cookies.get("access_token")
+    if token:
+        try:
+            await auth_service.revoke_access_token(token)
+        except ValueError:
+            pass  # expired or invalid: nothing left to revoke
     response = RedirectResponse(url="/auth/login", status_code=status.HTTP_303_SEE_OTHER)
     response.delete_cookie("access_token")
+    response.delete_cookie("refresh_token", path="/auth")
+    response.delete_cookie(SESSION_COOKIE)
     return response
 
 
 @router.get("/profile")
-async def profile(request: Request, auth_service: AuthService = Depends(get_auth_service)) -> object:
-    user = _current_user(request, auth_service)
+async def profile(
+    request: Request,
+    auth_service: AuthService = Depends(get_auth_service),
+    sessions: SessionStore | None = Depends(get_session_store),
+) -> object:
+    user, renewed = await _current_user(request, auth_service, sessions)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=status.HTTP_303_SEE_OTHER)
-    return templates.TemplateResponse("auth/profile.html", _context(request, user=user))
+    response = get_templates().TemplateResponse("auth/profile.html", _context(request, user=user))
+    if renewed:
+        _set_session_cookies(response, *renewed)
+    return response
 
 
 @router.get("/dashboard")
-async def dashboard(request: Request, auth_service: AuthService = Depends(get_auth_service)) -> object:
-    user = _current_user(request, auth_service)
+async def dashboard(
+    request: Request,
+    auth_service: AuthService = Depends(get_auth_service),
+    sessions: SessionStore | None = Depends(get_session_store),
+) -> object:
+    user, renewed = await _current_user(request, auth_service, sessions)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=status.HTTP_303_SEE_OTHER)
-    return templates.TemplateResponse(
+    response = get_templates().TemplateResponse(
         "auth/dashboard.html",
         _context(
             request,
             user=user,
-            expires_in=timedelta(minutes=settings.access_token_expire_minutes),
+            expires_in=timedelta(minutes=get_settings().access_token_expire_minutes),
         ),
-    )
\ No newline at end of file
+    )
+    if renewed:
+        _set_session_cookies(response, *renewed)
+    return response
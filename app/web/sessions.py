@@ -0,0 +1,244 @@
+"""Server-side sessions for the SSR pages.
+
+With ``web_session_backend`` set, signing in through the login form stores the
+resolved :class:`UserEntity` under a random id and the browser only carries that id
+in the ``session_id`` cookie. Rendering a page is then a store lookup: no JWT is
+decoded and, with the in-memory store, no query runs. Every lookup slides the
+expiry forward by ``web_session_ttl_seconds``.
+
+A stored user is reloaded once it is older than an access token may be, or as soon
+as this process has bumped the user's token epoch (a role change or deactivation),
+so a session is never staler than a stateless access token would be. "Log out
+everywhere" drops all of a user's sessions at once.
+
+The in-memory store is per process, so it suits a single worker or sticky routing;
+the database store shares sessions between workers at the cost of one primary-key
+lookup per page.
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Protocol
+
+from fastapi.concurrency import contextmanager_in_threadpool
+
+from app.core.config import Settings, get_settings
+from app.db.repositories import AsyncWebSessionRepository, ThreadedRepository, WebSessionRepository
+from app.db.session import async_session_scope, session_scope
+from app.domain import Email, UserEntity
+from app.domain.services import get_token_epoch
+
+SESSION_COOKIE = "session_id"
+
+
+@dataclass(frozen=True)
+class WebSession:
+    """A stored sign-in: the user as resolved at ``loaded_at`` (UNIX time)."""
+
+    user: UserEntity
+    loaded_at: float
+
+    def is_stale(self, max_age: float) -> bool:
+        """Whether ``user`` must be reloaded before it can be trusted again."""
+
+        if time.time() - self.loaded_at >= max_age:
+            return True
+        epoch = get_token_epoch(self.user.id or 0)
+        return epoch is not None and epoch >= int(self.loaded_at * 1000)
+
+
+class SessionStore(Protocol):
+    async def create(self, user: UserEntity) -> str:
+        """Store a session for ``user`` and return the id to put in the cookie."""
+
+    async def get(self, session_id: str) -> WebSession | None:
+        """Return the live session for ``session_id`` and extend its expiry."""
+
+    async def replace(self, session_id: str, user: UserEntity) -> None:
+        """Store a freshly loaded ``user`` in an existing session."""
+
+    async def delete(self, session_id: str) -> None:
+        """End one session."""
+
+    async def invalidate_user(self, user_id: int) -> int:
+        """End every session of ``user_id``, returning how many there were."""
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class MemorySessionStore:
+    """Process-local sessions, evicting the least recently used beyond ``max_entries``."""
+
+    def __init__(self, ttl: float, max_entries: int = 100_000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._sessions: OrderedDict[str, list[Any]] = OrderedDict()  # id -> [expires, WebSession]
+        self._by_user: Dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _discard(self, session_id: str) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        user_id = entry[1].user.id
+        sessions = self._by_user.get(user_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._by_user[user_id]
+
+    async def create(self, user: UserEntity) -> str:
+        session_id = secrets.token_urlsafe(32)
+        with self._lock:
+            self._sessions[session_id] = [time.monotonic() + self.ttl, WebSession(user, time.time())]
+            self._by_user.setdefault(user.id or 0, set()).add(session_id)
+            while len(self._sessions) > self.max_entries:
+                self._discard(next(iter(self._sessions)))
+        return session_id
+
+    async def get(self, session_id: str) -> WebSession | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                self._discard(session_id)
+                return None
+            entry[0] = now + self.ttl
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+
+    async def replace(self, session_id: str, user: UserEntity) -> None:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                entry[1] = WebSession(user, time.time())
+
+    async def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._discard(session_id)
+
+    async def invalidate_user(self, user_id: int) -> int:
+        with self._lock:
+            sessions = list(self._by_user.get(user_id, ()))
+            for session_id in sessions:
+                self._discard(session_id)
+        return len(sessions)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+def _dump_user(user: UserEntity) -> Dict[str, Any]:
+    return {
+        "id": user.id,
+        "email": str(user.email),
+        "full_name": user.full_name,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "role_levels": list(user.role_levels),
+    }
+
+
+def _load_user(data: Dict[str, Any]) -> UserEntity:
+    created_at = data.get("created_at")
+    return UserEntity(
+        id=data["id"],
+        email=Email(data["email"]),
+        full_name=data.get("full_name"),
+        is_active=data.get("is_active", True),
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+        role_levels=list(data.get("role_levels", [])),
+    )
+
+
+class DatabaseSessionStore:
+    """Sessions in the ``web_sessions`` table, shared by every worker on the database.
+
+    Only the SHA-256 digest of a session id is stored. Sliding expiry is written back
+    at most once per tenth of the TTL rather than on every page, and expired rows are
+    pruned on sign-in at most once per TTL.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._next_prune = 0.0
+
+    @staticmethod
+    def _digest(session_id: str) -> str:
+        return hashlib.sha256(session_id.encode()).hexdigest()
+
+    @asynccontextmanager
+    async def _repository(self) -> AsyncIterator[AsyncWebSessionRepository]:
+        if get_settings().database_async:
+            async with async_session_scope() as session:
+                yield AsyncWebSessionRepository(session)
+            return
+        async with contextmanager_in_threadpool(session_scope()) as session:
+            yield ThreadedRepository(WebSessionRepository(session))  # type: ignore[misc]
+
+    async def create(self, user: UserEntity) -> str:
+        session_id = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        async with self._repository() as repo:
+            if time.monotonic() >= self._next_prune:
+                self._next_prune = time.monotonic() + self.ttl
+                await repo.prune(now)
+            await repo.create(
+                self._digest(session_id),
+                user_id=user.id or 0,
+                user=_dump_user(user),
+                loaded_at=time.time(),
+                expires_at=now + timedelta(seconds=self.ttl),
+            )
+        return session_id
+
+    async def get(self, session_id: str) -> WebSession | None:
+        now = datetime.utcnow()
+        id_hash = self._digest(session_id)
+        async with self._repository() as repo:
+            record = await repo.get(id_hash, now)
+            if record is None:
+                return None
+            expires_at = now + timedelta(seconds=self.ttl)
+            if expires_at - record.expires_at >= timedelta(seconds=self.ttl / 10):
+                await repo.update(id_hash, expires_at=expires_at)
+        return WebSession(_load_user(record.user), record.loaded_at)
+
+    async def replace(self, session_id: str, user: UserEntity) -> None:
+        async with self._repository() as repo:
+            await repo.update(self._digest(session_id), user=_dump_user(user), loaded_at=time.time())
+
+    async def delete(self, session_id: str) -> None:
+        async with self._repository() as repo:
+            await repo.delete(self._digest(session_id))
+
+    async def invalidate_user(self, user_id: int) -> int:
+        async with self._repository() as repo:
+            return await repo.delete_for_user(user_id)
+
+    async def close(self) -> None:
+        return None
+
+
+def build_session_store(settings: Settings) -> SessionStore | None:
+    """Create the store configured by ``settings``, or ``None`` when SSR pages use JWT cookies."""
+
+    if settings.web_session_backend == "memory":
+        return MemorySessionStore(settings.web_session_ttl_seconds, settings.web_session_max_entries)
+    if settings.web_session_backend == "database":
+        return DatabaseSessionStore(settings.web_session_ttl_seconds)
+    return None
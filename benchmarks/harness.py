@@ -0,0 +1,150 @@
+"""Timing, statistics and JSON reporting shared by the benchmark scripts."""
+
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class Result:
+    """Summary of one benchmark; latencies are per operation, in milliseconds."""
+
+    benchmark: str
+    params: Dict[str, Any]
+    iterations: int
+    ops_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def key(self) -> str:
+        suffix = ",".join(f"{name}={value}" for name, value in sorted(self.params.items()))
+        return f"{self.benchmark}[{suffix}]" if suffix else self.benchmark
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def summarize(benchmark: str, samples: Iterable[float], elapsed: float, **params: Any) -> Result:
+    """Build a :class:`Result` from per-operation durations (seconds) and total wall time."""
+
+    ordered = sorted(samples)
+    return Result(
+        benchmark=benchmark,
+        params=params,
+        iterations=len(ordered),
+        ops_per_sec=len(ordered) / elapsed if elapsed else 0.0,
+        mean_ms=statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        p50_ms=percentile(ordered, 0.50) * 1000,
+        p99_ms=percentile(ordered, 0.99) * 1000,
+        max_ms=ordered[-1] * 1000 if ordered else 0.0,
+    )
+
+
+def time_sync(benchmark: str, func: Callable[[int], Any], iterations: int, warmup: int = 10, **params: Any) -> Result:
+    """Time ``func(i)`` for ``iterations`` calls after ``warmup`` untimed ones.
+
+    Warm-up calls get the indices after the timed ones, ``iterations`` to
+    ``iterations + warmup - 1``, so inputs picked by index are not cached before they are timed.
+    """
+
+    for index in range(iterations, iterations + warmup):
+        func(index)
+    samples: List[float] = []
+    started = time.perf_counter()
+    for index in range(iterations):
+        before = time.perf_counter()
+        func(index)
+        samples.append(time.perf_counter() - before)
+    return summarize(benchmark, samples, time.perf_counter() - started, **params)
+
+
+async def time_async(
+    benchmark: str, func: Callable[[int], Awaitable[Any]], iterations: int, warmup: int = 10, **params: Any
+) -> Result:
+    """Async counterpart of :func:`time_sync`; operations run one at a time on the current loop."""
+
+    for index in range(iterations, iterations + warmup):
+        await func(index)
+    samples: List[float] = []
+    started = time.perf_counter()
+    for index in range(iterations):
+        before = time.perf_counter()
+        await func(index)
+        samples.append(time.perf_counter() - before)
+    return summarize(benchmark, samples, time.perf_counter() - started, **params)
+
+
+def run_async(coroutine: Awaitable[Any]) -> Any:
+    return asyncio.run(coroutine)  # type: ignore[arg-type]
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def report_header(suite: str) -> Dict[str, Any]:
+    """Metadata identifying where and on which commit a report was produced."""
+
+    return {
+        "suite": suite,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def write_report(path: Path | None, suite: str, results: Sequence[Result]) -> Dict[str, Any]:
+    """Print a table and, when ``path`` is given, write the machine-readable report there."""
+
+    report = {**report_header(suite), "results": [asdict(result) for result in results]}
+    width = max((len(result.key) for result in results), default=10)
+    print(f"{'benchmark':<{width}}  {'ops/s':>12}  {'p50 ms':>9}  {'p99 ms':>9}")
+    for result in results:
+        print(f"{result.key:<{width}}  {result.ops_per_sec:>12.1f}  {result.p50_ms:>9.3f}  {result.p99_ms:>9.3f}")
+    if path is not None:
+        path.write_text(json.dumps(report, indent=2))
+    return report
+
+
+def compare(baseline_path: Path, results: Sequence[Result], tolerance: float) -> List[str]:
+    """Return the benchmarks whose p50 regressed by more than ``tolerance`` (0.10 = 10%) against a report."""
+
+    baseline = json.loads(baseline_path.read_text())
+    previous = {
+        Result(**{**entry, "params": entry.get("params", {})}).key: entry for entry in baseline.get("results", [])
+    }
+    regressions: List[str] = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None or not before["p50_ms"]:
+            continue
+        change = result.p50_ms / before["p50_ms"] - 1
+        print(f"{result.key}: p50 {before['p50_ms']:.3f} -> {result.p50_ms:.3f} ms ({change:+.1%})")
+        if change > tolerance:
+            regressions.append(f"{result.key} p50 regressed {change:+.1%}")
+    return regressions
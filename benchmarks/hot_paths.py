@@ -0,0 +1,191 @@
+"""Microbenchmarks for the auth service hot paths against seeded SQLite databases.
+
+Databases with N users (roles assigned round-robin, all sharing one precomputed
+bcrypt hash) are created once under ``benchmarks/.data`` and reused. Results are
+printed and, with ``--output``, written as JSON; ``--compare`` checks p50 against an
+earlier report and exits 1 on regressions beyond ``--tolerance``.
+
+    python benchmarks/hot_paths.py --users 1000 100000 --output bench.json
+    python benchmarks/hot_paths.py --users 1000 --compare bench.json
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List
+
+from starlette.requests import Request
+
+from harness import ROOT, Result, compare, run_async, time_async, time_sync, write_report
+
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+from app.core.config import get_settings  # noqa: E402
+from app.core.rate_limit import LoginThrottle, LoginThrottled, MemoryRateLimitBackend  # noqa: E402
+from app.core.security import create_access_token, decode_access_token  # noqa: E402
+from app.core.token_cache import get_token_cache  # noqa: E402
+from app.db.models import Role, User  # noqa: E402
+from app.db.repositories import AsyncRoleRepository, AsyncUserRepository, RoleRepository  # noqa: E402
+from app.db.session import async_session_scope, dispose_async_engine, init_db, session_scope  # noqa: E402
+from app.domain import AuthService, Email, UserEntity, UserService  # noqa: E402
+from app.domain.services import get_principal_cache, invalidate_role_catalog, load_revocation_filter  # noqa: E402
+from app.domain.services.token_revocation import is_revoked  # noqa: E402
+from app.main import ROLE_PRESETS  # noqa: E402
+from app.utils.password import hash_password, shutdown_password_hasher  # noqa: E402
+from app.web.rendering import get_templates, render_page  # noqa: E402
+
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+PASSWORD = "BenchPassword123!"
+SEED_CHUNK = 50_000
+
+
+def _email(index: int) -> str:
+    return f"user{index:07d}@bench.example.com"
+
+
+def seed_database(users: int) -> Path:
+    """Create (once) a SQLite database holding ``users`` users and point settings at it."""
+
+    DATA_DIR.mkdir(exist_ok=True)
+    path = DATA_DIR / f"users-{users}.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+    if path.exists():
+        return path
+
+    started = time.perf_counter()
+    init_db()
+    with session_scope() as session:
+        RoleRepository(session).ensure_roles(ROLE_PRESETS)
+    hashed = hash_password(PASSWORD)
+    created_at = datetime.utcnow().isoformat(sep=" ")
+    # Plain sqlite3 executemany keeps seeding a million rows to seconds rather than minutes.
+    with sqlite3.connect(path) as connection:
+        for start in range(0, users, SEED_CHUNK):
+            rows = range(start, min(users, start + SEED_CHUNK))
+            connection.executemany(
+                "INSERT INTO users (email, full_name, hashed_password, is_active, created_at) VALUES (?, ?, ?, 1, ?)",
+                ((_email(index), f"Bench User {index}", hashed, created_at) for index in rows),
+            )
+        connection.execute(
+            "INSERT INTO user_roles (user_id, role_id) "
+            "SELECT users.id, roles.id FROM users JOIN roles ON roles.level = (users.id % 5) + 1"
+        )
+    print(f"seeded {users} users into {path} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+def bench_pure(iterations: int) -> List[Result]:
+    """Benchmarks that do not touch the database."""
+
+    results = [time_sync("email_validation", lambda i: Email(_email(i)), iterations)]
+    results.append(time_sync("create_access_token", lambda i: create_access_token(str(i), role_levels=[1]), iterations))
+
+    tokens = [create_access_token(str(i), role_levels=[1]) for i in range(iterations + 10)]  # + warm-up calls
+    get_token_cache().clear()
+    results.append(time_sync("decode_access_token", lambda i: decode_access_token(tokens[i]), iterations, cached=False))
+    results.append(time_sync("decode_access_token", lambda i: decode_access_token(tokens[0]), iterations, cached=True))
+
+    model = User(id=1, email=_email(1), full_name="Bench", is_active=True, created_at=datetime.utcnow())
+    model.roles = [Role(id=1, name="Viewer", level=1), Role(id=3, name="Editor", level=3)]
+    results.append(time_sync("user_entity_from_orm", lambda i: UserEntity.from_orm(model), iterations))
+
+    throttle = LoginThrottle(MemoryRateLimitBackend(), ip_limit=1, ip_window=3600, email_limit=5, email_window=300)
+
+    async def rejected_login(_: int) -> None:
+        try:
+            await throttle.check("203.0.113.7", "victim@example.com")
+        except LoginThrottled:
+            pass
+
+    results.append(run_async(time_async("login_throttle_reject", rejected_login, iterations)))
+
+    load_revocation_filter(f"jti:{index:032x}" for index in range(10_000))
+    claims = [decode_access_token(token) for token in tokens]
+
+    class NothingRevoked:
+        async def get_many(self, keys: Any) -> dict:  # reached only on filter false positives
+            return {}
+
+    async def revocation_check(i: int) -> None:
+        await is_revoked(claims[i], NothingRevoked())  # type: ignore[arg-type]
+
+    results.append(run_async(time_async("revocation_check", revocation_check, iterations, revoked=10_000)))
+
+    request = Request({"type": "http", "method": "GET", "path": "/auth/login", "headers": [(b"accept-encoding", b"gzip")]})
+    login_page = get_templates().get_template("auth/login.html")
+    results.append(time_sync("login_page", lambda i: login_page.render(request=request), iterations, cached=False))
+    results.append(time_sync("login_page", lambda i: render_page(request, "auth/login.html"), iterations, cached=True))
+    return results
+
+
+async def bench_database(users: int, iterations: int, login_iterations: int) -> List[Result]:
+    """Service-level benchmarks; every operation uses its own session, like a request."""
+
+    rng = random.Random(users)
+    get_principal_cache().clear()  # process-wide caches must not leak between databases
+    invalidate_role_catalog()
+
+    async def with_services(call: Any) -> Any:
+        async with async_session_scope() as session:
+            user_service = UserService(AsyncUserRepository(session), AsyncRoleRepository(session))
+            return await call(user_service, AuthService(user_service))
+
+    async def authenticate(_: int) -> None:
+        email = _email(rng.randrange(users))
+        await with_services(lambda _, auth: auth.authenticate(email=email, password=PASSWORD))
+
+    async def list_users(_: int) -> None:
+        after = rng.randrange(max(users - 100, 1))
+        await with_services(lambda service, _: service.list_users(after=after, limit=100))
+
+    _, token = await with_services(lambda _, auth: auth.authenticate(email=_email(0), password=PASSWORD))
+
+    async def verify_token(_: int) -> None:
+        await with_services(lambda _, auth: auth.verify_token(token))
+
+    try:
+        return [
+            await time_async("authenticate", authenticate, login_iterations, warmup=2, users=users),
+            await time_async("verify_token", verify_token, iterations, users=users),
+            await time_async("list_users", list_users, iterations, users=users, page=100),
+        ]
+    finally:
+        await dispose_async_engine()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[1000], help="Database sizes, e.g. 1000 100000 1000000")
+    parser.add_argument("--iterations", type=int, default=2000, help="Operations per benchmark")
+    parser.add_argument("--login-iterations", type=int, default=20, help="Operations for bcrypt-bound authenticate")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON report to compare p50 latencies against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed p50 regression with --compare")
+    args = parser.parse_args()
+
+    results = bench_pure(args.iterations)
+    try:
+        for users in args.users:
+            seed_database(users)
+            results.extend(run_async(bench_database(users, args.iterations, args.login_iterations)))
+    finally:
+        shutdown_password_hasher()
+
+    write_report(args.output, "hot_paths", results)
+    if args.compare:
+        regressions = compare(args.compare, results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
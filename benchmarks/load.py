@@ -0,0 +1,306 @@
+"""Concurrent load generator for the whole ASGI application.
+
+By default the app from ``app.main.create_app()`` is driven in-process through
+httpx's ASGI transport against a fresh SQLite database, so the numbers include
+routing, middleware, dependencies and serialization but no socket overhead. With
+``--base-url`` the same scenarios run against a running server instead, e.g.
+``uvicorn app.main:app``; the accounts are then registered on that server.
+
+Every in-process request comes from the same client address, so the per-IP login
+limit would reject almost every login after the first few. In-process runs therefore
+disable login throttling (``LOGIN_IP_LIMIT=0``, ``LOGIN_EMAIL_FAILURE_LIMIT=0``)
+unless ``--throttle`` is given; start a server under test with the same settings.
+
+Each ``--concurrency`` level runs for ``--duration`` seconds with that many workers,
+each picking a scenario from the weighted ``--mix`` for every request. The report
+gives throughput, latency percentiles and error rates per level and scenario, and the
+event-loop lag seen by a probe task: lag that grows with concurrency means something
+is blocking the loop (in-process) or the client itself is saturated (``--base-url``).
+
+In-process, client and app share one event loop and each worker yields after every
+request, so "concurrency" means interleaved requests, not a real server's scheduling
+across connections and workers; use ``--base-url`` for numbers that reflect that.
+
+    python benchmarks/load.py --concurrency 1 8 32 --duration 10 --output load.json
+    python benchmarks/load.py --base-url http://127.0.0.1:8000 --mix login=1,me_bearer=10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+import httpx
+from harness import ROOT, percentile, report_header, summarize
+
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+PASSWORD = "LoadPassword123!"
+DEFAULT_MIX = "login=1,me_bearer=6,me_cookie=3,users_page=2,dashboard=2"
+LAG_INTERVAL = 0.01
+
+
+@dataclass
+class Session:
+    """Credentials for one load-test account."""
+
+    email: str
+    token: str
+
+
+@dataclass
+class Context:
+    client: httpx.AsyncClient
+    sessions: List[Session]
+    admin: Session
+    rng: random.Random
+
+
+Scenario = Callable[[Context], Awaitable[httpx.Response]]
+
+
+async def login(ctx: Context) -> httpx.Response:
+    account = ctx.rng.choice(ctx.sessions)
+    return await ctx.client.post("/api/v1/auth/login", json={"email": account.email, "password": PASSWORD})
+
+
+async def me_bearer(ctx: Context) -> httpx.Response:
+    token = ctx.rng.choice(ctx.sessions).token
+    return await ctx.client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+async def me_cookie(ctx: Context) -> httpx.Response:
+    token = ctx.rng.choice(ctx.sessions).token
+    return await ctx.client.get("/auth/profile", headers={"Cookie": f"access_token={token}"})
+
+
+async def users_page(ctx: Context) -> httpx.Response:
+    after = ctx.rng.randrange(len(ctx.sessions))
+    return await ctx.client.get(
+        "/api/v1/users/",
+        params={"limit": 50, "after": after},
+        headers={"Authorization": f"Bearer {ctx.admin.token}"},
+    )
+
+
+async def dashboard(ctx: Context) -> httpx.Response:
+    token = ctx.rng.choice(ctx.sessions).token
+    return await ctx.client.get("/auth/dashboard", headers={"Cookie": f"access_token={token}"})
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login,
+    "me_bearer": me_bearer,
+    "me_cookie": me_cookie,
+    "users_page": users_page,
+    "dashboard": dashboard,
+}
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse ``name=weight,...`` into scenario weights."""
+
+    mix: Dict[str, int] = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("the mix needs at least one scenario with a positive weight")
+    return mix
+
+
+@dataclass
+class LevelStats:
+    """Raw samples collected while running one concurrency level."""
+
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, Counter] = field(default_factory=dict)
+    lags: List[float] = field(default_factory=list)
+
+    def record(self, scenario: str, seconds: float, outcome: str | None) -> None:
+        self.latencies.setdefault(scenario, []).append(seconds)
+        if outcome is not None:
+            self.errors.setdefault(scenario, Counter())[outcome] += 1
+
+
+async def _probe_loop_lag(stats: LevelStats, stop: asyncio.Event) -> None:
+    """Sleep in short ticks and record how late each wake-up is."""
+
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        stats.lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_level(ctx: Context, mix: Dict[str, int], concurrency: int, duration: float) -> Dict[str, Any]:
+    stats = LevelStats()
+    names, weights = list(mix), list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            name = ctx.rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await SCENARIOS[name](ctx)
+                outcome = None if response.status_code < 400 else str(response.status_code)
+            except httpx.HTTPError as exc:
+                outcome = type(exc).__name__
+            stats.record(name, time.perf_counter() - started, outcome)
+            # A request served entirely from caches may never suspend; yield so that one
+            # worker cannot hold the loop until the deadline.
+            await asyncio.sleep(0)
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_loop_lag(stats, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    return summarize_level(stats, concurrency, elapsed)
+
+
+def _latency_summary(name: str, samples: Sequence[float], errors: Counter, elapsed: float) -> Dict[str, Any]:
+    result = summarize(name, samples, elapsed)
+    ordered = sorted(samples)
+    return {
+        "requests": result.iterations,
+        "requests_per_sec": round(result.ops_per_sec, 1),
+        "mean_ms": round(result.mean_ms, 3),
+        "p50_ms": round(result.p50_ms, 3),
+        "p90_ms": round(percentile(ordered, 0.90) * 1000, 3),
+        "p99_ms": round(result.p99_ms, 3),
+        "max_ms": round(result.max_ms, 3),
+        "error_rate": round(sum(errors.values()) / result.iterations, 4) if result.iterations else 0.0,
+        "errors": dict(errors),
+    }
+
+
+def summarize_level(stats: LevelStats, concurrency: int, elapsed: float) -> Dict[str, Any]:
+    everything = [sample for samples in stats.latencies.values() for sample in samples]
+    all_errors: Counter = sum(stats.errors.values(), Counter())
+    lags = sorted(stats.lags)
+    return {
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        **_latency_summary("all", everything, all_errors, elapsed),
+        "loop_lag_ms": {
+            "p50": round(percentile(lags, 0.50) * 1000, 3),
+            "p99": round(percentile(lags, 0.99) * 1000, 3),
+            "max": round(lags[-1] * 1000, 3) if lags else 0.0,
+        },
+        "scenarios": {
+            name: _latency_summary(name, samples, stats.errors.get(name, Counter()), elapsed)
+            for name, samples in sorted(stats.latencies.items())
+        },
+    }
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> Session:
+    response = await client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return Session(email=email, token=response.json()["access_token"])
+
+
+async def prepare(client: httpx.AsyncClient, accounts: int, seed: int) -> Context:
+    """Register (idempotently) and log in the load-test accounts and the administrator."""
+
+    from app.core.config import get_settings
+
+    async def account(index: int) -> Session:
+        email = f"load{index:05d}@load.example.com"
+        response = await client.post(
+            "/api/v1/auth/register", json={"email": email, "password": PASSWORD, "full_name": f"Load User {index}"}
+        )
+        if response.status_code not in (201, 400):  # 400: already registered by an earlier run
+            response.raise_for_status()
+        return await _login(client, email, PASSWORD)
+
+    sessions = list(await asyncio.gather(*(account(index) for index in range(accounts))))
+    settings = get_settings()
+    admin = await _login(client, settings.superuser_email, settings.superuser_password)
+    return Context(client=client, sessions=sessions, admin=admin, rng=random.Random(seed))
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    async with AsyncExitStack() as stack:
+        if args.base_url:
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=None))
+            base_url = args.base_url
+        else:
+            directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="auth-load-"))
+            os.environ["DATABASE_URL"] = f"sqlite:///{Path(directory) / 'load.db'}"
+            os.environ.setdefault("MIGRATE_ON_STARTUP", "true")
+            if not args.throttle:
+                os.environ.update({"LOGIN_IP_LIMIT": "0", "LOGIN_EMAIL_FAILURE_LIMIT": "0"})
+            from app.main import create_app
+
+            application = create_app()
+            # ASGITransport does not send lifespan events; run startup/shutdown around the load.
+            await stack.enter_async_context(application.router.lifespan_context(application))
+            transport = httpx.ASGITransport(app=application)  # type: ignore[arg-type]
+            base_url = "http://load.test"
+
+        client = await stack.enter_async_context(httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30))
+        ctx = await prepare(client, args.accounts, args.seed)
+        levels = []
+        for concurrency in args.concurrency:
+            level = await run_level(ctx, args.mix, concurrency, args.duration)
+            levels.append(level)
+            lag = level["loop_lag_ms"]
+            print(
+                f"c={concurrency:<4} {level['requests_per_sec']:>9.1f} req/s  p50 {level['p50_ms']:>8.2f} ms  "
+                f"p99 {level['p99_ms']:>8.2f} ms  errors {level['error_rate']:>6.2%}  loop lag p99 {lag['p99']:.2f} ms"
+            )
+        return levels
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Load a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrent workers per level")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run each concurrency level")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Weights, e.g. {DEFAULT_MIX}")
+    parser.add_argument("--accounts", type=int, default=20, help="Accounts to register and spread requests over")
+    parser.add_argument(
+        "--throttle", action="store_true", help="Keep login rate limiting on for in-process runs (off by default)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for scenario and account selection")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    try:
+        levels = asyncio.run(run(args))
+    finally:
+        if not args.base_url:
+            from app.utils.password import shutdown_password_hasher
+
+            shutdown_password_hasher()
+
+    if args.output is not None:
+        report = {
+            **report_header("load"),
+            "target": args.base_url or "in-process",
+            "mix": args.mix,
+            "levels": levels,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Start-up benchmark: import cost of ``app.main`` and ``create_app()`` wall time.
+
+Each sample runs in a fresh interpreter. Import cost comes from ``python -X importtime``
+and is reported with the slowest modules; the exit status is 1 when the best sample
+exceeds a budget or when a deferred dependency is imported eagerly.
+
+    python benchmarks/startup.py --import-budget-ms 1500 --create-app-budget-ms 250
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Heavy dependencies that must only load on first use, never while importing the app.
+DEFERRED_MODULES = ("alembic", "jose", "passlib", "jinja2")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+app.main.create_app()
+created = time.perf_counter()
+eager = sorted(name for name in {deferred!r} if name in sys.modules)
+print(json.dumps([imported - started, created - imported, eager]))
+"""
+
+
+@dataclass
+class StartupSample:
+    import_ms: float
+    create_app_ms: float
+    eager_modules: List[str]
+    slowest: List[Tuple[str, float]] = field(default_factory=list)
+
+
+def _parse_importtime(log: str, top: int) -> List[Tuple[str, float]]:
+    """Return the ``top`` modules by self time (ms) from ``-X importtime`` output."""
+
+    rows: List[Tuple[str, float]] = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|", 2)
+        rows.append((name.strip(), int(self_us) / 1000))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def run_sample(top: int, log_path: Path | None = None) -> StartupSample:
+    env = {"SECRET_KEY": "startup-benchmark", **os.environ}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(deferred=DEFERRED_MODULES)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if log_path is not None:
+        log_path.write_text(completed.stderr)
+    import_s, create_s, eager = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupSample(import_s * 1000, create_s * 1000, eager, _parse_importtime(completed.stderr, top))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-interpreter samples; the fastest is kept")
+    parser.add_argument("--import-budget-ms", type=float, default=1500.0)
+    parser.add_argument("--create-app-budget-ms", type=float, default=250.0)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to report")
+    parser.add_argument("--importtime-log", type=Path, help="Write the raw -X importtime output of the best run")
+    parser.add_argument("--json", type=Path, help="Write the result as JSON to this file")
+    args = parser.parse_args()
+
+    samples = [run_sample(args.top) for _ in range(args.runs)]
+    best = min(samples, key=lambda sample: sample.import_ms + sample.create_app_ms)
+    if args.importtime_log:
+        run_sample(args.top, args.importtime_log)
+
+    failures: List[str] = []
+    if best.import_ms > args.import_budget_ms:
+        failures.append(f"import app.main took {best.import_ms:.0f} ms (budget {args.import_budget_ms:.0f} ms)")
+    if best.create_app_ms > args.create_app_budget_ms:
+        failures.append(f"create_app() took {best.create_app_ms:.0f} ms (budget {args.create_app_budget_ms:.0f} ms)")
+    if best.eager_modules:
+        failures.append(f"deferred modules imported eagerly: {', '.join(best.eager_modules)}")
+
+    print(f"import app.main: {best.import_ms:8.1f} ms   create_app(): {best.create_app_ms:8.1f} ms")
+    print("slowest modules (self time):")
+    for name, ms in best.slowest:
+        print(f"  {ms:8.1f} ms  {name}")
+    if args.json:
+        report: Dict[str, object] = {
+            "benchmark": "startup",
+            "runs": args.runs,
+            "best": asdict(best),
+            "budgets_ms": {"import": args.import_budget_ms, "create_app": args.create_app_budget_ms},
+            "failures": failures,
+        }
+        args.json.write_text(json.dumps(report, indent=2))
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Benchmark password hashing on this host and print settings for a target verify time.
+
+Run it on the production hardware (or a host of the same type): the chosen cost is
+the largest whose hash stays within the target, e.g. 250 ms. Hashes created with a
+different cost are upgraded transparently the next time their user logs in.
+"""
+
+import argparse
+
+from app.utils.password import calibrate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Latency budget for one hash/verify")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--memory-kib", type=int, default=65536, help="argon2id memory cost to calibrate with")
+    parser.add_argument("--parallelism", type=int, default=4, help="argon2id lanes to calibrate with")
+    args = parser.parse_args()
+
+    if args.scheme == "bcrypt":
+        chosen = calibrate("bcrypt", args.target_ms / 1000)
+        print("PASSWORD_HASH_SCHEME=bcrypt")
+        print(f"BCRYPT_ROUNDS={chosen['rounds']}")
+        return
+    chosen = calibrate("argon2", args.target_ms / 1000, memory_cost_kib=args.memory_kib, parallelism=args.parallelism)
+    print("PASSWORD_HASH_SCHEME=argon2")
+    print(f"ARGON2_TIME_COST={chosen['time_cost']}")
+    print(f"ARGON2_MEMORY_COST_KIB={chosen['memory_cost_kib']}")
+    print(f"ARGON2_PARALLELISM={chosen['parallelism']}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,41 @@
+"""Generate an ES256 signing key for the JWT key ring."""
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("keys_dir", type=Path, help="Directory configured as JWT_KEYS_DIR")
+    parser.add_argument("--kid", default=datetime.utcnow().strftime("%Y%m%d%H%M%S"), help="Key id (file stem)")
+    parser.add_argument(
+        "--retire", metavar="KID", help="Replace KID's private key with its public key so it only verifies"
+    )
+    args = parser.parse_args()
+
+    args.keys_dir.mkdir(parents=True, exist_ok=True)
+    if args.retire:
+        path = args.keys_dir / f"{args.retire}.pem"
+        private_key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+        path.write_bytes(
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        )
+        print(f"Retired signing key {args.retire}")
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    path = args.keys_dir / f"{args.kid}.pem"
+    path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    path.chmod(0o600)
+    print(f"Wrote signing key {args.kid} to {path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
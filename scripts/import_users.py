@@ -0,0 +1,46 @@
+"""Bulk-import users from a CSV or NDJSON file."""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import List
+
+from app.db.repositories import AsyncRoleRepository, AsyncUserRepository
+from app.db.session import async_session_scope, dispose_async_engine
+from app.domain.services import ImportResult, UserImportService, parse_import_rows
+from app.utils.password import shutdown_password_hasher
+
+
+async def run(path: Path, fmt: str, chunk_size: int) -> List[ImportResult]:
+    try:
+        async with async_session_scope() as session:
+            service = UserImportService(AsyncUserRepository(session), AsyncRoleRepository(session))
+            return await service.import_users(parse_import_rows(path.read_text("utf-8"), fmt), chunk_size)
+    finally:
+        await dispose_async_engine()
+        shutdown_password_hasher()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="CSV (with header) or NDJSON file")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows inserted and committed per batch")
+    parser.add_argument("--report", type=Path, help="Write per-row results as NDJSON to this file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+    results = asyncio.run(run(args.path, fmt, args.chunk_size))
+    if args.report:
+        args.report.write_text("".join(json.dumps(asdict(result)) + "\n" for result in results))
+    created = sum(result.status == "created" for result in results)
+    print(f"Imported {created} of {len(results)} rows")
+    for result in results:
+        if result.status != "created" and not args.report:
+            print(f"line {result.line}: {result.email or '-'} {result.status} ({result.error})")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,4 +1,6 @@
-"""Database bootstrap utility."""
+"""Database bootstrap utility; run it once per deploy when ``MIGRATE_ON_STARTUP`` is off."""
+
+import argparse
 
 from app.core.config import get_settings
 from app.db.repositories import RoleRepository, UserRepository
@@ -15,8 +17,12 @@ ROLE_PRESETS = {
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--force", action="store_true", help="Run the Alembic upgrade even if already at head")
+    args = parser.parse_args()
+
     settings = get_settings()
-    init_db()
+    init_db(force=args.force)
     with session_scope() as session:
         role_repo = RoleRepository(session)
         user_repo = UserRepository(session)
@@ -0,0 +1,18 @@
+"""Compile the SSR templates into the Jinja bytecode cache; run it at build or deploy time.
+
+Point ``TEMPLATE_CACHE_DIR`` at the same directory the application uses so that
+workers start with every template already compiled.
+"""
+
+import argparse
+
+from app.web.rendering import precompile_templates
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__).parse_args()
+    print(f"Compiled {precompile_templates()} templates")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
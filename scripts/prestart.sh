@@ -1,4 +1,5 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-python scripts/init_db.py
\ No newline at end of file
+python scripts/init_db.py
+python scripts/precompile_templates.py
@@ -1,6 +1,11 @@
 """API integration tests for authentication flows."""
 
 from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from app.core.security import hash_refresh_token
+from app.db.models import RefreshToken, User
+from app.db.session import session_scope
 
 
 def test_register_and_login_flow(client: TestClient) -> None:
@@ -31,4 +36,144 @@ def test_login_requires_valid_credentials(client: TestClient) -> None:
         "/api/v1/auth/login",
         json={"email": "absent@example.com", "password": "invalidpass"},
     )
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+
+def test_login_stays_within_query_budget(client: TestClient, assert_max_queries) -> None:
+    payload = {"email": "single-query@example.com", "password": "Password123!"}
+    client.post("/api/v1/auth/register", json=payload)
+
+    response = client.post("/api/v1/auth/login", json=payload)
+    assert response.status_code == 200
+    assert_max_queries(response, 2)  # credentials lookup and the refresh token insert
+
+
+def test_introspect_resolves_batch(client: TestClient) -> None:
+    admin = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    token = admin.json()["access_token"]
+
+    response = client.post(
+        "/api/v1/auth/introspect",
+        json={"tokens": [token, "not-a-token", token]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["active"] for result in results] == [True, False, True]
+    assert results[0]["username"] == "owner@example.com"
+    assert results[0]["role_levels"] == [5]
+    assert results[1] == {"active": False}
+
+
+def test_login_throttles_repeated_failures_per_account(client: TestClient) -> None:
+    payload = {"email": "throttled@example.com", "password": "Password123!"}
+    client.post("/api/v1/auth/register", json=payload)
+
+    for _ in range(5):
+        response = client.post("/api/v1/auth/login", json={**payload, "password": "WrongPass123!"})
+        assert response.status_code == 401
+
+    response = client.post("/api/v1/auth/login", json=payload)
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+
+    other = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    assert other.status_code == 200
+
+
+def test_login_throttles_per_client_ip(client: TestClient) -> None:
+    client.app.state.login_throttle.ip_limit = 2  # type: ignore[attr-defined]
+    attempt = {"email": "absent@example.com", "password": "invalidpass"}
+
+    assert [client.post("/api/v1/auth/login", json=attempt).status_code for _ in range(3)] == [401, 401, 429]
+
+
+def test_refresh_rotates_and_detects_reuse(client: TestClient, assert_max_queries) -> None:
+    payload = {"email": "refresher@example.com", "password": "Password123!"}
+    client.post("/api/v1/auth/register", json=payload)
+    first = client.post("/api/v1/auth/login", json=payload).json()["refresh_token"]
+
+    response = client.post("/api/v1/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == 200
+    # token lookup, user-level revocation, user and roles (cold principal cache), claim, successor
+    assert_max_queries(response, 6)
+    second = response.json()["refresh_token"]
+    assert second != first
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {response.json()['access_token']}"})
+    assert me.json()["email"] == payload["email"]
+
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": first}).status_code == 401
+    # replaying the rotated token revoked the whole family, including its successor
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": second}).status_code == 401
+
+
+def test_revoked_refresh_token_is_rejected(client: TestClient) -> None:
+    tokens = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"}).json()
+
+    assert client.post("/api/v1/auth/revoke", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": "unknown"}).status_code == 401
+
+
+def test_logout_revokes_only_the_presented_token(client: TestClient, assert_max_queries) -> None:
+    credentials = {"email": "owner@example.com", "password": "OwnerPass123"}
+    kept = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    revoked = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+
+    assert client.post("/api/v1/auth/logout", headers={"Authorization": f"Bearer {revoked}"}).status_code == 204
+    client.cookies.clear()
+
+    assert client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {revoked}"}).status_code == 401
+    response = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {kept}"})
+    assert response.status_code == 200
+    assert_max_queries(response, 2)  # the revocation filter answers without a query
+
+
+def test_logout_everywhere_revokes_access_and_refresh_tokens(client: TestClient) -> None:
+    payload = {"email": "everywhere@example.com", "password": "Password123!"}
+    client.post("/api/v1/auth/register", json=payload)
+    first = client.post("/api/v1/auth/login", json=payload).json()
+    second = client.post("/api/v1/auth/login", json=payload).json()
+
+    response = client.post("/api/v1/auth/logout-all", headers={"Authorization": f"Bearer {first['access_token']}"})
+    assert response.status_code == 204
+    client.cookies.clear()
+
+    assert client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {second['access_token']}"}).status_code == 401
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": second["refresh_token"]}).status_code == 401
+    fresh = client.post("/api/v1/auth/login", json=payload).json()["access_token"]
+    assert client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {fresh}"}).status_code == 200
+
+
+def test_logout_everywhere_refuses_refresh_tokens_the_bulk_revoke_missed(client: TestClient) -> None:
+    payload = {"email": "racer@example.com", "password": "Password123!"}
+    client.post("/api/v1/auth/register", json=payload)
+    tokens = client.post("/api/v1/auth/login", json=payload).json()
+
+    response = client.post("/api/v1/auth/logout-all", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    assert response.status_code == 204
+    client.cookies.clear()
+    # As if the token were a successor committed by a rotation the bulk revoke did not see.
+    with session_scope() as session:
+        session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hash_refresh_token(tokens["refresh_token"]))
+            .values(revoked_at=None)
+        )
+
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    fresh = client.post("/api/v1/auth/login", json=payload).json()["refresh_token"]
+    assert client.post("/api/v1/auth/refresh", json={"refresh_token": fresh}).status_code == 200
+
+
+def test_login_rehashes_outdated_password_hash(client: TestClient) -> None:
+    from passlib.hash import bcrypt
+
+    with session_scope() as session:
+        session.add(User(email="legacy@example.com", hashed_password=bcrypt.using(rounds=4).hash("Password123!")))
+
+    response = client.post("/api/v1/auth/login", json={"email": "legacy@example.com", "password": "Password123!"})
+    assert response.status_code == 200
+    with session_scope() as session:
+        stored = session.query(User.hashed_password).filter(User.email == "legacy@example.com").scalar()
+    assert stored.startswith("$2b$12$")
@@ -0,0 +1,50 @@
+"""Asymmetric signing and JWKS endpoint tests."""
+
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.core.security import create_access_token, decode_access_token
+
+
+def _write_key(keys_dir: Path, kid: str) -> None:
+    key = ec.generate_private_key(ec.SECP256R1())
+    (keys_dir / f"{kid}.pem").write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+
+
+@pytest.fixture()
+def es256(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    _write_key(tmp_path, "2024-01")
+    settings = get_settings()
+    monkeypatch.setattr(settings, "algorithm", "ES256")
+    monkeypatch.setattr(settings, "jwt_keys_dir", str(tmp_path))
+    return tmp_path
+
+
+def test_jwks_publishes_public_keys(client: TestClient, es256: Path) -> None:
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    (key,) = response.json()["keys"]
+    assert key["kid"] == "2024-01"
+    assert key["kty"] == "EC"
+    assert "d" not in key
+
+    cached = client.get("/.well-known/jwks.json", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_rotation_keeps_old_tokens_valid(es256: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    old_token = create_access_token(subject="1")
+    _write_key(es256, "2024-02")
+    monkeypatch.setattr(get_settings(), "jwt_active_kid", "2024-02")
+
+    new_token = create_access_token(subject="2")
+    assert decode_access_token(old_token)["sub"] == "1"
+    assert decode_access_token(new_token)["sub"] == "2"
@@ -0,0 +1,21 @@
+"""Metrics endpoint tests."""
+
+from fastapi.testclient import TestClient
+
+
+def test_metrics_expose_route_and_stage_timings(client: TestClient) -> None:
+    login = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    client.get("/api/v1/users/42", headers={"Authorization": f"Bearer {login.json()['access_token']}"})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="POST",route="/api/v1/auth/login",status="200"}' in body
+    assert 'route="/api/v1/users/{user_id}"' in body
+    for stage in ("verify_password", "create_access_token", "decode_access_token"):
+        assert f'auth_stage_duration_seconds_count{{stage="{stage}"}}' in body
+    assert 'db_repository_call_duration_seconds_count{repository="user",method="get_credentials"}' in body
+    assert 'db_pool_checked_out{engine="' in body
+    assert 'cache_hits_total{cache="token"}' in body
+    assert "http_requests_in_flight 1.0" in body
@@ -32,4 +32,14 @@ def test_roles_for_low_permission_user(client: TestClient) -> None:
     token = login_response.json()["access_token"]
 
     response = client.get("/api/v1/roles/", headers={"Authorization": f"Bearer {token}"})
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+
+def test_list_roles_served_from_catalog(client: TestClient, assert_max_queries) -> None:
+    login_response = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    client.get("/api/v1/roles/", headers=headers)  # warms the principal cache
+
+    response = client.get("/api/v1/roles/", headers=headers)
+    assert [role["level"] for role in response.json()] == [1, 2, 3, 4, 5]
+    assert_max_queries(response, 0)
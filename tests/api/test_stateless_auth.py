@@ -0,0 +1,57 @@
+"""Stateless authorization mode tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.db.models import User
+from app.db.repositories import UserRepository
+from app.db.session import session_scope
+from app.domain.services import bump_token_epoch, load_revocation_filter, token_epoch
+from app.main import _active_revocation_keys
+
+
+@pytest.fixture()
+def stateless(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(get_settings(), "stateless_auth", True)
+
+
+def _login(client: TestClient, email: str, password: str) -> str:
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def test_stateless_mode_authorizes_without_queries(client: TestClient, stateless: None, assert_max_queries) -> None:
+    token = _login(client, "owner@example.com", "OwnerPass123")
+    response = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json()["role_levels"] == [5]
+    assert_max_queries(response, 0)
+
+
+def test_stateless_mode_rejects_tokens_up_to_epoch(client: TestClient, stateless: None) -> None:
+    payload = {"email": "epoch@example.com", "password": "Password123!"}
+    user_id = client.post("/api/v1/auth/register", json=payload).json()["id"]
+    token = _login(client, **payload)
+
+    bump_token_epoch(user_id)  # most likely within the second the token was issued in
+    response = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+
+
+def test_stateless_mode_shares_account_changes_between_workers(
+    client: TestClient, stateless: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = {"email": "worker@example.com", "password": "Password123!"}
+    user_id = client.post("/api/v1/auth/register", json=payload).json()["id"]
+    token = _login(client, **payload)
+
+    with session_scope() as session:
+        UserRepository(session).set_active(session.get(User, user_id), False)
+    # Another worker: it never saw the event, only what its next filter rebuild reads.
+    monkeypatch.setattr(token_epoch, "_epochs", {})
+    load_revocation_filter(_active_revocation_keys())
+
+    response = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
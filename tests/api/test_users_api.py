@@ -0,0 +1,99 @@
+"""User listing API tests."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+
+def _admin_headers(client: TestClient) -> dict[str, str]:
+    response = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_list_users_keyset_pagination(client: TestClient) -> None:
+    for index in range(3):
+        client.post("/api/v1/auth/register", json={"email": f"page{index}@example.com", "password": "Password123!"})
+    headers = _admin_headers(client)
+
+    first = client.get("/api/v1/users/", params={"limit": 2}, headers=headers)
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    assert 'rel="next"' in first.headers["link"]
+
+    after = first.json()[-1]["id"]
+    second = client.get("/api/v1/users/", params={"limit": 2, "after": after}, headers=headers)
+    assert all(user["id"] > after for user in second.json())
+
+
+def test_list_users_ndjson_stream(client: TestClient) -> None:
+    headers = _admin_headers(client)
+    paged = client.get("/api/v1/users/", params={"limit": 1000}, headers=headers).json()
+
+    response = client.get("/api/v1/users/", params={"stream": True}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    assert [user["id"] for user in streamed] == [user["id"] for user in paged]
+    assert [user["role_levels"] for user in streamed] == [user["role_levels"] for user in paged]
+
+
+def test_bulk_import_reports_each_row(client: TestClient) -> None:
+    headers = _admin_headers(client)
+    csv_body = "\n".join(
+        [
+            "email,password,full_name,role_level",
+            "bulk1@example.com,Password123!,Bulk One,2",
+            "bulk2@example.com,Password123!,,",
+            "bulk1@example.com,Password123!,Again,",
+            "owner@example.com,Password123!,Owner,",
+            "Owner@Example.com,Password123!,Owner,",
+            "not-an-email,Password123!,,",
+            "bulk3@example.com,short,,",
+            "bulk4@example.com,Password123!,,0",
+        ]
+    )
+    response = client.post(
+        "/api/v1/users/import", content=csv_body, headers={**headers, "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["created"] == 2
+    assert [row["status"] for row in report["results"]] == [
+        "created",
+        "created",
+        "duplicate",
+        "duplicate",
+        "duplicate",
+        "invalid",
+        "invalid",
+        "invalid",
+    ]
+
+    login = client.post("/api/v1/auth/login", json={"email": "bulk1@example.com", "password": "Password123!"})
+    assert login.status_code == 200
+    me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {login.json()['access_token']}"})
+    assert me.json()["role_levels"] == [2]
+
+
+def test_bulk_grant_and_revoke_role(client: TestClient) -> None:
+    ids = []
+    for index in range(3):
+        response = client.post(
+            "/api/v1/auth/register", json={"email": f"grade{index}@example.com", "password": "Password123!"}
+        )
+        ids.append(response.json()["id"])
+    headers = _admin_headers(client)
+
+    granted = client.post("/api/v1/users/roles/grant", json={"level": 3, "user_ids": ids[:2]}, headers=headers)
+    assert granted.status_code == 200, granted.text
+    assert sorted(granted.json()["changed"]) == ids[:2]
+    again = client.post("/api/v1/users/roles/grant", json={"level": 3, "user_ids": ids}, headers=headers)
+    assert again.json()["changed"] == [ids[2]]
+
+    revoked = client.post("/api/v1/users/roles/revoke", json={"level": 3, "has_level": 3}, headers=headers)
+    assert set(ids) <= set(revoked.json()["changed"])
+    users = {user["id"]: user for user in client.get("/api/v1/users/", params={"limit": 1000}, headers=headers).json()}
+    assert all(3 not in users[user_id]["role_levels"] for user_id in ids)
+
+    missing = client.post("/api/v1/users/roles/grant", json={"level": 3}, headers=headers)
+    assert missing.status_code == 422
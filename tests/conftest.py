@@ -1,10 +1,12 @@
 """Shared pytest fixtures."""
 
 import os
-from typing import Generator
+import re
+from typing import Callable, Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from app.core.config import get_settings
 
@@ -35,4 +37,23 @@ def app_instance(configure_settings):
 @pytest.fixture()
 def client(app_instance) -> Generator[TestClient, None, None]:
     with TestClient(app_instance) as client:
-        yield client
\ No newline at end of file
+        yield client
+
+
+def query_count(response: Response) -> int:
+    """Number of SQL statements the server reported for ``response`` via ``Server-Timing``."""
+
+    match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', response.headers.get("server-timing", ""))
+    assert match, f"response carries no db Server-Timing entry: {response.headers.get('server-timing')!r}"
+    return int(match.group(1))
+
+
+@pytest.fixture()
+def assert_max_queries() -> Callable[[Response, int], None]:
+    """Assert that an endpoint stayed within a SQL statement budget, e.g. ``assert_max_queries(response, 1)``."""
+
+    def check(response: Response, limit: int) -> None:
+        count = query_count(response)
+        assert count <= limit, f"{response.request.method} {response.request.url.path} ran {count} queries (max {limit})"
+
+    return check
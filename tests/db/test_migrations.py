@@ -0,0 +1,19 @@
+"""Startup migration and seeding tests."""
+
+from fastapi.testclient import TestClient
+
+from app.db.models import Role
+from app.db.repositories import RoleRepository
+from app.db.session import get_current_revisions, get_head_revisions, init_db, session_scope
+from app.main import ROLE_PRESETS
+
+
+def test_init_db_skips_upgrade_at_head(client: TestClient) -> None:
+    assert get_current_revisions() == get_head_revisions() != frozenset()
+    assert init_db() is False
+
+
+def test_ensure_roles_is_idempotent(client: TestClient) -> None:
+    with session_scope() as session:
+        RoleRepository(session).ensure_roles(ROLE_PRESETS)
+        assert session.query(Role).count() == len(ROLE_PRESETS)
@@ -0,0 +1,23 @@
+"""Engine configuration tests."""
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.session import get_engine
+
+
+def test_engine_is_reused_and_sqlite_is_tuned(configure_settings) -> None:
+    engine = get_engine()
+    assert get_engine() is engine
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_slow_statements_are_logged_with_route(client, monkeypatch, caplog) -> None:
+    monkeypatch.setattr(get_settings(), "slow_query_ms", 0.000001)
+    with caplog.at_level("WARNING", logger="app.db.slow_query"):
+        response = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"})
+    assert response.status_code == 200
+    assert any("/api/v1/auth/login" in record.getMessage() for record in caplog.records)
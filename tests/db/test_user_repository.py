@@ -0,0 +1,35 @@
+"""Statement-level tests for the user repository."""
+
+from sqlalchemy.dialects import mysql
+
+from app.db.repositories.user_repository import (
+    _holding_query,
+    _link_statement,
+    _missing_query,
+    _targets_query,
+    _unlink_statement,
+)
+from app.domain.entities import RoleEntity
+
+
+def test_bulk_revoke_delete_is_valid_on_mysql() -> None:
+    role = RoleEntity(id=3, name="Editor", level=3)
+    holding = str(_holding_query(_targets_query(None, has_level=3), role).compile(dialect=mysql.dialect()))
+    assert "user_roles" in holding
+
+    unlink = str(_unlink_statement(role, [1, 2]).compile(dialect=mysql.dialect()))
+    # MySQL rejects a DELETE that reads its own table in a subquery (error 1093).
+    assert unlink.startswith("DELETE FROM user_roles")
+    assert "SELECT" not in unlink
+
+
+def test_bulk_grant_links_only_the_ids_it_read() -> None:
+    role = RoleEntity(id=3, name="Editor", level=3)
+    missing = str(_missing_query(_targets_query(None, has_level=1), role).compile(dialect=mysql.dialect()))
+    assert "roles.level" in missing
+
+    link = str(_link_statement(role, [1, 2]).compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+    # The INSERT must not re-evaluate the target criteria, or users matching them since the
+    # read would be linked without being reported.
+    assert link.startswith("INSERT INTO user_roles")
+    assert "IN (1, 2)" in link and "roles.level" not in link
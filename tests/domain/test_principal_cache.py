@@ -0,0 +1,54 @@
+"""Unit tests for the principal cache and its invalidation."""
+
+from datetime import datetime
+
+from app.core.cache import TTLCache
+from app.domain.entities import UserEntity
+from app.domain.services.principal_cache import get_principal_cache
+from app.domain.value_objects import Email
+from app.events import (
+    PermissionBatchEvent,
+    PermissionEvent,
+    UserChangedEvent,
+    publish_permission_batch,
+    publish_permission_granted,
+    publish_user_changed,
+)
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[int, str] = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+    assert cache.get(2) is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 1, 2)
+
+
+def test_ttl_cache_skips_stale_generation() -> None:
+    cache: TTLCache[int, str] = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation
+    cache.pop(1)
+    cache.set(1, "stale", generation=generation)
+    assert cache.get(1) is None
+    cache.set(1, "expired", ttl=0)
+    assert cache.get(1) is None
+
+
+def test_events_invalidate_cached_principal() -> None:
+    cache = get_principal_cache()
+    entity = UserEntity(id=42, email=Email("cached@example.com"), role_levels=[1])
+    cache.set(42, entity)
+    publish_permission_granted(PermissionEvent(user_id=42, role_level=3, timestamp=datetime.utcnow()))
+    assert cache.get(42) is None
+
+    cache.set(42, entity)
+    publish_user_changed(UserChangedEvent(user_id=42, reason="deactivated"))
+    assert cache.get(42) is None
+
+    cache.set(42, entity)
+    cache.set(43, entity)
+    publish_permission_batch(PermissionBatchEvent(user_ids=(42, 43), role_level=3, granted=False))
+    assert cache.get(42) is None and cache.get(43) is None
@@ -0,0 +1,22 @@
+"""Unit tests for the role catalog snapshot."""
+
+import pytest
+
+from app.domain.entities import RoleEntity
+from app.domain.services import get_role_catalog, load_role_catalog
+from app.events import RolesChangedEvent, publish_roles_changed
+
+
+def test_catalog_indexes_roles_and_is_immutable() -> None:
+    catalog = load_role_catalog([RoleEntity(id=2, name="Editor", level=3), RoleEntity(id=1, name="Viewer", level=1)])
+    assert [role.level for role in catalog.list_roles()] == [1, 3]
+    assert catalog.get_by_level(3) == catalog.get_by_name("Editor") == catalog.get(2)
+    assert catalog.get_by_level(5) is None
+    with pytest.raises(TypeError):
+        catalog._by_level[5] = RoleEntity(id=5, name="Administrator", level=5)  # type: ignore[index]
+
+
+def test_roles_changed_event_drops_snapshot() -> None:
+    load_role_catalog([RoleEntity(id=1, name="Viewer", level=1)])
+    publish_roles_changed(RolesChangedEvent(levels=(2,)))
+    assert get_role_catalog() is None
@@ -0,0 +1,47 @@
+"""Unit tests for access-token revocation checks."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable
+
+from app.db.repositories import RevocationRecord
+from app.domain.services.token_revocation import is_revoked, load_revocation_filter, user_revoked_since
+
+
+class StaticRevocations:
+    def __init__(self, *records: RevocationRecord) -> None:
+        self.records = {record.key: record for record in records}
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, RevocationRecord]:
+        return {key: self.records[key] for key in keys if key in self.records}
+
+
+REVOKED_AT = datetime(2024, 10, 21, 12, 0, 0, 700_000)
+REVOKED_MS = int(REVOKED_AT.replace(tzinfo=timezone.utc).timestamp() * 1000)
+SECOND = REVOKED_MS // 1000
+
+
+def test_logout_everywhere_covers_tokens_issued_earlier_in_the_same_second() -> None:
+    repo = StaticRevocations(RevocationRecord("user:7", revoked_at=REVOKED_AT, expires_at=datetime.max))
+    load_revocation_filter(["user:7"])
+
+    def check(claims: dict) -> bool:
+        return asyncio.run(is_revoked(claims, repo))  # type: ignore[arg-type]
+
+    assert check({"sub": "7", "iat": SECOND, "iat_ms": REVOKED_MS - 1}) is True
+    assert check({"sub": "7", "iat": SECOND, "iat_ms": REVOKED_MS}) is True
+    assert check({"sub": "7", "iat": SECOND, "iat_ms": REVOKED_MS + 1}) is False
+    assert check({"sub": "7", "iat": SECOND}) is True  # no iat_ms: the start of its second
+    assert check({"sub": "7", "iat": SECOND + 1}) is False
+    assert check({"sub": "8", "iat": SECOND, "iat_ms": REVOKED_MS - 1}) is False
+
+
+def test_user_revoked_since_compares_with_the_stored_entry() -> None:
+    repo = StaticRevocations(RevocationRecord("user:7", revoked_at=REVOKED_AT, expires_at=datetime.max))
+
+    def check(user_id: int, moment: datetime) -> bool:
+        return asyncio.run(user_revoked_since(user_id, moment, repo))  # type: ignore[arg-type]
+
+    assert check(7, REVOKED_AT - timedelta(milliseconds=1)) is True
+    assert check(7, REVOKED_AT + timedelta(milliseconds=1)) is False
+    assert check(8, REVOKED_AT - timedelta(milliseconds=1)) is False
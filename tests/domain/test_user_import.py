@@ -0,0 +1,63 @@
+"""Unit tests for bulk user import."""
+
+import asyncio
+from typing import Any, Iterable, List, Mapping, Sequence
+
+from app.domain.entities import RoleEntity
+from app.domain.services import (
+    ImportResult,
+    ImportRow,
+    UserImportService,
+    invalidate_role_catalog,
+    load_role_catalog,
+    parse_import_rows,
+)
+
+
+class RacingUserRepo:
+    """Reports no existing emails until a "concurrent" registration makes the first insert fail."""
+
+    def __init__(self) -> None:
+        self.registered: set[str] = set()
+        self.inserted: List[str] = []
+
+    async def existing_emails(self, emails: Iterable[str]) -> set[str]:
+        return set(emails) & self.registered
+
+    async def bulk_create(self, users: Sequence[Mapping[str, Any]]) -> bool:
+        if not self.registered:
+            self.registered.add("taken@example.com")
+            return False
+        self.inserted.extend(user["email"] for user in users)
+        return True
+
+
+def test_import_retries_a_chunk_that_lost_a_registration_race() -> None:
+    load_role_catalog([RoleEntity(id=1, name="Viewer", level=1)])
+    repo = RacingUserRepo()
+    rows = parse_import_rows("email,password\ntaken@example.com,Password123!\nnew@example.com,Password123!\n", "csv")
+
+    try:
+        results = asyncio.run(UserImportService(repo, None).import_users(rows))  # type: ignore[arg-type]
+    finally:
+        invalidate_role_catalog()
+    assert [result.status for result in results] == ["duplicate", "created"]
+    assert repo.inserted == ["new@example.com"]
+
+
+def test_non_scalar_fields_are_reported_invalid() -> None:
+    (result,) = parse_import_rows('{"email": "a@example.com", "password": "Password123!", "role_level": [1]}', "ndjson")
+    assert isinstance(result, ImportResult) and result.status == "invalid"
+
+
+def test_role_level_defaults_only_when_missing() -> None:
+    rows = parse_import_rows(
+        '{"email": "a@example.com", "password": "Password123!"}\n'
+        '{"email": "b@example.com", "password": "Password123!", "role_level": 0}\n'
+        '{"email": "c@example.com", "password": "Password123!", "role_level": ""}\n',
+        "ndjson",
+    )
+    missing, zero, empty = rows
+    assert isinstance(missing, ImportRow) and missing.role_level == 1
+    assert isinstance(zero, ImportRow) and zero.role_level == 0  # rejected later as an unknown level
+    assert isinstance(empty, ImportResult) and empty.status == "invalid"
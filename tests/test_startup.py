@@ -0,0 +1,19 @@
+"""Guards on what importing the application pulls in."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+DEFERRED_MODULES = ("alembic", "jose", "passlib", "jinja2")
+
+
+def test_heavy_dependencies_are_imported_lazily() -> None:
+    probe = f"import sys, app.main; print(sorted(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "[]"
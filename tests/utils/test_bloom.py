@@ -0,0 +1,13 @@
+"""Tests for the Bloom filter behind token revocation."""
+
+from app.core.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f"jti:{index}")
+
+    assert all(f"jti:{index}" in bloom for index in range(1000))
+    false_positives = sum(f"user:{index}" in bloom for index in range(10_000))
+    assert false_positives < 300
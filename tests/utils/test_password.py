@@ -0,0 +1,83 @@
+"""Tests for the password hashing pool."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.utils import password
+from app.utils.password import (
+    HASH_BATCH_SIZE,
+    PasswordHasher,
+    PasswordHashingBusy,
+    calibrate,
+    hash_password,
+    hash_passwords_async,
+    verify_and_update_password,
+    verify_password,
+)
+
+
+def test_hasher_rejects_when_saturated() -> None:
+    hasher = PasswordHasher(workers=0, queue_size=0)
+
+    async def scenario() -> None:
+        running = asyncio.ensure_future(hasher.run(time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHashingBusy):
+            await hasher.run(time.sleep, 0)
+        await running
+        await hasher.run(time.sleep, 0)
+
+    asyncio.run(scenario())
+
+
+def test_hasher_runs_in_process_pool() -> None:
+    hasher = PasswordHasher(workers=1, queue_size=1)
+
+    async def scenario() -> bool:
+        hashed = await hasher.run(hash_password, "Password123!")
+        return await hasher.run(verify_password, "Password123!", hashed)
+
+    try:
+        assert asyncio.run(scenario()) is True
+    finally:
+        hasher.shutdown()
+
+
+def test_outdated_hash_is_upgraded_on_verify() -> None:
+    from passlib.hash import bcrypt
+
+    outdated = bcrypt.using(rounds=4).hash("Password123!")
+
+    assert verify_and_update_password("WrongPassword1!", outdated) == (False, None)
+    verified, upgraded = verify_and_update_password("Password123!", outdated)
+    assert verified and upgraded is not None and upgraded.startswith("$2b$12$")
+    assert verify_and_update_password("Password123!", upgraded) == (True, None)
+
+
+def test_calibration_respects_the_target() -> None:
+    assert calibrate("bcrypt", target_seconds=0) == {"rounds": 4}
+
+
+def test_bulk_hashing_leaves_room_for_logins(monkeypatch: pytest.MonkeyPatch) -> None:
+    hasher = PasswordHasher(workers=3, queue_size=4)
+    jobs: list[int] = []
+    in_flight = peak = 0
+
+    async def run(func, batch):  # type: ignore[no-untyped-def]
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        jobs.append(len(batch))
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [f"hashed:{password}" for password in batch]
+
+    monkeypatch.setattr(hasher, "run", run)
+    monkeypatch.setattr(password, "_hasher", hasher)
+    passwords = [f"Password{index}!" for index in range(50)]
+
+    assert asyncio.run(hash_passwords_async(passwords)) == [f"hashed:{value}" for value in passwords]
+    assert max(jobs) <= HASH_BATCH_SIZE and sum(jobs) == 50
+    assert peak == 2  # one of the three workers stays free for logins
@@ -0,0 +1,34 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+
+from app.core.rate_limit import MemoryRateLimitBackend
+
+
+def test_memory_backend_refills_over_the_window() -> None:
+    backend = MemoryRateLimitBackend()
+
+    async def scenario() -> list[float]:
+        results = [await backend.hit("key", limit=2, window=0.2) for _ in range(3)]
+        await asyncio.sleep(0.12)
+        results.append(await backend.hit("key", limit=2, window=0.2))
+        return results
+
+    first, second, rejected, refilled = asyncio.run(scenario())
+    assert first == second == 0.0
+    assert 0 < rejected <= 0.1
+    assert refilled == 0.0
+
+
+def test_memory_backend_check_does_not_consume_and_evicts_oldest() -> None:
+    backend = MemoryRateLimitBackend(max_keys=2)
+
+    async def scenario() -> None:
+        assert await backend.hit("a", limit=1, window=60, cost=0) == 0.0
+        assert await backend.hit("a", limit=1, window=60) == 0.0
+        assert await backend.hit("a", limit=1, window=60, cost=0) > 0
+        await backend.hit("b", limit=1, window=60)
+        await backend.hit("c", limit=1, window=60)
+        assert await backend.hit("a", limit=1, window=60) == 0.0  # evicted, so a fresh bucket
+
+    asyncio.run(scenario())
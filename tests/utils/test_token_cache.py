@@ -0,0 +1,26 @@
+"""Tests for the decoded-token cache."""
+
+import pytest
+
+from app.core.security import create_access_token, decode_access_token
+from app.core.token_cache import get_token_cache
+from app.utils.jwt import decode as decode_jwt
+
+
+def test_repeated_decodes_hit_cache() -> None:
+    token = create_access_token(subject="7", role_levels=[2])
+    before = get_token_cache().stats()
+
+    assert decode_access_token(token)["sub"] == "7"
+    assert decode_jwt(token)["role_levels"] == [2]
+
+    after = get_token_cache().stats()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 1
+
+
+def test_tampered_token_is_rejected() -> None:
+    token = create_access_token(subject="7")
+    decode_access_token(token)
+    with pytest.raises(ValueError):
+        decode_access_token(token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1])
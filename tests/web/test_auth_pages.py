@@ -12,4 +12,78 @@ def test_login_page_renders(client: TestClient) -> None:
 def test_register_page_renders(client: TestClient) -> None:
     response = client.get("/auth/register")
     assert response.status_code == 200
-    assert "회원가입" in response.text
\ No newline at end of file
+    assert "회원가입" in response.text
+
+
+def test_anonymous_pages_are_cached_with_etag_and_gzip(client: TestClient) -> None:
+    first = client.get("/auth/login", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert "로그인" in first.text
+
+    revalidated = client.get("/auth/login", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    plain = client.get("/auth/login", headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers and plain.headers["etag"] != first.headers["etag"]
+
+    refused = client.get("/auth/login", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in refused.headers
+
+
+def test_dashboard_renews_session_from_refresh_cookie(client: TestClient) -> None:
+    tokens = client.post("/api/v1/auth/login", json={"email": "owner@example.com", "password": "OwnerPass123"}).json()
+    client.cookies.clear()
+
+    response = client.get("/auth/dashboard", headers={"Cookie": f"refresh_token={tokens['refresh_token']}"})
+    assert response.status_code == 200
+    renewed = response.cookies
+    assert renewed.get("access_token") and renewed.get("refresh_token") != tokens["refresh_token"]
+
+
+def _sign_in(client: TestClient, email: str, password: str) -> None:
+    response = client.post("/auth/login", data={"email": email, "password": password}, follow_redirects=False)
+    assert response.status_code == 303
+    assert response.cookies.get("session_id") and not response.cookies.get("access_token")
+
+
+def test_server_side_session_renders_pages_without_queries(app_instance, assert_max_queries) -> None:
+    from app.web.sessions import MemorySessionStore
+
+    app_instance.state.session_store = MemorySessionStore(ttl=600)
+    with TestClient(app_instance) as client:
+        _sign_in(client, "owner@example.com", "OwnerPass123")
+        response = client.get("/auth/dashboard")
+        assert response.status_code == 200
+        assert_max_queries(response, 0)
+
+
+def test_database_session_store_renders_pages_with_one_lookup(app_instance, assert_max_queries) -> None:
+    from app.web.sessions import DatabaseSessionStore
+
+    app_instance.state.session_store = DatabaseSessionStore(ttl=600)
+    with TestClient(app_instance) as client:
+        _sign_in(client, "owner@example.com", "OwnerPass123")
+        response = client.get("/auth/profile")
+        assert response.status_code == 200
+        assert_max_queries(response, 1)
+        client.get("/auth/logout")
+        assert client.get("/auth/profile", follow_redirects=False).status_code == 303
+
+
+def test_logout_everywhere_ends_server_side_sessions(app_instance) -> None:
+    from app.web.sessions import MemorySessionStore
+
+    store = MemorySessionStore(ttl=600)
+    app_instance.state.session_store = store
+    payload = {"email": "sessions@example.com", "password": "Password123!"}
+    with TestClient(app_instance) as client:
+        client.post("/api/v1/auth/register", json=payload)
+        _sign_in(client, **payload)
+        token = client.post("/api/v1/auth/login", json=payload).json()["access_token"]
+        assert len(store) == 1
+
+        client.post("/api/v1/auth/logout-all", headers={"Authorization": f"Bearer {token}"})
+        assert len(store) == 0
+        assert client.get("/auth/dashboard", follow_redirects=False).status_code == 303